@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""Benchmarks concurrent DBStorage.all() against sequential queries.
+
+Usage: python3 -m benchmarks.db_storage_all [<objects per class> [<ms>]]
+
+Fills a temporary SQLite database standing in for MySQL, with an optional
+delay added to every statement to stand in for a network round-trip, then
+compares all() with the queries of each class run one after another and
+run concurrently over pooled connections. Concurrent queries save five
+round-trips but add each object to the working session afterwards, so
+they win on slow links and moderate tables.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from time import sleep
+from models.amenity import Amenity
+from models.base_model import Base
+from models.city import City
+from models.engine.db_storage import DBStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+
+def fill(storage, count):
+    """Add count objects of each class to storage."""
+    for i in range(count):
+        user = User(email="{}@hbnb.io".format(i), password="pwd")
+        state = State(name="state {}".format(i))
+        city = City(name="city {}".format(i), state_id=state.id)
+        place = Place(name="place {}".format(i), city_id=city.id,
+                      user_id=user.id)
+        review = Review(text="review {}".format(i), place_id=place.id,
+                        user_id=user.id)
+        for obj in (user, state, city, place, review,
+                    Amenity(name="amenity {}".format(i))):
+            storage.new(obj)
+    storage.save()
+
+
+def measure(storage, sequential, rounds=5):
+    """Return the best time in seconds of rounds calls to all()."""
+    best = None
+    for _ in range(rounds):
+        session = sessionmaker(bind=storage._DBStorage__engine)()
+        storage._DBStorage__session = session
+        storage._DBStorage__parallel = not sequential
+        start = perf_counter()
+        objs = storage.all()
+        elapsed = perf_counter() - start
+        session.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(objs)
+
+
+def main(count, delay):
+    """Run the benchmark with count objects per class."""
+    path = os.path.join(tempfile.mkdtemp(), "hbnb.db")
+    engine = create_engine("sqlite:///" + path, poolclass=QueuePool,
+                           connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def round_trip(*args):
+        """Wait as long as a network round-trip would."""
+        sleep(delay / 1000)
+
+    Base.metadata.create_all(engine)
+    storage = DBStorage.__new__(DBStorage)
+    storage._DBStorage__engine = engine
+    storage._DBStorage__session = sessionmaker(bind=engine)()
+    fill(storage, count)
+    print("{} objects per class, {} ms per statement".format(count, delay))
+    print("{:>12} {:>12} {:>12}".format("mode", "objects", "all() ms"))
+    for name, sequential in (("sequential", True), ("concurrent", False)):
+        elapsed, total = measure(storage, sequential)
+        print("{:>12} {:>12} {:>12.1f}".format(name, total, elapsed * 1e3))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 2)
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""Benchmarks the DBStorage object cache against querying every request.
+
+Usage: python3 -m benchmarks.db_storage_cache [<states> [<ms>]]
+
+Fills a temporary SQLite database standing in for MySQL, with an optional
+delay added to every statement to stand in for a network round-trip, then
+serves 200 requests that each open a session, list the States and get one
+State by id, as the Flask views do, with the cache off and on.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from time import sleep
+from models.base_model import Base
+from models.engine.db_storage import DBStorage
+from models.engine.object_cache import ObjectCache
+from models.state import State
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+
+def main(count, delay):
+    """Run the benchmark with count states."""
+    path = os.path.join(tempfile.mkdtemp(), "hbnb.db")
+    engine = create_engine("sqlite:///" + path)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def round_trip(*args):
+        """Wait as long as a network round-trip would."""
+        sleep(delay / 1000)
+
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    storage = DBStorage.__new__(DBStorage)
+    storage._DBStorage__engine = engine
+    storage._DBStorage__session = Session()
+    states = [State(name="state {}".format(i)) for i in range(count)]
+    for state in states:
+        storage.new(state)
+    storage.save()
+    print("{} states, {} ms per statement".format(count, delay))
+    print("{:>12} {:>12} {:>12} {:>12}".format("cache", "requests",
+                                               "request ms", "hit rate"))
+    for size in (0, 1000):
+        DBStorage._DBStorage__cache = ObjectCache(size, 60)
+        start = perf_counter()
+        for i in range(200):
+            storage._DBStorage__session = Session()
+            storage.all(State)
+            storage.get(State, states[i % count].id)
+            storage.close()
+        elapsed = perf_counter() - start
+        info = storage.cache_info()
+        lookups = info["hits"] + info["misses"]
+        print("{:>12} {:>12} {:>12.2f} {:>12.2f}".format(
+            size, 200, elapsed / 200 * 1e3,
+            info["hits"] / lookups if lookups else 0))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 1)
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+"""Benchmarks FileStorage.all(cls) against a growing number of Reviews.
+
+Usage: python3 -m benchmarks.file_storage_all
+
+Fills an in-memory FileStorage with a fixed number of States and an
+increasing number of Reviews, then times all(State) and count(State).
+Both should stay flat as the number of Reviews grows.
+"""
+from timeit import timeit
+from models.engine.file_storage import FileStorage
+from models.review import Review
+from models.state import State
+
+STATES = 200
+REVIEWS = (0, 10000, 100000, 300000)
+RUNS = 100
+
+
+def main():
+    """Run the benchmark and print one line per store size."""
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(STATES):
+        storage.new(State(name="State_{}".format(i)))
+    print("{:>10} {:>16} {:>16}".format("reviews", "all(State) us",
+                                        "count(State) us"))
+    total = 0
+    for size in REVIEWS:
+        for i in range(size - total):
+            storage.new(Review(text="review"))
+        total = size
+        t_all = timeit(lambda: storage.all(State), number=RUNS)
+        t_count = timeit(lambda: storage.count(State), number=RUNS)
+        print("{:>10} {:>16.1f} {:>16.1f}".format(
+            size, t_all / RUNS * 1e6, t_count / RUNS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+"""Benchmarks background FileStorage saves against synchronous ones.
+
+Usage: python3 -m benchmarks.file_storage_async [<number of objects>]
+
+Updates one object of a store of Reviews and saves it 100 times in a row,
+then compares the latency of save() and the total time until the last
+save is on disk, with and without the background writer.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models.engine.file_storage import FileStorage
+from models.review import Review
+
+
+def main(count):
+    """Run the benchmark on a store of count objects."""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Review(text="review " * 20, place_id=str(i)))
+    review = Review(text="")
+    storage.new(review)
+    storage.save()
+    print("{} objects".format(count))
+    print("{:>12} {:>12} {:>12} {:>12}".format("mode", "saves",
+                                               "max save ms", "total ms"))
+    for name, mode in (("sync", False), ("async", True)):
+        FileStorage._FileStorage__async = mode
+        latency = 0
+        start = perf_counter()
+        for i in range(100):
+            review.text = "edit {}".format(i)
+            begin = perf_counter()
+            storage.save()
+            latency = max(latency, perf_counter() - begin)
+        storage.flush()
+        total = perf_counter() - start
+        print("{:>12} {:>12} {:>12.2f} {:>12.1f}".format(
+            name, 100, latency * 1e3, total * 1e3))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""Benchmarks FileStorage.bulk_new() against saving objects one by one.
+
+Usage: python3 -m benchmarks.file_storage_bulk [<number of objects>]
+
+Writes a JSON Lines file of Reviews, then loads it into an empty store
+once with BaseModel.save() per object, as seeding scripts used to, and
+once with the importer, which saves once through bulk_new().
+"""
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models import storage
+from models.engine import importer
+from models.engine.file_storage import FileStorage
+from models.review import Review
+
+
+def main(count):
+    """Run the benchmark on count objects."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "reviews.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            review = Review(text="review " * 20, place_id=str(i))
+            f.write(json.dumps(review.to_dict()) + "\n")
+    print("{} objects".format(count))
+    print("{:>12} {:>12} {:>12}".format("mode", "total ms", "objects/s"))
+    for name in ("save", "bulk_new"):
+        FileStorage._FileStorage__file_path = os.path.join(
+            directory, name + ".json")
+        FileStorage._FileStorage__objects = {}
+        start = perf_counter()
+        if name == "save":
+            for obj in importer.objects(Review, path):
+                obj.save()
+        else:
+            storage.bulk_new(importer.objects(Review, path))
+        total = perf_counter() - start
+        print("{:>12} {:>12.1f} {:>12.0f}".format(
+            name, total * 1e3, count / total))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
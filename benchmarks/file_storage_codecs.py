@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Benchmarks the snapshot formats of FileStorage.
+
+Usage: python3 -m benchmarks.file_storage_codecs [<number of objects>]
+
+Saves and reloads the same store of Places and Reviews with every
+format, and prints the save and reload throughput and the file size.
+Saves are timed with every object dirty, as on a first save. The codec
+columns time encoding and decoding alone, without the models.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models.engine.codecs import codecs
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+
+
+def main(count):
+    """Run the benchmark on a store of count objects."""
+    directory = tempfile.mkdtemp()
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(count // 2):
+        storage.new(Place(name="Place_{}".format(i), number_rooms=i % 5,
+                          latitude=37.77, description="A nice place"))
+        storage.new(Review(text="Great stay", place_id=str(i)))
+    objects = FileStorage._FileStorage__objects
+    records = [(k, o.to_dict()) for k, o in objects.items()]
+    print("{:>8} {:>12} {:>12} {:>12} {:>12} {:>8}".format(
+        "format", "save obj/s", "reload obj/s", "encode obj/s",
+        "decode obj/s", "size MB"))
+    for name, codec in codecs.items():
+        path = os.path.join(directory, "file" + codec.extension)
+        FileStorage._FileStorage__codec = codec
+        FileStorage._FileStorage__file_path = path
+        FileStorage._FileStorage__objects = objects
+        for obj in objects.values():
+            obj.__dict__["_dirty"] = True
+        start = perf_counter()
+        storage.save()
+        save = perf_counter() - start
+        FileStorage._FileStorage__objects = {}
+        start = perf_counter()
+        storage.reload()
+        load = perf_counter() - start
+        size = os.path.getsize(path)
+        start = perf_counter()
+        with codec.open(path, "w") as f:
+            codec.dump(f, ((k, codec.encode(d)) for k, d in records))
+        encode = perf_counter() - start
+        start = perf_counter()
+        with codec.open(path, "r") as f:
+            for record in codec.load(f):
+                pass
+        decode = perf_counter() - start
+        print("{:>8} {:>12.0f} {:>12.0f} {:>12.0f} {:>12.0f} {:>8.2f}".format(
+            name, count / save, count / load, count / encode,
+            count / decode, size / 1e6))
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Benchmarks indexed FileStorage snapshots against lazy reloading.
+
+Usage: python3 -m benchmarks.file_storage_index [<number of objects>]
+
+Saves a store of Reviews with its index to a temporary file, then compares
+the time to reload it, the time of random point lookups and the peak
+memory of the lazy reloader and of the memory-mapped index.
+"""
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from models.engine.file_storage import FileStorage
+from models.review import Review
+
+
+def measure(storage, ids):
+    """Return (reload seconds, seconds per get, reload peak bytes)."""
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__pending = {}
+    tracemalloc.start()
+    start = perf_counter()
+    storage.reload()
+    loaded = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = perf_counter()
+    for id in ids:
+        storage.get(Review, id)
+    lookup = (perf_counter() - start) / len(ids)
+    return loaded, lookup, peak
+
+
+def main(count):
+    """Run the benchmark on a store of count objects."""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__mapped = True
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Review(text="review " * 20, place_id=str(i)))
+    ids = [k.partition(".")[2] for k in
+           random.sample(list(storage.all()), min(count, 1000))]
+    storage.save()
+    print("{} objects, {:.1f} MB".format(count, os.path.getsize(path) / 1e6))
+    print("{:>12} {:>12} {:>12} {:>12}".format("mode", "reload ms",
+                                               "get us", "peak MB"))
+    FileStorage._FileStorage__lazy = True
+    for name, mapped in (("lazy", False), ("index", True)):
+        FileStorage._FileStorage__mapped = mapped
+        FileStorage._FileStorage__signature = None
+        loaded, lookup, peak = measure(storage, ids)
+        print("{:>12} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+            name, loaded * 1e3, lookup * 1e6, peak / 1e6))
+    FileStorage._FileStorage__store.close()
+    os.remove(path)
+    os.remove(path + ".idx")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
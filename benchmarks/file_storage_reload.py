@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""Benchmarks FileStorage.reload() against a plain json.load().
+
+Usage: python3 -m benchmarks.file_storage_reload [<number of objects>]
+
+Saves a store of Reviews to a temporary file, then compares the time to
+the first record and the peak memory of json.load() and of the streaming
+reader used by reload().
+"""
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from models.engine.file_storage import FileStorage
+from models.engine.json_stream import iter_items
+from models.review import Review
+
+
+def measure(load, path):
+    """Return (seconds to first record, seconds, peak bytes) of load."""
+    tracemalloc.start()
+    start = perf_counter()
+    first = None
+    with open(path, "r", encoding="utf-8") as f:
+        for _ in load(f):
+            if first is None:
+                first = perf_counter() - start
+    total = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main(count):
+    """Run the benchmark on a store of count objects."""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Review(text="review " * 20, place_id=str(i)))
+    storage.save()
+    FileStorage._FileStorage__objects = {}
+    print("{} objects, {:.1f} MB".format(count, os.path.getsize(path) / 1e6))
+    print("{:>12} {:>12} {:>12} {:>12}".format("reader", "first ms",
+                                               "total ms", "peak MB"))
+    for name, load in (("json.load", lambda f: json.load(f).items()),
+                       ("iter_items", iter_items)):
+        first, total, peak = measure(load, path)
+        print("{:>12} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+            name, first * 1e3, total * 1e3, peak / 1e6))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
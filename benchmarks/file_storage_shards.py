@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""Benchmarks sharded FileStorage snapshots against a single file.
+
+Usage: python3 -m benchmarks.file_storage_shards [<number of objects>]
+
+Saves a store of Reviews, Users and States in each layout, then compares
+the time to save after creating one State and the time to reload the
+States of a lazy store.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models.engine.file_storage import FileStorage
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+def measure(storage, sharded):
+    """Return (save seconds, lazy reload and all(State) seconds)."""
+    FileStorage._FileStorage__sharded = sharded
+    FileStorage._FileStorage__lazy = False
+    storage.save()
+    storage.new(State(name="California"))
+    start = perf_counter()
+    storage.save()
+    saved = perf_counter() - start
+    objects = FileStorage._FileStorage__objects
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__lazy = True
+    start = perf_counter()
+    storage.reload()
+    storage.all(State)
+    loaded = perf_counter() - start
+    FileStorage._FileStorage__objects = objects
+    FileStorage._FileStorage__pending = {}
+    FileStorage._FileStorage__unloaded.clear()
+    return saved, loaded
+
+
+def main(count):
+    """Run the benchmark on a store of count objects."""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Review(text="review " * 20, place_id=str(i)))
+        if i % 10 == 0:
+            storage.new(User(email="user{}@hbnb.io".format(i)))
+        if i % 1000 == 0:
+            storage.new(State(name="state {}".format(i)))
+    print("{} objects".format(len(storage.all())))
+    print("{:>12} {:>12} {:>12}".format("layout", "save ms", "States ms"))
+    for name, sharded in (("single", False), ("sharded", True)):
+        saved, loaded = measure(storage, sharded)
+        print("{:>12} {:>12.1f} {:>12.1f}".format(name, saved * 1e3,
+                                                  loaded * 1e3))
+    directory = os.path.dirname(path)
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Benchmarks the JSON API against whole to_dict() payloads.
+
+Usage: python3 -m benchmarks.web_flask_api [<number of places>]
+
+Serves pages of MAX_PAGE_SIZE places with long descriptions from the
+/api/v1/places route of web_flask/api.py, whole and with ?fields=
+projection, with and without orjson, and compares them with json.dumps()
+of the to_dict() of the same places. Prints the best time of a few runs
+and the size of the payload.
+"""
+import importlib
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models import storage
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.state import State
+from models.user import User
+
+FIELDS = "id,name,price_by_night,latitude,longitude"
+
+
+def best(run, repeat=5):
+    """Return the fewest seconds and the result of repeat calls of run."""
+    times = []
+    for i in range(repeat):
+        start = perf_counter()
+        result = run()
+        times.append(perf_counter() - start)
+    return min(times), result
+
+
+def main(count):
+    """Run the benchmark on a store of count places."""
+    FileStorage._FileStorage__file_path = os.path.join(tempfile.mkdtemp(),
+                                                       "file.json")
+    FileStorage._FileStorage__objects = {}
+    user = User(email="bench@hbnb.io", password="bench")
+    state = State(name="California")
+    city = City(name="San Francisco", state_id=state.id)
+    for obj in (user, state, city):
+        storage.new(obj)
+    for i in range(count):
+        storage.new(Place(name="place {:06d}".format(i), city_id=city.id,
+                          user_id=user.id, description="x" * 2000,
+                          number_rooms=i % 5, price_by_night=i % 300,
+                          latitude=37.7, longitude=-122.4))
+    storage.save()
+    api = importlib.import_module("web_flask.api")
+    client = api.app.test_client()
+    limit = min(count, api.MAX_PAGE_SIZE)
+    url = "/api/v1/places?limit={}".format(limit)
+    orjson = api.orjson
+    runs = (("to_dict", None, lambda: json.dumps([
+                o.to_dict() for o in storage.query(Place, limit=limit)]).
+             encode("utf-8")),
+            ("whole", orjson, lambda: client.get(url).data),
+            ("fields", orjson, lambda: client.get(
+                url + "&fields=" + FIELDS).data),
+            ("fields json", None, lambda: client.get(
+                url + "&fields=" + FIELDS).data))
+    print("{} places, {} per page".format(count, limit))
+    print("{:>12} {:>12} {:>12}".format("mode", "ms", "KB"))
+    for name, encoder, run in runs:
+        api.orjson = encoder
+        seconds, data = best(run)
+        print("{:>12} {:>12.1f} {:>12.1f}".format(name, seconds * 1e3,
+                                                  len(data) / 2 ** 10))
+    api.orjson = orjson
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Benchmarks starting one combined app against one app per module.
+
+Usage: python3 -m benchmarks.web_flask_startup [<number of states>]
+
+Starts, in fresh processes over a FileStorage of states with two cities
+each, the Flask app of every module of web_flask.factory.blueprints on its
+own, as they used to be deployed, then the single app of create_app().
+Each process imports its modules, loads storage if they use it and builds
+its app; the wall time of the processes and their peak resident memory
+are added up.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from models import storage
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.state import State
+from web_flask.factory import blueprints
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHILD = """
+import importlib
+import resource
+app = {}
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def start(app, cwd):
+    """Return the seconds and peak KB of a process building app."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (
+        ROOT, env.get("PYTHONPATH"))))
+    begin = perf_counter()
+    out = subprocess.run([sys.executable, "-c", CHILD.format(app)], cwd=cwd,
+                         env=env, check=True, stdout=subprocess.PIPE,
+                         universal_newlines=True).stdout
+    return perf_counter() - begin, int(out.split()[-1])
+
+
+def main(count):
+    """Run the benchmark on a store of count states."""
+    cwd = tempfile.mkdtemp()
+    FileStorage._FileStorage__file_path = os.path.join(cwd, "file.json")
+    FileStorage._FileStorage__objects = {}
+    for i in range(count):
+        state = State(name="state {:06d}".format(i))
+        storage.new(state)
+        for j in range(2):
+            storage.new(City(name="city {}".format(j), state_id=state.id))
+    storage.save()
+    runs = {"separate": ["importlib.import_module('web_flask.{}').app".
+                         format(name) for name in blueprints],
+            "combined": ["importlib.import_module('web_flask.factory')."
+                         "create_app()"]}
+    print("{} states, {} modules".format(count, len(blueprints)))
+    print("{:>12} {:>12} {:>12} {:>12}".format("mode", "processes",
+                                               "total ms", "peak MB"))
+    for mode, apps in runs.items():
+        results = [start(app, cwd) for app in apps]
+        print("{:>12} {:>12} {:>12.1f} {:>12.1f}".format(
+            mode, len(results), sum(r[0] for r in results) * 1e3,
+            sum(r[1] for r in results) / 2 ** 10))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
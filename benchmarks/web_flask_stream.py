@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""Benchmarks streamed page rendering against buffered rendering.
+
+Usage: python3 -m benchmarks.web_flask_stream [<number of states>]
+
+Serves /cities_by_states over a FileStorage of states with two cities each,
+streamed as the view does and rendered whole with render_template as it
+used to, and compares the time to the first byte, the total time and the
+peak memory allocated while serving the page.
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from flask import render_template
+from models import storage
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+def load_app():
+    """Return the Flask app of web_flask/8-cities_by_states.py."""
+    path = os.path.join(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))), "web_flask", "8-cities_by_states.py")
+    spec = importlib.util.spec_from_file_location("cities_by_states", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.app.root_path = os.path.dirname(path)
+    return module.app
+
+
+def serve(client, url):
+    """Return the first byte, total seconds and peak bytes of a GET url."""
+    tracemalloc.start()
+    start = perf_counter()
+    response = client.get(url, buffered=False)
+    chunks = iter(response.response)
+    next(chunks)
+    first = perf_counter() - start
+    for chunk in chunks:
+        pass
+    total = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    response.close()
+    return first, total, peak
+
+
+def main(count):
+    """Run the benchmark on a store of count states."""
+    FileStorage._FileStorage__file_path = os.path.join(tempfile.mkdtemp(),
+                                                       "file.json")
+    FileStorage._FileStorage__objects = {}
+    for i in range(count):
+        state = State(name="state {:06d}".format(i))
+        storage.new(state)
+        for j in range(2):
+            storage.new(City(name="city {}".format(j), state_id=state.id))
+    app = load_app()
+
+    @app.route("/buffered")
+    def buffered():
+        """Render the page whole, as the view used to."""
+        states = storage.query("State", order_by=("name",))
+        return render_template("8-cities_by_states.html", states=states)
+
+    client = app.test_client()
+    print("{} states".format(count))
+    print("{:>12} {:>12} {:>12} {:>12}".format("mode", "first ms",
+                                               "total ms", "peak MB"))
+    for name, url in (("buffered", "/buffered"),
+                      ("streamed", "/cities_by_states")):
+        first, total, peak = serve(client, url)
+        print("{:>12} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+            name, first * 1e3, total * 1e3, peak / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -1,8 +1,11 @@
 #!/usr/bin/python3
 """Defines the HBNB console."""
 import cmd
+import sys
+import time
 from shlex import split
 from models import storage
+from models.engine import importer
 from datetime import datetime
 from models.base_model import BaseModel
 from models.user import User
@@ -26,6 +29,8 @@ class HBNBCommand(cmd.Cmd):
         "Place",
         "Review"
     }
+    __transaction = False
+    __batch = False
 
     def emptyline(self):
         """Ignore empty spaces."""
@@ -40,6 +45,47 @@ class HBNBCommand(cmd.Cmd):
         print("")
         return True
 
+    def batch(self):
+        """Run the commands of the input as one transaction.
+
+        Saves are deferred until the end of the input. begin in the input
+        finds the transaction already begun, and commit and rollback find
+        none of its own, so that they cannot end it early.
+        """
+        self.__transaction = self.__batch = True
+        storage.begin()
+        self.cmdloop()
+        self.__transaction = self.__batch = False
+        storage.commit()
+
+    def do_begin(self, line):
+        """Usage: begin
+        Start a transaction: saves are deferred until commit or rollback,
+        so the commands in between are persisted at once."""
+        if self.__transaction:
+            print("** transaction already begun **")
+            return
+        self.__transaction = True
+        storage.begin()
+
+    def do_commit(self, line):
+        """Usage: commit
+        Persist the changes made since begin and end the transaction."""
+        if not self.__transaction or self.__batch:
+            print("** no transaction **")
+            return
+        self.__transaction = False
+        storage.commit()
+
+    def do_rollback(self, line):
+        """Usage: rollback
+        Discard the changes made since begin and end the transaction."""
+        if not self.__transaction or self.__batch:
+            print("** no transaction **")
+            return
+        self.__transaction = False
+        storage.rollback()
+
     def do_create(self, line):
         """Usage: create <class> <key 1>=<value 2> <key 2>=<value 2> ...
         Create a new class instance with given keys/values and print its id.
@@ -90,10 +136,9 @@ class HBNBCommand(cmd.Cmd):
                 raise NameError()
             if len(my_list) < 2:
                 raise IndexError()
-            objects = storage.all()
-            key = my_list[0] + '.' + my_list[1]
-            if key in objects:
-                print(objects[key])
+            obj = storage.get(my_list[0], my_list[1])
+            if obj is not None:
+                print(obj)
             else:
                 raise KeyError()
         except SyntaxError:
@@ -121,10 +166,9 @@ class HBNBCommand(cmd.Cmd):
                 raise NameError()
             if len(my_list) < 2:
                 raise IndexError()
-            objects = storage.all()
-            key = my_list[0] + '.' + my_list[1]
-            if key in objects:
-                del objects[key]
+            obj = storage.get(my_list[0], my_list[1])
+            if obj is not None:
+                storage.delete(obj)
                 storage.save()
             else:
                 raise KeyError()
@@ -138,9 +182,15 @@ class HBNBCommand(cmd.Cmd):
             print("** no instance found **")
 
     def do_all(self, line):
-        """Usage: all or all <class> or <class>.all()
+        """Usage: all or all <class> [<key>=<value> ...] or <class>.all()
         Display string representations of all instances of a given class.
-        If no class is specified, displays all instantiated objects."""
+        If no class is specified, displays all instantiated objects.
+        Instances are filtered by the given <key>=<value> pairs, and the
+        storage engine sorts and pages them with the optional keys
+        order_by=<attr>[,<attr> ...], limit=<n> and offset=<n>.
+        Only the columns of the class can filter or sort it, and limit and
+        offset must not be negative. Arguments that are not <key>=<value>
+        pairs are ignored."""
         if not line:
             o = storage.all()
             print([o[k].__str__() for k in o])
@@ -150,12 +200,115 @@ class HBNBCommand(cmd.Cmd):
             if args[0] not in self.__classes:
                 raise NameError()
 
-            o = storage.all(eval(args[0]))
-            print([o[k].__str__() for k in o])
+            if len(args) == 1:
+                o = storage.all(eval(args[0]))
+                print([o[k].__str__() for k in o])
+                return
+            cls = eval(args[0])
+            columns = cls.__table__.columns.keys() if hasattr(
+                cls, "__table__") else ("id", "created_at", "updated_at")
+            kwargs = {}
+            filters = {}
+            for i in range(1, len(args)):
+                key, sep, value = args[i].partition("=")
+                if not sep or not key or not value:
+                    continue
+                if key == "order_by":
+                    kwargs[key] = tuple(value.split(","))
+                    if any(name not in columns for name in kwargs[key]):
+                        print("** attribute doesn't exist **")
+                        return
+                    continue
+                if key in ("limit", "offset"):
+                    try:
+                        kwargs[key] = int(value)
+                    except ValueError:
+                        kwargs[key] = -1
+                    if kwargs[key] < 0:
+                        print("** invalid {} **".format(key))
+                        return
+                    continue
+                if key not in columns:
+                    print("** attribute doesn't exist **")
+                    return
+                if value[0] == '"':
+                    value = value.strip('"').replace("_", " ")
+                else:
+                    try:
+                        value = eval(value)
+                    except (SyntaxError, NameError):
+                        continue
+                filters[key] = value
+            objs = storage.query(args[0], filters, **kwargs)
+            print([o.__str__() for o in objs])
 
         except NameError:
             print("** class doesn't exist **")
 
+    def do_import(self, line):
+        """Usage: import <class> <file>
+        Add the objects of a JSON Lines (or .csv) file through the storage
+        bulk path, in batches, and print the throughput.
+        Exceptions:
+            SyntaxError: when there is no args given
+            NameError: when there is no object taht has the name
+            IndexError: when there is no file given
+            OSError: when the file cannot be read
+            ValueError: when a record cannot be parsed
+        """
+        try:
+            if not line:
+                raise SyntaxError()
+            my_list = line.split(" ")
+            if my_list[0] not in self.__classes:
+                raise NameError()
+            if len(my_list) < 2:
+                raise IndexError()
+            start = time.perf_counter()
+            count = storage.bulk_new(importer.objects(eval(my_list[0]),
+                                                      my_list[1]))
+            self.report(count, time.perf_counter() - start)
+        except SyntaxError:
+            print("** class name missing **")
+        except NameError:
+            print("** class doesn't exist **")
+        except IndexError:
+            print("** file name missing **")
+        except OSError:
+            print("** can't read file **")
+        except ValueError:
+            print("** invalid record **")
+
+    def do_export(self, line):
+        """Usage: export <class> <file>
+        Write all instances of a class to a JSON Lines file, iterating them
+        from storage in batches, and print the throughput.
+        Exceptions:
+            SyntaxError: when there is no args given
+            NameError: when there is no object taht has the name
+            IndexError: when there is no file given
+            OSError: when the file cannot be written
+        """
+        try:
+            if not line:
+                raise SyntaxError()
+            my_list = line.split(" ")
+            if my_list[0] not in self.__classes:
+                raise NameError()
+            if len(my_list) < 2:
+                raise IndexError()
+            start = time.perf_counter()
+            count = importer.write(storage.iterate(my_list[0]), my_list[1])
+            self.report(count, time.perf_counter() - start)
+        except SyntaxError:
+            print("** class name missing **")
+        except NameError:
+            print("** class doesn't exist **")
+        except IndexError:
+            print("** file name missing **")
+        except OSError:
+            print("** can't write file **")
+
     def do_update(self, line):
         """Updates an instanceby adding or updating attribute
         Exceptions:
@@ -174,19 +327,17 @@ class HBNBCommand(cmd.Cmd):
                 raise NameError()
             if len(my_list) < 2:
                 raise IndexError()
-            objects = storage.all()
-            key = my_list[0] + '.' + my_list[1]
-            if key not in objects:
+            v = storage.get(my_list[0], my_list[1])
+            if v is None:
                 raise KeyError()
             if len(my_list) < 3:
                 raise AttributeError()
             if len(my_list) < 4:
                 raise ValueError()
-            v = objects[key]
             try:
-                v.__dict__[my_list[2]] = eval(my_list[3])
+                setattr(v, my_list[2], eval(my_list[3]))
             except Exception:
-                v.__dict__[my_list[2]] = my_list[3]
+                setattr(v, my_list[2], my_list[3])
                 v.save()
         except SyntaxError:
             print("** class name missing **")
@@ -204,20 +355,24 @@ class HBNBCommand(cmd.Cmd):
     def count(self, line):
         """count the number of instances of a class
         """
-        counter = 0
         try:
             my_list = split(line, " ")
             if my_list[0] not in self.__classes:
                 raise NameError()
-            objects = storage.all()
-            for key in objects:
-                name = key.split('.')
-                if name[0] == my_list[0]:
-                    counter += 1
-            print(counter)
+            print(storage.count(my_list[0]))
         except NameError:
             print("** class doesn't exist **")
 
+    def report(self, count, elapsed):
+        """print the number of objects processed and the throughput
+        Args:
+            count: number of objects
+            elapsed: seconds taken
+        """
+        rate = count / elapsed if elapsed else 0
+        print("{} objects in {:.2f} s ({:.0f} objects/sec)".format(
+            count, elapsed, rate))
+
     def strip_clean(self, args):
         """strips the argument and return a string of command
         Args:
@@ -258,7 +413,6 @@ class HBNBCommand(cmd.Cmd):
             elif my_list[1][:6] == "update":
                 args = self.strip_clean(my_list)
                 if isinstance(args, list):
-                    obj = storage.all()
                     key = args[0] + ' ' + args[1]
                     for k, v in args[2].items():
                         self.do_update(key + ' "{}" "{}"'.format(k, v))
@@ -269,4 +423,8 @@ class HBNBCommand(cmd.Cmd):
 
 
 if __name__ == '__main__':
-    HBNBCommand().cmdloop()
+    console = HBNBCommand()
+    if "--batch" in sys.argv[1:]:
+        console.batch()
+    else:
+        console.cmdloop()
@@ -18,6 +18,9 @@ class BaseModel:
         id (sqlalchemy String): The BaseModel id.
         created_at (sqlalchemy DateTime): The datetime at creation.
         updated_at (sqlalchemy DateTime): The datetime of last update.
+        _dirty (bool): Whether the instance changed since the storage engine
+            last persisted it. Set on every attribute assignment; code that
+            writes to __dict__ or changes a value in place must set it too.
     """
 
     id = Column(String(60), primary_key=True, nullable=False)
@@ -36,10 +39,15 @@ class BaseModel:
         if kwargs:
             for key, value in kwargs.items():
                 if key == "created_at" or key == "updated_at":
-                    value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+                    value = datetime.fromisoformat(value)
                 if key != "__class__":
                     setattr(self, key, value)
 
+    def __setattr__(self, name, value):
+        """Set an attribute and mark the instance as dirty."""
+        super().__setattr__(name, value)
+        self.__dict__["_dirty"] = True
+
     def save(self):
         """Update updated_at with the current datetime."""
         self.updated_at = datetime.utcnow()
@@ -57,6 +65,7 @@ class BaseModel:
         my_dict["created_at"] = self.created_at.isoformat()
         my_dict["updated_at"] = self.updated_at.isoformat()
         my_dict.pop("_sa_instance_state", None)
+        my_dict.pop("_dirty", None)
         return my_dict
 
     def delete(self):
@@ -67,4 +76,5 @@ class BaseModel:
         """Return the print/str representation of the BaseModel instance."""
         d = self.__dict__.copy()
         d.pop("_sa_instance_state", None)
+        d.pop("_dirty", None)
         return "[{}] ({}) {}".format(type(self).__name__, self.id, d)
@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+"""Defines the snapshot formats of FileStorage.
+
+Usage: python3 -m models.engine.codecs <source> <destination>
+
+Converts a snapshot between formats, picked by file extension:
+    .json: One JSON object of <class name>.<id> = <to_dict() of obj>.
+    .bin: A compact binary layout with integer timestamps and one group
+        of columns per class.
+"""
+import json
+import pickle
+import sys
+from datetime import datetime
+from datetime import timedelta
+from models.engine.json_stream import iter_items
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+TIMESTAMPS = ("created_at", "updated_at")
+
+
+class JSONCodec:
+    """Represent the JSON snapshot format.
+
+    Each record is written on its own line, for the streaming reader of
+    models.engine.json_stream.
+
+    Attributes:
+        extension (str): The file extension of the format.
+    """
+
+    extension = ".json"
+
+    def open(self, path, mode):
+        """Open a snapshot file in mode 'r' or 'w'."""
+        return open(path, mode, encoding="utf-8")
+
+    def encode(self, d):
+        """Return the JSON text of the to_dict() dictionary d."""
+        return json.dumps(d)
+
+    def dump(self, f, items):
+        """Write the (key, encoded record) pairs of items to file f.
+
+        Returns:
+            A list of (key, offset, length) tuples giving the byte range
+            of each record in f. json.dumps() escapes non-ASCII characters,
+            so characters and bytes are counted alike.
+        """
+        entries = []
+        pos = f.write("{")
+        sep = "\n"
+        for key, text in items:
+            pos += f.write("{}{}: ".format(sep, json.dumps(key)))
+            entries.append((key, pos, len(text)))
+            pos += f.write(text)
+            sep = ",\n"
+        f.write("\n}")
+        return entries
+
+    def load(self, f):
+        """Yield the (key, to_dict() dictionary) records of file f."""
+        return iter_items(f)
+
+
+class BinaryCodec:
+    """Represent the binary snapshot format.
+
+    Records are grouped by class and set of fields, and each group is
+    stored as one list of values per field, so class names and field
+    names are written once per group. Timestamps are stored as integer
+    microseconds since the epoch. The groups are pickled after a magic
+    header, and only plain values can be unpickled.
+
+    Attributes:
+        extension (str): The file extension of the format.
+        magic (bytes): The header of binary snapshot files.
+    """
+
+    extension = ".bin"
+    magic = b"HBNB\x01"
+
+    def open(self, path, mode):
+        """Open a snapshot file in mode 'r' or 'w'."""
+        return open(path, mode + "b")
+
+    def encode(self, d):
+        """Return the to_dict() dictionary d as a row.
+
+        Returns:
+            A (class name, field names, values) tuple.
+        """
+        fields = tuple(k for k in d if k != "__class__")
+        values = tuple((datetime.fromisoformat(d[k]) - EPOCH) // MICROSECOND
+                       if k in TIMESTAMPS and type(d[k]) == str else d[k]
+                       for k in fields)
+        return d["__class__"], fields, values
+
+    def dump(self, f, items):
+        """Write the (key, encoded record) pairs of items to file f."""
+        groups = {}
+        for key, (name, fields, values) in items:
+            columns = groups.get((name, fields))
+            if columns is None:
+                columns = groups[(name, fields)] = [[] for k in fields]
+            for column, value in zip(columns, values):
+                column.append(value)
+        f.write(self.magic)
+        pickle.dump([(name, fields, columns)
+                     for (name, fields), columns in groups.items()],
+                    f, protocol=5)
+
+    def load(self, f):
+        """Yield the (key, to_dict() dictionary) records of file f.
+
+        Raises:
+            ValueError: If f is not a binary snapshot.
+        """
+        if f.read(len(self.magic)) != self.magic:
+            raise ValueError("Not a binary snapshot")
+        try:
+            groups = Unpickler(f).load()
+        except pickle.UnpicklingError as e:
+            raise ValueError(str(e))
+        for name, fields, columns in groups:
+            stamps = [k for k in fields if k in TIMESTAMPS]
+            for values in zip(*columns):
+                d = dict(zip(fields, values))
+                for k in stamps:
+                    if type(d[k]) == int:
+                        d[k] = (EPOCH + d[k] * MICROSECOND).isoformat()
+                d["__class__"] = name
+                yield "{}.{}".format(name, d["id"]), d
+
+
+class Unpickler(pickle.Unpickler):
+    """Represent an unpickler restricted to plain values."""
+
+    def find_class(self, module, name):
+        """Refuse to load any class or function."""
+        raise pickle.UnpicklingError(
+            "Cannot load {}.{} from a snapshot".format(module, name))
+
+
+codecs = {"json": JSONCodec(), "binary": BinaryCodec()}
+
+
+def codec_named(name):
+    """Return the codec of the format name.
+
+    Raises:
+        ValueError: If no codec has that name.
+    """
+    if name not in codecs:
+        raise ValueError("Unknown snapshot format: {} (supported: {})".format(
+            name, ", ".join(sorted(codecs))))
+    return codecs[name]
+
+
+def codec_for(path):
+    """Return the codec matching the extension of path.
+
+    Raises:
+        ValueError: If no codec uses that extension.
+    """
+    for codec in codecs.values():
+        if path.endswith(codec.extension):
+            return codec
+    raise ValueError("Unknown snapshot format: {}".format(path))
+
+
+def convert(source, destination):
+    """Convert the snapshot source into the snapshot destination."""
+    reader = codec_for(source)
+    writer = codec_for(destination)
+    with reader.open(source, "r") as f, writer.open(destination, "w") as g:
+        writer.dump(g, ((key, writer.encode(d))
+                        for key, d in reader.load(f)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: {} <source> <destination>".format(sys.argv[0]))
+        sys.exit(1)
+    convert(sys.argv[1], sys.argv[2])
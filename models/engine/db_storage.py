@@ -1,30 +1,88 @@
 #!/usr/bin/python3
 """Defines the DBStorage engine."""
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from itertools import islice
 from os import getenv
 from models.base_model import Base
 from models.base_model import BaseModel
 from models.amenity import Amenity
 from models.city import City
+from models.engine.object_cache import ObjectCache
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from sqlalchemy import and_
 from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import scoped_session
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import SingletonThreadPool
+from sqlalchemy.pool import StaticPool
+
+classes = {"User": User, "State": State, "City": City,
+           "Amenity": Amenity, "Place": Place, "Review": Review}
 
 
 class DBStorage:
     """Represents a database storage engine.
 
+    If the environmental variable 'HBNB_MYSQL_CONCURRENT' is set to '1',
+    all() without a class queries each class concurrently over pooled
+    connections, paying one round-trip instead of six.
+
+    If the environmental variable 'HBNB_MYSQL_CACHE_SIZE' is set to a
+    positive number, get() and all() of a class without relationships to
+    load read through a process-level LRU cache of that many entries,
+    which expire after 'HBNB_MYSQL_CACHE_TTL' seconds (60 by default).
+    Objects created, changed or deleted through this process invalidate
+    their entries as they are committed; changes made by other processes
+    are only seen once the entries expire.
+
+    Each process keeps a pool of 'HBNB_MYSQL_POOL_SIZE' connections (5 by
+    default), opening up to 'HBNB_MYSQL_MAX_OVERFLOW' more under load (10
+    by default). A process forked after the engine was created, such as a
+    WSGI worker, starts with an empty pool of its own rather than sharing
+    the connections of its parent.
+
     Attributes:
         __engine (sqlalchemy.Engine): The working SQLAlchemy engine.
+        __engines (WeakSet): The engines of every DBStorage, whose pools
+            are dropped in forked processes.
         __session (sqlalchemy.Session): The working SQLAlchemy session.
+        __parallel (bool): Whether all() queries classes concurrently.
+        __deferred (bool): Whether save() commits are deferred until
+            commit().
+        __changes (int): The number of saves, deletions, commits and
+            rollbacks in this process, as returned by version().
+        __cache (ObjectCache): The cache of committed objects, mapping
+            (<class name>, <id>) to the column values of an object, and
+            (<class name>, None) to those of every object of the class.
     """
 
     __engine = None
     __session = None
+    __parallel = getenv("HBNB_MYSQL_CONCURRENT") == "1"
+    __deferred = False
+    __changes = 0
+    __engines = weakref.WeakSet()
+    __cache = ObjectCache(int(getenv("HBNB_MYSQL_CACHE_SIZE", "0")),
+                          float(getenv("HBNB_MYSQL_CACHE_TTL", "60")))
 
     def __init__(self):
         """Initialize a new DBStorage instance."""
@@ -33,18 +91,176 @@ class DBStorage:
                                              getenv("HBNB_MYSQL_PWD"),
                                              getenv("HBNB_MYSQL_HOST"),
                                              getenv("HBNB_MYSQL_DB")),
-                                      pool_pre_ping=True)
+                                      pool_pre_ping=True,
+                                      pool_size=int(getenv(
+                                          "HBNB_MYSQL_POOL_SIZE", "5")),
+                                      max_overflow=int(getenv(
+                                          "HBNB_MYSQL_MAX_OVERFLOW", "10")))
+        DBStorage.__engines.add(self.__engine)
         if getenv("HBNB_ENV") == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
+    @staticmethod
+    def __forked():
+        """Drop the pooled connections inherited by a forked process.
+
+        They are left open for the parent to use; the child opens its own.
+        """
+        for engine in DBStorage.__engines:
+            engine.dispose(close=False)
+
+    os.register_at_fork(after_in_child=__forked.__func__)
+
+    def __fetch(self, cls):
+        """Return a list of all objects of cls, detached from any session.
+
+        Runs in a worker thread, on a session and connection of its own.
+        """
+        with Session(self.__engine) as session:
+            return session.execute(select(cls)).scalars().all()
+
+    def __committed(self):
+        """Return whether the working session has no uncommitted changes."""
+        session = self.__session
+        if session.new or session.dirty or session.deleted:
+            return False
+        return not session.info.get("flushed")
+
+    def __concurrent(self):
+        """Return whether all() may query classes on separate connections.
+
+        Other connections do not see the changes of the working session
+        that are pending or flushed but not committed, and pools that hand
+        out a single connection cannot run queries concurrently.
+        """
+        if not self.__parallel or not self.__committed():
+            return False
+        return not isinstance(self.__engine.pool,
+                              (SingletonThreadPool, StaticPool))
+
+    def __snapshot(self, obj):
+        """Return the column values of obj."""
+        return {attr.key: getattr(obj, attr.key)
+                for attr in inspect(type(obj)).column_attrs}
+
+    def __restore(self, cls, values):
+        """Return the object of cls with values, in the working session.
+
+        The object is added as already persisted, without a query or a
+        call to its constructor; if the session already holds it, that
+        object is returned.
+        """
+        mapper = inspect(cls)
+        key = mapper.identity_key_from_primary_key([values["id"]])
+        obj = self.__session.identity_map.get(key)
+        if obj is None:
+            obj = mapper.class_manager.new_instance()
+            for name, value in values.items():
+                setattr(obj, name, value)
+            make_transient_to_detached(obj)
+            self.__session.add(obj)
+        return obj
+
+    def __commit(self):
+        """Commit the working session and invalidate what it changed."""
+        session = self.__session
+        changed = {(type(o).__name__, o.id) for o in
+                   chain(session.new, session.dirty, session.deleted)}
+        changed.update(session.info.get("flushed", ()))
+        session.commit()
+        for name, id in changed:
+            self.__cache.invalidate(name, id)
+
+    def __options(self, cls, load):
+        """Return the loader options eagerly loading the paths of load.
+
+        Collections are loaded with one extra SELECT ... IN query each, and
+        single related objects are joined to the query that loads them.
+        """
+        configure_mappers()
+        options = []
+        for path in load:
+            option = None
+            entity = cls
+            for name in path.split("."):
+                attr = getattr(entity, name)
+                loader = selectinload if attr.property.uselist else joinedload
+                if option is None:
+                    option = loader(attr)
+                else:
+                    option = getattr(option, loader.__name__)(attr)
+                entity = attr.property.mapper.class_
+            options.append(option)
+        return options
+
+    def __seek(self, columns, values, reverse):
+        """Return the condition selecting the rows sorted after values.
+
+        If reverse, selects the rows sorted before values instead. The row
+        comparison is spelled out column by column, which every database
+        can answer from an index on the columns.
+        """
+        clauses = []
+        for i, column in enumerate(columns):
+            seek = column < values[i] if reverse else column > values[i]
+            clauses.append(and_(*[c == v for c, v in
+                                  zip(columns[:i], values)], seek))
+        return or_(*clauses)
+
+    def __page(self, query, cls, filters, order_by, limit, offset, after,
+               before):
+        """Return query filtered, sorted and paged as query() describes."""
+        order_by = tuple(order_by)
+        if "id" not in order_by:
+            order_by += ("id",)
+        columns = [getattr(cls, name) for name in order_by]
+        if filters:
+            query = query.filter_by(**filters)
+        if after is not None:
+            query = query.filter(self.__seek(columns, after, False))
+        if before is not None:
+            query = query.filter(self.__seek(columns, before, True))
+            query = query.order_by(*[c.desc() for c in columns])
+        else:
+            query = query.order_by(*columns)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def all(self, cls=None, load=()):
         """Query on the curret database session all objects of the given class.
 
-        If cls is None, queries all types of objects.
+        If cls is None, queries all types of objects. If __parallel, the
+        queries of each class then run concurrently over pooled connections
+        and their objects are added to the working session, unless the
+        session has uncommitted changes. The objects of a cls given without
+        relationships to load are read through __cache under the same
+        condition.
+
+        Args:
+            cls (class or str): The class of the objects to query.
+            load (iterable): The relationships of cls to load along with the
+                objects, as dotted paths of attribute names such as
+                "reviews.user", so that using them issues no further queries.
 
         Return:
             Dict of queried classes in the format <class name>.<obj id> = obj.
         """
+        if cls is None and self.__concurrent():
+            identity_map = self.__session.identity_map
+            objs = {}
+            with ThreadPoolExecutor(len(classes)) as pool:
+                for result in pool.map(self.__fetch, classes.values()):
+                    for o in result:
+                        loaded = identity_map.get(inspect(o).key)
+                        if loaded is None:
+                            self.__session.add(o)
+                        else:
+                            o = loaded
+                        objs["{}.{}".format(type(o).__name__, o.id)] = o
+            return objs
         if cls is None:
             objs = self.__session.query(State).all()
             objs.extend(self.__session.query(City).all())
@@ -55,21 +271,226 @@ class DBStorage:
         else:
             if type(cls) == str:
                 cls = eval(cls)
-            objs = self.__session.query(cls)
+            key = (cls.__name__, None)
+            cached = not load and self.__committed()
+            values = self.__cache.get(key) if cached else None
+            if values is not None:
+                objs = [self.__restore(cls, v) for v in values]
+            else:
+                objs = self.__session.query(cls).options(
+                    *self.__options(cls, load)).all()
+                if cached:
+                    self.__cache.put(key, [self.__snapshot(o) for o in objs])
         return {"{}.{}".format(type(o).__name__, o.id): o for o in objs}
 
+    def count(self, cls=None):
+        """Count the objects of the given class in the database session.
+
+        If cls is None, counts all types of objects.
+        """
+        if cls is None:
+            return sum(self.__session.query(c).count() for c in
+                       (State, City, User, Place, Review, Amenity))
+        if type(cls) == str:
+            cls = eval(cls)
+        return self.__session.query(cls).count()
+
+    def get(self, cls, id):
+        """Return the object of the given class and id, or None.
+
+        The object is read through __cache while the session has no
+        uncommitted changes.
+        """
+        if type(cls) != str:
+            cls = cls.__name__
+        if cls not in classes:
+            return None
+        if not self.__committed():
+            return self.__session.query(classes[cls]).get(id)
+        values = self.__cache.get((cls, id))
+        if values is not None:
+            return self.__restore(classes[cls], values)
+        obj = self.__session.query(classes[cls]).get(id)
+        if obj is not None:
+            self.__cache.put((cls, id), self.__snapshot(obj))
+        return obj
+
+    def cache_info(self):
+        """Return the hits, misses, entries, size and ttl of the cache."""
+        cache = self.__cache
+        return {"hits": cache.hits, "misses": cache.misses,
+                "entries": len(cache), "size": cache.size, "ttl": cache.ttl}
+
+    def query(self, cls, filters=None, order_by=("id",), limit=None,
+              offset=0, after=None, before=None, load=()):
+        """Query on the current database session the objects of cls.
+
+        The objects are filtered, sorted and paged by the database.
+
+        Args:
+            cls (class or str): The class of the objects to query.
+            filters (dict): Column = value pairs the objects must match.
+            order_by (iterable): The columns to sort the objects by, in
+                ascending order. "id" is appended to break ties if missing.
+            limit (int): The maximum number of objects to return.
+            offset (int): The number of sorted objects to skip.
+            after (tuple): The order_by values (id included) of the last
+                object of the previous page; only the objects sorted after
+                it are returned, so that pages are found through the index
+                instead of counting skipped rows.
+            before (tuple): The order_by values (id included) of the first
+                object of the next page; only the last objects sorted before
+                it are returned, still in ascending order.
+            load (iterable): The relationships to load, as in all().
+
+        Return:
+            List of the queried objects.
+        """
+        if type(cls) == str:
+            cls = eval(cls)
+        query = self.__session.query(cls).options(*self.__options(cls, load))
+        objs = self.__page(query, cls, filters, order_by, limit, offset,
+                           after, before).all()
+        if before is not None:
+            objs.reverse()
+        return objs
+
+    def project(self, cls, fields, filters=None, order_by=("id",),
+                limit=None, offset=0, after=None, before=None):
+        """Return the values of fields of the objects query() would return.
+
+        Only the columns of fields are selected, so the objects are neither
+        loaded whole nor instantiated.
+
+        Args:
+            cls (class or str): The class of the objects to query.
+            fields (iterable): The names of the columns to return.
+            Other arguments are those of query().
+
+        Return:
+            List of dictionaries of field = value pairs, one per object.
+
+        Raises:
+            KeyError: If a field is not a column of cls.
+        """
+        if type(cls) == str:
+            cls = eval(cls)
+        fields = tuple(fields)
+        columns = [getattr(cls, cls.__table__.columns[name].key)
+                   for name in fields]
+        query = self.__session.query(*columns)
+        rows = self.__page(query, cls, filters, order_by, limit, offset,
+                           after, before).all()
+        if before is not None:
+            rows.reverse()
+        return [dict(zip(fields, row)) for row in rows]
+
+    def iterate(self, cls, filters=None, order_by=("id",), batch=100,
+                load=()):
+        """Return a generator of the objects query() would return.
+
+        The objects are queried batch by batch, each batch seeking past the
+        last object of the previous one, so that the first objects can be
+        used before the last ones are fetched and only one batch of rows is
+        held at a time.
+        """
+        order_by = tuple(order_by)
+        if "id" not in order_by:
+            order_by += ("id",)
+        after = None
+        while True:
+            objs = self.query(cls, filters, order_by, limit=batch,
+                              after=after, load=load)
+            yield from objs
+            if len(objs) < batch:
+                return
+            after = tuple(getattr(objs[-1], name) for name in order_by)
+
     def new(self, obj):
         """Add obj to the current database session."""
         self.__session.add(obj)
+        self.__cache.invalidate(type(obj).__name__, obj.id)
+
+    def bulk_new(self, objs, batch=1000):
+        """Insert the objects of the iterable objs, batch by batch.
+
+        Each batch is sent as one executemany INSERT per table, parents
+        before children, and committed, bypassing the unit of work; the
+        objects are not added to the session. Relationships that are not
+        foreign key columns, such as Place.amenities, are not inserted.
+
+        Args:
+            objs (iterable): The objects to insert.
+            batch (int): The number of objects per transaction.
+
+        Return:
+            The number of objects inserted.
+
+        Raises:
+            ValueError: If a batch breaks a constraint of the database, such
+                as a duplicate id or a missing foreign key; that batch is
+                rolled back, and the batches before it stay committed.
+        """
+        order = {t: i for i, t in enumerate(Base.metadata.sorted_tables)}
+        objs = iter(objs)
+        count = 0
+        while True:
+            rows = {}
+            for obj in islice(objs, batch):
+                mapper = inspect(type(obj))
+                row = {}
+                for attr in mapper.column_attrs:
+                    value = getattr(obj, attr.key)
+                    if value is not None:
+                        row[attr.key] = value
+                rows.setdefault((mapper.local_table, tuple(row)),
+                                []).append(row)
+                self.__cache.invalidate(type(obj).__name__)
+                count += 1
+            if not rows:
+                return count
+            try:
+                for table, keys in sorted(rows, key=lambda k: order[k[0]]):
+                    self.__session.execute(insert(table),
+                                           rows[(table, keys)])
+                self.__commit()
+            except IntegrityError as exc:
+                self.__session.rollback()
+                raise ValueError(str(exc.orig)) from exc
+            DBStorage.__changes += 1
 
     def save(self):
-        """Commit all changes to the current database session."""
-        self.__session.commit()
+        """Commit all changes to the current database session.
+
+        Nothing is committed between begin() and commit() or rollback();
+        queries still see the changes, which the session flushes first.
+        """
+        DBStorage.__changes += 1
+        if not self.__deferred:
+            self.__commit()
+
+    def begin(self):
+        """Defer commits until commit() or rollback()."""
+        self.__deferred = True
+
+    def commit(self):
+        """Stop deferring commits and commit the changes since begin()."""
+        self.__deferred = False
+        self.__commit()
+        DBStorage.__changes += 1
+
+    def rollback(self):
+        """Stop deferring commits and roll back the uncommitted changes."""
+        self.__deferred = False
+        self.__session.rollback()
+        DBStorage.__changes += 1
 
     def delete(self, obj=None):
         """Delete obj from the current database session."""
         if obj is not None:
             self.__session.delete(obj)
+            self.__cache.invalidate(type(obj).__name__, obj.id)
+            DBStorage.__changes += 1
 
     def reload(self):
         """Create all tables in the database and initialize a new session."""
@@ -78,7 +499,46 @@ class DBStorage:
                                        expire_on_commit=False)
         Session = scoped_session(session_factory)
         self.__session = Session()
+        event.listen(self.__session, "after_flush", flushed)
+        event.listen(self.__session, "after_transaction_end", ended)
+
+    def version(self):
+        """Return a number that changes whenever objects may have changed.
+
+        It is bumped by save(), delete(), bulk_new(), commit() and
+        rollback() in this process; commits of other processes do not
+        change it.
+        """
+        return DBStorage.__changes
+
+    def stamp(self, cls):
+        """Return the number of objects of cls and their latest updated_at.
+
+        Both are read by a single aggregate query, so the pair reflects
+        the commits of every process.
+        """
+        if type(cls) == str:
+            cls = classes[cls]
+        return tuple(self.__session.query(func.count(cls.id),
+                                          func.max(cls.updated_at)).one())
 
     def close(self):
         """Close the working SQLAlchemy session."""
         self.__session.close()
+
+
+def flushed(session, context):
+    """Record in session.info the keys of the objects session flushed.
+
+    The keys are (<class name>, <id>) pairs, kept until the transaction
+    ends so that committing invalidates their cache entries.
+    """
+    keys = session.info.setdefault("flushed", set())
+    keys.update((type(o).__name__, o.id) for o in
+                chain(session.new, session.dirty, session.deleted))
+
+
+def ended(session, transaction):
+    """Forget the flushes of session once its transaction ends."""
+    if transaction.parent is None:
+        session.info.pop("flushed", None)
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""Defines the FileLock class."""
+import os
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class FileLock:
+    """Represent an advisory lock file shared by processes.
+
+    The lock file also holds a version number, which a process increments
+    after changing the files the lock protects, so other processes can tell
+    whether those files changed with a single read.
+    On platforms without fcntl, locking does nothing.
+
+    Attributes:
+        path (str): The name of the lock file.
+        pid (int): The process that opened the lock file.
+    """
+
+    def __init__(self, path):
+        """Open a lock file, creating it if needed.
+
+        Args:
+            path (str): The name of the lock file.
+        """
+        self.path = path
+        self.pid = os.getpid()
+        self.__fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @contextmanager
+    def __locked(self, operation):
+        """Hold the lock with fcntl.flock() operation while in context."""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self.__fd, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+
+    def shared(self):
+        """Return a context holding the lock shared, to read the files."""
+        return self.__locked(fcntl.LOCK_SH if fcntl else None)
+
+    def exclusive(self):
+        """Return a context holding the lock exclusively, to write them."""
+        return self.__locked(fcntl.LOCK_EX if fcntl else None)
+
+    def version(self):
+        """Return the version number of the files, 0 if never written."""
+        data = os.pread(self.__fd, 32, 0)
+        return int(data) if data.strip() else 0
+
+    def bump(self):
+        """Increment the version number and return it.
+
+        Only call while holding the lock exclusively.
+        """
+        version = self.version() + 1
+        data = "{}\n".format(version).encode()
+        os.pwrite(self.__fd, data, 0)
+        os.ftruncate(self.__fd, len(data))
+        return version
+
+    def close(self):
+        """Close the lock file."""
+        os.close(self.__fd)
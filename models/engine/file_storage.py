@@ -1,70 +1,971 @@
 #!/usr/bin/python3
 """Defines the FileStorage class."""
+import heapq
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from os import getenv
 from models.base_model import BaseModel
 from models.amenity import Amenity
 from models.city import City
+from models.engine.codecs import codec_named
+from models.engine.codecs import codecs
+from models.engine.file_lock import FileLock
+from models.engine.journal import Journal
+from models.engine.json_stream import loads
+from models.engine.record_index import RecordIndex
+from models.engine.writer import Writer
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
 
+classes = {"BaseModel": BaseModel, "User": User, "State": State,
+           "City": City, "Amenity": Amenity, "Place": Place,
+           "Review": Review}
+
 
 class FileStorage:
     """Represent an abstracted storage engine.
 
+    If the environmental variable 'HBNB_FILE_JOURNAL' is set to '1',
+    saves append the objects changed since the last save to the log
+    <__file_path>.log instead of rewriting __file_path.
+
+    The environmental variable 'HBNB_FILE_FORMAT' selects the snapshot
+    format, either 'json' (the default, file.json) or 'binary' (file.bin).
+
+    If the environmental variable 'HBNB_FILE_LAZY' is set to '1', reloaded
+    records are kept as dictionaries and only instantiated when all(),
+    get(), count() or lookup() first needs them.
+
+    If the environmental variable 'HBNB_FILE_INDEX' is set to '1', JSON
+    snapshots are saved with a sorted index of the byte range of each
+    record, <__file_path>.idx. Reloading then only maps both files into
+    memory, and records are decoded from the snapshot as they are needed.
+
+    If the environmental variable 'HBNB_FILE_SHARDS' is set to '1', the
+    snapshot is split into one file per class, <stem>.<class name><ext>
+    (file.State.json, ...). Saves only rewrite the files of classes that
+    changed, and reloads read the files that changed in parallel. If lazy
+    and not journaling, the file of a class is only read when first needed.
+
+    If the environmental variable 'HBNB_FILE_ASYNC' is set to '1', save()
+    only queues a save for a background thread, which merges saves queued
+    while it is writing into one. flush() waits for queued saves.
+
+    If the environmental variable 'HBNB_FILE_SHARED' is set to '1', the
+    files are shared with other processes through the advisory lock file
+    <__file_path>.lock, which also holds a version number bumped by every
+    save. Reloads only read the files when the version changed, and saves
+    first merge the changes of other processes. Objects changed since the
+    last save are never overwritten by a reload.
+
     Attributes:
+        __codec (JSONCodec or BinaryCodec): The snapshot format.
         __file_path (str): The name of the file to save objects to.
         __objects (dict): A dictionary of instantiated objects.
+        __classes (dict): A per-class index of __objects, mapping class
+            names to dictionaries of <class name>.<id> = obj.
+        __indexed (dict): The __objects dictionary __classes was built from.
+        __foreign_keys (dict): The attributes of each class to keep reverse
+            indexes on.
+        __references (dict): Reverse indexes of __objects, mapping
+            (<class name>, <attribute>) pairs to dictionaries of
+            <attribute value> = {<class name>.<id> = obj}.
+        __loaded (dict): The __objects dictionary __file_path was last
+            loaded into or saved from.
+        __signature (tuple): The (inode, size, mtime) of each snapshot file,
+            and of the log if journaling, when last loaded or saved.
+        __changed (set): The keys of objects created, updated or deleted
+            since the last save.
+        __journaled (bool): Whether saves are appended to a log.
+        __journal (Journal): The log of __file_path, if journaling.
+        __compact_after (int): The minimum number of log records before
+            the log is compacted into __file_path.
+        __records (dict): A cache of serialized objects, mapping
+            <class name>.<id> to (obj, codec, <obj encoded by codec>).
+        __lazy (bool): Whether reloaded records are instantiated on demand.
+        __pending (dict): Reloaded records not yet instantiated, mapping
+            class names to dictionaries of <class name>.<id> = record.
+        __mapped (bool): Whether JSON snapshots are saved with an index.
+        __store (RecordIndex): The index of the snapshot last reloaded, if
+            its records are decoded on demand.
+        __shadowed (dict): The keys of records of __store that were decoded
+            or deleted since, mapping class names to sets of keys.
+        __sharded (bool): Whether the snapshot is split by class.
+        __touched (set): The classes with objects created or deleted since
+            their snapshot file was last written.
+        __unloaded (set): The classes whose snapshot file changed since it
+            was last read.
+        __async (bool): Whether saves are written by a background thread.
+        __writer (Writer): The background thread writing saves, if async.
+        __lock (Lock): Serializes saves and reloads across threads.
+        __shared (bool): Whether the files are shared with other processes.
+        __file_lock (FileLock): The lock file of __file_path, if shared.
+        __version (int): The version of the files when last loaded or saved.
+        __deferred (bool): Whether saves are deferred until commit().
+        __changes (int): The number of saves, deletions and reloads that
+            changed __objects, as returned by version().
+        __stamps (dict): The stamp() of each class name, with the version()
+            it was computed at.
     """
 
-    __file_path = "file.json"
+    __codec = codec_named(getenv("HBNB_FILE_FORMAT", "json"))
+    __file_path = "file" + __codec.extension
     __objects = {}
+    __classes = {}
+    __indexed = None
+    __foreign_keys = {"City": ("state_id",), "Review": ("place_id",)}
+    __references = {}
+    __loaded = None
+    __signature = None
+    __changed = set()
+    __journaled = getenv("HBNB_FILE_JOURNAL") == "1"
+    __journal = None
+    __compact_after = 1000
+    __records = {}
+    __lazy = getenv("HBNB_FILE_LAZY") == "1"
+    __pending = {}
+    __mapped = getenv("HBNB_FILE_INDEX") == "1"
+    __store = None
+    __shadowed = {}
+    __sharded = getenv("HBNB_FILE_SHARDS") == "1"
+    __touched = set()
+    __unloaded = set()
+    __async = getenv("HBNB_FILE_ASYNC") == "1"
+    __writer = None
+    __lock = threading.Lock()
+    __shared = getenv("HBNB_FILE_SHARED") == "1"
+    __file_lock = None
+    __version = None
+    __deferred = False
+    __changes = 0
+    __stamps = {}
+
+    @staticmethod
+    def __forked():
+        """Drop the lock and writer thread inherited by a forked process.
+
+        The lock may have been held by a thread that does not exist in the
+        forked process, and saves queued in the parent are its to write.
+        """
+        FileStorage.__lock = threading.Lock()
+        FileStorage.__writer = None
+
+    os.register_at_fork(after_in_child=__forked.__func__)
+
+    def __index(self):
+        """Return the per-class index of __objects.
+
+        The index is rebuilt whenever __objects was replaced or changed
+        in size without going through new() or delete().
+        """
+        objects = self.__objects
+        if (FileStorage.__indexed is not objects or
+                sum(map(len, FileStorage.__classes.values())) !=
+                len(objects)):
+            FileStorage.__classes = {}
+            FileStorage.__references = {}
+            for key, obj in objects.items():
+                name = type(obj).__name__
+                FileStorage.__classes.setdefault(name, {})[key] = obj
+                self.__reference(name, key, obj)
+            for name, records in self.__pending.items():
+                for key, o in records.items():
+                    self.__reference(name, key, None, o)
+            FileStorage.__indexed = objects
+        return FileStorage.__classes
+
+    def __reference(self, name, key, obj, record=None):
+        """Add obj to the reverse indexes of its class.
+
+        If obj is None, the pending record of key is indexed instead, to be
+        instantiated when it is looked up.
+        """
+        for attr in self.__foreign_keys.get(name, ()):
+            if obj is None:
+                value = record.get(attr)
+            else:
+                value = getattr(obj, attr, None)
+            if value is not None:
+                index = FileStorage.__references.setdefault((name, attr), {})
+                index.setdefault(value, {})[key] = obj
+
+    def __add(self, obj):
+        """Set obj in __objects and its indexes and return its key."""
+        name = type(obj).__name__
+        key = "{}.{}".format(name, obj.id)
+        self.__pending.get(name, {}).pop(key, None)
+        self.__shadow(key)
+        self.__index().setdefault(name, {})[key] = obj
+        self.__reference(name, key, obj)
+        self.__objects[key] = obj
+        return key
+
+    def __remove(self, key):
+        """Remove key from __objects and its indexes and return its object.
+
+        A pending record of key is dropped and returned instead, and a
+        record of key in __store is shadowed and its key returned.
+        Returns None if key is not in __objects.
+        """
+        index = self.__index()
+        if self.__shadow(key):
+            return key
+        record = self.__pending.get(key.partition(".")[0], {}).pop(key, None)
+        if record is not None:
+            return record
+        obj = self.__objects.pop(key, None)
+        if obj is not None:
+            name = type(obj).__name__
+            index.get(name, {}).pop(key, None)
+            self.__records.pop(key, None)
+            for attr in self.__foreign_keys.get(name, ()):
+                refs = self.__references.get((name, attr), {})
+                refs.get(getattr(obj, attr, None), {}).pop(key, None)
+        return obj
+
+    def __shadow(self, key):
+        """Hide the record of key in __store from reads and saves.
+
+        Returns whether key had a record in __store that was not hidden.
+        """
+        store = self.__store
+        if store is None:
+            return False
+        shadowed = self.__shadowed.setdefault(key.partition(".")[0], set())
+        if key in shadowed or key not in store:
+            return False
+        shadowed.add(key)
+        return True
+
+    def __drain(self, name):
+        """Decode the records of class name in __store into __pending."""
+        if self.__store is None:
+            return
+        shadowed = self.__shadowed.setdefault(name, set())
+        records = self.__pending.setdefault(name, {})
+        self.__index()
+        for key, text in self.__store.items(name):
+            if key not in shadowed:
+                shadowed.add(key)
+                records[key] = loads(text)
+                self.__reference(name, key, None, records[key])
+
+    def __open(self, store):
+        """Replace __store with store, the index of a reloaded snapshot.
+
+        Pending records of keys in store are dropped, to be decoded from
+        store when needed, and objects whose updated_at differs from their
+        record in store are instantiated again.
+        """
+        if self.__store is not None:
+            self.__store.close()
+        FileStorage.__store = store
+        FileStorage.__shadowed = {}
+        for records in self.__pending.values():
+            for key in [k for k in records if k in store]:
+                del records[key]
+        for key, obj in list(self.__objects.items()):
+            if self.__shadow(key):
+                o = store.read(key)
+                if obj.updated_at.isoformat() != o["updated_at"]:
+                    del o["__class__"]
+                    self.__add(type(obj)(**o))
+
+    def __log(self):
+        """Return the Journal of __file_path, or None if not journaling."""
+        if not self.__journaled:
+            return None
+        path = self.__file_path + ".log"
+        if FileStorage.__journal is None or FileStorage.__journal.path != path:
+            FileStorage.__journal = Journal(path)
+        return FileStorage.__journal
+
+    def __locker(self):
+        """Return the FileLock of __file_path, or None if not shared.
+
+        The lock file is opened again in processes forked since it was
+        opened, as forked processes would otherwise share its locks.
+        """
+        if not self.__shared:
+            return None
+        path = self.__file_path + ".lock"
+        locker = FileStorage.__file_lock
+        if locker is None or locker.path != path or locker.pid != os.getpid():
+            FileStorage.__file_lock = FileLock(path)
+        return FileStorage.__file_lock
+
+    def __stat(self):
+        """Return the (inode, size, mtime) of the snapshot files and log.
+
+        Files that do not exist are given as None.
+        """
+        paths = self.__paths()
+        if self.__journaled:
+            paths.append(self.__file_path + ".log")
+        stats = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stats.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                stats.append(None)
+        return tuple(stats)
+
+    def __paths(self):
+        """Return the snapshot files, one per class of classes if sharded."""
+        if not self.__sharded:
+            return [self.__file_path]
+        return [self.__shard(name) for name in classes]
+
+    def __shard(self, name):
+        """Return the snapshot file of the objects of class name."""
+        stem, ext = os.path.splitext(self.__file_path)
+        return "{}.{}{}".format(stem, name, ext)
+
+    def __read(self, path):
+        """Return the list of (key, record) pairs of snapshot file path."""
+        try:
+            with self.__codec.open(path, "r") as f:
+                return list(self.__codec.load(f))
+        except FileNotFoundError:
+            return []
 
-    def all(self, cls=None):
+    def __unload(self, names):
+        """Load the unloaded snapshot files of the classes in names.
+
+        The files are read and decoded in a thread pool, and their records
+        set in __objects in order once all are read. If shared, objects of
+        those classes missing from their file were deleted by another
+        process and are pruned.
+        """
+        names = [name for name in names if name in self.__unloaded]
+        if not names:
+            return
+        self.__unloaded.difference_update(names)
+        with ThreadPoolExecutor() as pool:
+            shards = pool.map(self.__read, map(self.__shard, names))
+            for name, records in zip(names, list(shards)):
+                for key, o in records:
+                    self.__load(key, o)
+                if self.__shared:
+                    self.__prune({key for key, o in records}, name)
+
+    def __encode(self, key, obj):
+        """Return obj encoded by __codec.
+
+        The cached encoding is reused unless obj is dirty, which only
+        attribute assignments mark it as (see BaseModel). obj is marked
+        clean before being encoded, so changes made by another thread while
+        it is encoded mark it dirty again.
+        """
+        record = self.__records.get(key)
+        if (record is None or record[0] is not obj or
+                record[1] is not self.__codec or
+                obj.__dict__.get("_dirty", True)):
+            obj.__dict__["_dirty"] = False
+            record = (obj, self.__codec, self.__codec.encode(obj.to_dict()))
+            self.__records[key] = record
+        return record[2]
+
+    def __write(self):
+        """Atomically replace __file_path with a snapshot of __objects.
+
+        If sharded, only the files of classes that were touched, have
+        dirty objects or have no file yet are replaced, each with a
+        snapshot of its class. The touched classes are unmarked before
+        their files are written, so that classes touched meanwhile by
+        another thread are written by the next save.
+        """
+        if not self.__sharded:
+            entries = self.__dump(self.__file_path, self.__items())
+            if self.__mapped and entries is not None:
+                RecordIndex.write(self.__file_path + ".idx",
+                                  self.__file_path, entries)
+            return
+        names = set(self.__touched)
+        self.__touched.difference_update(names)
+        for name, objs in self.__index().items():
+            if any(o.__dict__.get("_dirty", True) for o in objs.values()):
+                names.add(name)
+        names.update(name for name in classes
+                     if not os.path.exists(self.__shard(name)))
+        try:
+            self.__unload(names)
+            for name in names:
+                self.__dump(self.__shard(name), self.__items(name))
+        except BaseException:
+            self.__touched.update(names)
+            raise
+
+    def __dump(self, path, items):
+        """Atomically replace the snapshot file path with items.
+
+        The snapshot is written to a temporary file and flushed to disk
+        before being renamed over path, so a crash in the middle of a
+        save leaves the previous snapshot intact.
+
+        Returns:
+            The (key, offset, length) entries of the records, if known.
+        """
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        with self.__codec.open(tmp, "w") as f:
+            entries = self.__codec.dump(f, items)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return entries
+
+    def __items(self, cls=None):
+        """Yield the (key, encoded record) pairs of a snapshot.
+
+        If cls is given, only the records of that class name are yielded.
+        Pending records are encoded without being instantiated, and the
+        JSON text of records left in __store is copied as is. Dictionaries
+        are copied before being iterated, as other threads may change them.
+        """
+        if cls is None:
+            objects = self.__objects
+            pending = self.__pending
+        else:
+            objects = self.__index().get(cls, {})
+            pending = {cls: self.__pending.get(cls, {})}
+        for key, obj in list(objects.items()):
+            yield key, self.__encode(key, obj)
+        for records in list(pending.values()):
+            for key, o in list(records.items()):
+                yield key, self.__codec.encode(o)
+        if self.__store is None:
+            return
+        for name in self.__store.counts if cls is None else [cls]:
+            shadowed = self.__shadowed.get(name, ())
+            for key, text in self.__store.items(name):
+                if key in shadowed:
+                    continue
+                if self.__codec is codecs["json"]:
+                    yield key, text
+                else:
+                    yield key, self.__codec.encode(loads(text))
+
+    def __load(self, key, o):
+        """Set in __objects the object of record o, or remove key if o is None.
+
+        Records whose updated_at matches the object already in __objects
+        are skipped, as are records of objects changed since the last save.
+        If lazy, the record is left pending instead.
+        """
+        if key in self.__changed:
+            return
+        obj = self.__objects.get(key)
+        if o is None:
+            self.__remove(key)
+            return
+        if obj is not None and obj.updated_at.isoformat() == o["updated_at"]:
+            return
+        if not self.__lazy:
+            name = o["__class__"]
+            del o["__class__"]
+            self.__add(classes[name](**o))
+            return
+        self.__remove(key)
+        name = o["__class__"]
+        self.__pending.setdefault(name, {})[key] = o
+        self.__index()
+        self.__reference(name, key, None, o)
+
+    def __materialize(self, name, key=None):
+        """Instantiate pending records of class name into __objects.
+
+        If key is given, only its record is instantiated and its object
+        returned, or None if it has no pending record.
+        """
+        records = self.__pending.get(name, {})
+        keys = list(records) if key is None else [key]
+        obj = None
+        for key in keys:
+            o = records.pop(key, None)
+            if o is not None:
+                del o["__class__"]
+                obj = classes[name](**o)
+                self.__add(obj)
+        return obj
+
+    def __reload_snapshot(self):
+        """Load __file_path, mapping it into memory if it has an index."""
+        store = None
+        if self.__mapped and self.__codec is codecs["json"]:
+            try:
+                store = RecordIndex(self.__file_path + ".idx",
+                                    self.__file_path)
+            except ValueError:
+                pass
+        if store is not None:
+            self.__open(store)
+            if self.__shared:
+                self.__prune(store)
+            return
+        if self.__store is not None:
+            self.__store.close()
+            FileStorage.__store = None
+            FileStorage.__shadowed = {}
+        keys = set()
+        try:
+            with self.__codec.open(self.__file_path, "r") as f:
+                for key, o in self.__codec.load(f):
+                    keys.add(key)
+                    self.__load(key, o)
+        except FileNotFoundError:
+            pass
+        if self.__shared:
+            self.__prune(keys)
+
+    def __prune(self, keys, name=None):
+        """Remove the objects and pending records whose key is not in keys.
+
+        If name is given, only those of class name are removed. Objects
+        changed since the last save are kept.
+        """
+        if name is None:
+            objects = self.__objects
+            pending = self.__pending.values()
+        else:
+            objects = self.__index().get(name, {})
+            pending = [self.__pending.get(name, {})]
+        stale = [k for k in objects
+                 if k not in keys and k not in self.__changed]
+        for records in pending:
+            stale.extend(k for k in records
+                         if k not in keys and k not in self.__changed)
+        for key in stale:
+            self.__remove(key)
+
+    def __refresh(self):
+        """Load the files changed since last loaded or saved.
+
+        See reload() for details.
+        """
+        signature = self.__stat()
+        previous = FileStorage.__signature
+        if (not any(signature) or signature == previous and
+                FileStorage.__loaded is self.__objects):
+            return
+        FileStorage.__changes += 1
+        journal = self.__log()
+        log = signature[-1]
+        if (journal is not None and log is not None and
+                FileStorage.__loaded is self.__objects and
+                previous is not None and len(previous) == len(signature) and
+                previous[:-1] == signature[:-1] and
+                (previous[-1] is None or previous[-1][0] == log[0]) and
+                log[1] >= journal.offset):
+            for key, o in journal.replay(journal.offset):
+                self.__load(key, o)
+            FileStorage.__signature = signature
+            return
+        if self.__sharded:
+            if (FileStorage.__loaded is not self.__objects or
+                    previous is None or len(previous) != len(signature)):
+                previous = (None,) * len(signature)
+            for name, old, new in zip(classes, previous, signature):
+                if new is not None and new != old:
+                    self.__unloaded.add(name)
+            if not self.__lazy or self.__journaled:
+                self.__unload(list(self.__unloaded))
+        else:
+            self.__reload_snapshot()
+        if journal is not None:
+            for key, o in journal.replay():
+                self.__load(key, o)
+        FileStorage.__loaded = self.__objects
+        FileStorage.__signature = signature
+
+    def __save(self):
+        """Write __objects to disk, as described in save().
+
+        If shared, the changes of other processes are merged first, and
+        the version of the files is bumped once written. If sharded, the
+        files of the classes being saved are loaded while their changes are
+        still marked, so that merging them keeps the objects not saved yet.
+        """
+        locker = self.__locker()
+        with self.__lock, locker.exclusive() if locker else nullcontext():
+            if locker is not None:
+                version = locker.version()
+                if (version != FileStorage.__version or
+                        FileStorage.__loaded is not self.__objects):
+                    self.__refresh()
+            journal = self.__log()
+            changed = list(self.__changed)
+            if self.__sharded:
+                self.__unload(self.__touched.union(
+                    key.partition(".")[0] for key in changed))
+            self.__changed.difference_update(changed)
+            if journal is None:
+                self.__write()
+            else:
+                changes = []
+                for key in changed:
+                    obj = self.__objects.get(key)
+                    if obj is not None and self.__codec is codecs["json"]:
+                        obj = self.__encode(key, obj)
+                    elif obj is not None:
+                        obj = json.dumps(obj.to_dict())
+                    changes.append((key, obj))
+                journal.append(changes)
+                if len(journal) >= max(self.__compact_after,
+                                       len(self.__objects)):
+                    self.__write()
+                    journal.truncate()
+            FileStorage.__loaded = self.__objects
+            FileStorage.__signature = self.__stat()
+            if locker is not None:
+                FileStorage.__version = locker.bump()
+
+    def all(self, cls=None, load=()):
         """Return a dictionary of instantiated objects in __objects.
 
         If a cls is specified, returns a dictionary of objects of that type.
         Otherwise, returns the __objects dictionary.
+        load is accepted for compatibility with DBStorage.all(); related
+        objects are always answered from memory.
         """
         if cls is not None:
-            if type(cls) == str:
-                cls = eval(cls)
-            cls_dict = {}
-            for k, v in self.__objects.items():
-                if type(v) == cls:
-                    cls_dict[k] = v
-            return cls_dict
+            if type(cls) != str:
+                cls = cls.__name__
+            self.__unload([cls])
+            self.__drain(cls)
+            self.__materialize(cls)
+            return dict(self.__index().get(cls, {}))
+        self.__unload(list(self.__unloaded))
+        if self.__store is not None:
+            for name in self.__store.counts:
+                self.__drain(name)
+        for name in list(self.__pending):
+            self.__materialize(name)
         return self.__objects
 
+    def count(self, cls=None):
+        """Return the number of objects in __objects.
+
+        If a cls is specified, only objects of that type are counted.
+        Pending records and records in __store are counted without being
+        decoded or instantiated.
+        """
+        store = self.__store
+        if cls is not None:
+            if type(cls) != str:
+                cls = cls.__name__
+            self.__unload([cls])
+            stored = 0
+            if store is not None:
+                stored = (store.counts.get(cls, 0) -
+                          len(self.__shadowed.get(cls, ())))
+            return (len(self.__index().get(cls, {})) +
+                    len(self.__pending.get(cls, {})) + stored)
+        self.__unload(list(self.__unloaded))
+        stored = 0
+        if store is not None:
+            stored = (sum(store.counts.values()) -
+                      sum(map(len, self.__shadowed.values())))
+        return (len(self.__objects) + sum(map(len, self.__pending.values())) +
+                stored)
+
+    def get(self, cls, id):
+        """Return the object of the given class and id, or None."""
+        if type(cls) != str:
+            cls = cls.__name__
+        key = "{}.{}".format(cls, id)
+        self.__unload([cls])
+        obj = self.__objects.get(key)
+        if obj is None:
+            obj = self.__materialize(cls, key)
+        if (obj is None and cls in classes and self.__store is not None and
+                key not in self.__shadowed.get(cls, ())):
+            o = self.__store.read(key)
+            if o is not None:
+                self.__shadowed.setdefault(cls, set()).add(key)
+                del o["__class__"]
+                obj = classes[cls](**o)
+                self.__add(obj)
+        return obj
+
+    def lookup(self, cls, attr, value):
+        """Return a list of objects of type cls whose attr equals value.
+
+        Attributes listed in __foreign_keys are answered from a reverse
+        index, which is kept current by new() and delete(); BaseModel.save()
+        re-registers an object after its attributes change.
+        Other attributes fall back to scanning the objects of that class.
+        """
+        if type(cls) != str:
+            cls = cls.__name__
+        if attr not in self.__foreign_keys.get(cls, ()):
+            return [o for o in self.all(cls).values()
+                    if getattr(o, attr, None) == value]
+        self.__unload([cls])
+        self.__drain(cls)
+        self.__index()
+        index = self.__references.get((cls, attr), {}).get(value, {})
+        obj_list = []
+        for key, obj in list(index.items()):
+            if obj is None:
+                obj = self.__materialize(cls, key)
+            if (obj is not None and self.__objects.get(key) is obj and
+                    getattr(obj, attr, None) == value):
+                obj_list.append(obj)
+            else:
+                index.pop(key, None)
+        return obj_list
+
+    def query(self, cls, filters=None, order_by=("id",), limit=None,
+              offset=0, after=None, before=None, load=()):
+        """Return a list of the objects of type cls matching filters.
+
+        Filters on attributes listed in __foreign_keys start from their
+        reverse index instead of scanning the class. When limited, only the
+        first offset + limit objects are kept sorted, in a heap.
+
+        Args:
+            cls (class or str): The class of the objects to query.
+            filters (dict): Attribute = value pairs the objects must match.
+            order_by (iterable): The attributes to sort the objects by, in
+                ascending order, None first. "id" is appended to break ties
+                if missing.
+            limit (int): The maximum number of objects to return.
+            offset (int): The number of sorted objects to skip.
+            after (tuple): The order_by values (id included) of the last
+                object of the previous page; only the objects sorted after
+                it are returned.
+            before (tuple): The order_by values (id included) of the first
+                object of the next page; only the last objects sorted before
+                it are returned, still in ascending order.
+            load (iterable): Accepted for compatibility with DBStorage.
+        """
+        if type(cls) != str:
+            cls = cls.__name__
+        filters = dict(filters or {})
+        order_by = tuple(order_by)
+        if "id" not in order_by:
+            order_by += ("id",)
+        indexed = [a for a in self.__foreign_keys.get(cls, ())
+                   if a in filters]
+        if indexed:
+            objs = self.lookup(cls, indexed[0], filters.pop(indexed[0]))
+        else:
+            objs = self.all(cls).values()
+        objs = [o for o in objs if all(getattr(o, a, None) == v
+                                       for a, v in filters.items())]
+
+        def key(values):
+            return tuple((v is not None, v) for v in values)
+
+        def sort_key(obj):
+            return key(getattr(obj, a, None) for a in order_by)
+
+        if after is not None:
+            cursor = key(after)
+            objs = [o for o in objs if sort_key(o) > cursor]
+        if before is not None:
+            cursor = key(before)
+            objs = [o for o in objs if sort_key(o) < cursor]
+            if limit is None:
+                objs = sorted(objs, key=sort_key)
+                return objs[:len(objs) - offset]
+            objs = heapq.nlargest(offset + limit, objs, key=sort_key)
+            return objs[offset:][::-1]
+        if limit is None:
+            return sorted(objs, key=sort_key)[offset:]
+        return heapq.nsmallest(offset + limit, objs, key=sort_key)[offset:]
+
+    def project(self, cls, fields, filters=None, order_by=("id",),
+                limit=None, offset=0, after=None, before=None):
+        """Return the values of fields of the objects query() would return.
+
+        Args:
+            cls (class or str): The class of the objects to query.
+            fields (iterable): The names of the attributes to return.
+            Other arguments are those of query().
+
+        Return:
+            List of dictionaries of field = value pairs, one per object;
+            attributes an object lacks are None.
+        """
+        fields = tuple(fields)
+        return [{name: getattr(obj, name, None) for name in fields}
+                for obj in self.query(cls, filters, order_by, limit, offset,
+                                      after, before)]
+
+    def iterate(self, cls, filters=None, order_by=("id",), batch=100,
+                load=()):
+        """Return a generator of the objects query() would return.
+
+        The objects are already in memory, so they are sorted once and
+        yielded one by one; batch is accepted for compatibility with
+        DBStorage.
+        """
+        yield from self.query(cls, filters, order_by, load=load)
+
     def new(self, obj):
         """Set in __objects obj with key <obj_class_name>.id."""
-        self.__objects["{}.{}".format(type(obj).__name__, obj.id)] = obj
+        self.__changed.add(self.__add(obj))
+        self.__touched.add(type(obj).__name__)
+
+    def bulk_new(self, objs, batch=1000):
+        """Add the objects of the iterable objs and save them once.
+
+        batch is accepted for compatibility with DBStorage. If iterating
+        objs raises, as on a record that cannot be read, the objects it
+        added are removed and those they replaced put back before the error
+        is raised, so that no later save writes half of the objects.
+
+        Return:
+            The number of objects added.
+        """
+        added = []
+        try:
+            for obj in objs:
+                key = "{}.{}".format(type(obj).__name__, obj.id)
+                added.append((key, self.get(type(obj), obj.id),
+                              key in self.__changed))
+                self.new(obj)
+        except BaseException:
+            for key, old, changed in reversed(added):
+                self.__remove(key)
+                if old is not None:
+                    self.__add(old)
+                if not changed:
+                    self.__changed.discard(key)
+            raise
+        self.save()
+        return len(added)
 
     def save(self):
-        """Serialize __objects to the JSON file __file_path."""
-        odict = {o: self.__objects[o].to_dict() for o in self.__objects.keys()}
-        with open(self.__file_path, "w", encoding="utf-8") as f:
-            json.dump(odict, f)
+        """Serialize __objects to the JSON file __file_path.
+
+        If journaling, only the objects changed since the last save are
+        appended to the log. The log is compacted into __file_path once
+        it holds more records than there are objects.
+        If async, the save is only queued for the background writer.
+        Nothing is saved between begin() and commit() or rollback().
+        """
+        FileStorage.__changes += 1
+        if self.__deferred:
+            return
+        if not self.__async:
+            self.__save()
+            return
+        if FileStorage.__writer is None:
+            FileStorage.__writer = Writer(self.__save)
+        FileStorage.__writer.request()
+
+    def flush(self):
+        """Block until every save() so far is written to disk.
+
+        Raises:
+            Exception: The error of a failed background save.
+        """
+        if FileStorage.__writer is not None:
+            FileStorage.__writer.flush()
+
+    def begin(self):
+        """Defer saves until commit() or rollback()."""
+        FileStorage.__deferred = True
+
+    def commit(self):
+        """Stop deferring saves and save the changes made since begin()."""
+        FileStorage.__deferred = False
+        self.save()
+
+    def rollback(self):
+        """Stop deferring saves and discard the changes since the last save.
+
+        __objects is replaced and reloaded from the files, so objects
+        created since are dropped and objects changed or deleted since are
+        read back as saved. Saves queued for the background writer are
+        written first.
+        """
+        FileStorage.__deferred = False
+        self.flush()
+        with self.__lock:
+            FileStorage.__objects = {}
+            FileStorage.__pending = {}
+            FileStorage.__changed = set()
+            FileStorage.__touched = set()
+        self.reload()
 
     def reload(self):
-        """Deserialize the JSON file __file_path to __objects, if it exists."""
-        try:
-            with open(self.__file_path, "r", encoding="utf-8") as f:
-                for o in json.load(f).values():
-                    name = o["__class__"]
-                    del o["__class__"]
-                    self.new(eval(name)(**o))
-        except FileNotFoundError:
-            pass
+        """Deserialize the JSON file __file_path to __objects, if it exists.
+
+        JSON files are parsed one record at a time, so only the records
+        being instantiated are held in memory besides __objects.
+        If the snapshot has an index, it is mapped into memory instead of
+        being parsed. If sharded, only the files of classes that changed
+        are read, or left to be read when needed if lazy.
+        If journaling, the log is then replayed on top of the snapshot.
+        Nothing is read if the files are unchanged since they were last
+        loaded or saved. Otherwise, only records whose updated_at differs
+        from the matching object in __objects are instantiated again, and
+        only the records appended to the log since are replayed if the
+        snapshot itself is unchanged.
+        Reloads wait for a background save being written. If shared, the
+        files are read under a shared lock, and only if their version
+        changed.
+        """
+        with self.__lock:
+            locker = self.__locker()
+            if locker is None:
+                self.__refresh()
+                return
+            with locker.shared():
+                version = locker.version()
+                if (version != FileStorage.__version or
+                        FileStorage.__loaded is not self.__objects):
+                    self.__refresh()
+                    FileStorage.__version = version
 
     def delete(self, obj=None):
         """Delete a given object from __objects, if it exists."""
         try:
-            del self.__objects["{}.{}".format(type(obj).__name__, obj.id)]
-        except (AttributeError, KeyError):
-            pass
+            key = "{}.{}".format(type(obj).__name__, obj.id)
+        except AttributeError:
+            return
+        if self.__remove(key) is not None:
+            FileStorage.__changes += 1
+            self.__changed.add(key)
+            self.__touched.add(type(obj).__name__)
+
+    def version(self):
+        """Return a number that changes whenever __objects may have changed.
+
+        It is bumped by save(), delete() and reloads that read the files.
+        """
+        return FileStorage.__changes
+
+    def stamp(self, cls):
+        """Return the number of objects of cls and their latest updated_at.
+
+        The pair changes whenever an object of cls is created, updated or
+        deleted, and is the same in every process that loaded the same
+        files. It is computed once per version().
+        """
+        if type(cls) != str:
+            cls = cls.__name__
+        version, stamp = self.__stamps.get(cls, (None, None))
+        if version != FileStorage.__changes:
+            objs = self.all(cls).values()
+            stamp = (len(objs), max((o.updated_at for o in objs),
+                                    default=None))
+            self.__stamps[cls] = (FileStorage.__changes, stamp)
+        return stamp
 
     def close(self):
-        """Call the reload method."""
+        """Call the reload method.
+
+        This is cheap when __file_path has not changed since the last
+        load or save.
+        """
         self.reload()
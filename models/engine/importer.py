@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+"""Imports objects from JSON Lines or CSV files into storage.
+
+Usage: python3 -m models.engine.importer <class> <file> [<file> ...]
+
+Files ending in .csv are read as CSV with a header row of attribute names;
+any other file is read as JSON Lines, one object dictionary per line, as
+written by to_dict(). Objects are added through storage.bulk_new(), and
+write() exports them back to JSON Lines.
+"""
+import csv
+import json
+import sys
+from time import perf_counter
+from models import storage
+from models.amenity import Amenity
+from models.base_model import BaseModel
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+classes = {"BaseModel": BaseModel, "User": User, "State": State,
+           "City": City, "Amenity": Amenity, "Place": Place,
+           "Review": Review}
+
+
+def records(cls, path):
+    """Return a generator of the attribute dictionaries of a file.
+
+    CSV values are all strings: empty values are left out, and values of
+    Integer and Float columns of cls are converted.
+
+    Args:
+        cls (class): The class of the objects in the file.
+        path (str): The name of the JSON Lines or CSV file.
+
+    Raises:
+        ValueError: If a line of a JSON Lines file is not a JSON object.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if not path.endswith(".csv"):
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("record is not an object")
+                    yield record
+            return
+        columns = getattr(cls, "__table__", None)
+        for row in csv.DictReader(f):
+            record = {}
+            for key, value in row.items():
+                if value == "":
+                    continue
+                column = None
+                if columns is not None:
+                    column = columns.columns.get(key)
+                if column is not None:
+                    kind = column.type.python_type
+                    if kind in (int, float):
+                        value = kind(value)
+                record[key] = value
+            yield record
+
+
+def objects(cls, path):
+    """Return a generator of the objects of type cls read from a file."""
+    for record in records(cls, path):
+        record.pop("__class__", None)
+        yield cls(**record)
+
+
+def write(objs, path):
+    """Write the objects of the iterable objs to a JSON Lines file.
+
+    Return:
+        The number of objects written.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for obj in objs:
+            f.write(json.dumps(obj.to_dict()) + "\n")
+            count += 1
+    return count
+
+
+def main(argv):
+    """Import the files of argv into storage and report the throughput."""
+    if len(argv) < 2 or argv[0] not in classes:
+        print(__doc__.splitlines()[2])
+        return 1
+    cls = classes[argv[0]]
+    for path in argv[1:]:
+        start = perf_counter()
+        count = storage.bulk_new(objects(cls, path))
+        elapsed = perf_counter() - start
+        print("{}: {} objects in {:.2f} s ({:.0f} objects/sec)".format(
+            path, count, elapsed, count / elapsed if elapsed else 0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""Defines the Journal class."""
+import json
+import os
+from models.engine.json_stream import loads
+
+
+class Journal:
+    """Represent an append-only log of changes to a storage snapshot.
+
+    Each line of the log is a JSON object {"key": <key>, "obj": <dict>}
+    for a created or updated object, or {"key": <key>, "obj": null}
+    for a deleted object. Replaying the log in order on top of the
+    snapshot it was started from yields the current state.
+
+    Attributes:
+        path (str): The name of the log file.
+        records (int): The number of records in the log file.
+        offset (int): The size of the log file when last replayed or
+            appended to.
+    """
+
+    def __init__(self, path):
+        """Initialize a new Journal.
+
+        Args:
+            path (str): The name of the log file.
+        """
+        self.path = path
+        self.records = 0
+        self.offset = 0
+
+    def __len__(self):
+        """Return the number of records in the log file."""
+        return self.records
+
+    def append(self, changes):
+        """Append changes to the log and flush them to disk.
+
+        Args:
+            changes (list): (key, text) pairs of a key and the JSON text
+                of its object, with a text of None marking a deleted object.
+        """
+        if not changes:
+            return
+        lines = "".join('{{"key": {}, "obj": {}}}\n'.format(
+            json.dumps(k), "null" if o is None else o) for k, o in changes)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+            self.offset = f.tell()
+        self.records += len(changes)
+
+    def replay(self, offset=0):
+        """Yield the (key, dict) records of the log in order.
+
+        A partially written last line, left by a crash in the middle of
+        an append, is ignored and cut off so later appends stay readable.
+
+        Args:
+            offset (int): The position to replay from, such as the offset
+                of a previous replay to only read records appended since.
+        """
+        if offset == 0:
+            self.records = 0
+        size = offset
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError
+                        record = loads(line)
+                    except ValueError:
+                        break
+                    size += len(line)
+                    self.records += 1
+                    yield record["key"], record["obj"]
+            if size != os.path.getsize(self.path):
+                os.truncate(self.path, size)
+        except FileNotFoundError:
+            size = 0
+        self.offset = size
+
+    def truncate(self):
+        """Empty the log once its records are part of the snapshot."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.records = 0
+        self.offset = 0
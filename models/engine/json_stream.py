@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+"""Defines a streaming reader for JSON objects stored in files.
+
+If the optional orjson package is installed, it is used to decode
+records written one per line, the way FileStorage writes them.
+"""
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NONSPACE = re.compile(r"[^ \t\n\r]")
+decoder = json.JSONDecoder()
+
+
+def loads(s):
+    """Decode the JSON document s, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def iter_items(f, size=1 << 20):
+    """Yield the (key, value) pairs of the JSON object in file f one by one.
+
+    Only a chunk of about size characters and the current record are held
+    in memory at a time.
+
+    Args:
+        f (file): A text file holding a JSON object.
+        size (int): The number of characters to read at a time.
+
+    Raises:
+        ValueError: If f does not hold a JSON object.
+    """
+    reader = Reader(f, size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.decode()
+        if type(key) != str:
+            raise ValueError("Expecting a string key")
+        reader.expect(":")
+        yield key, reader.value()
+        reader.expect(",}")
+        if reader.buf[reader.pos - 1] == "}":
+            return
+
+
+class Reader:
+    """Represent a buffered cursor over a JSON text file.
+
+    Attributes:
+        f (file): The text file being read.
+        size (int): The number of characters to read at a time.
+        buf (str): The characters read but not yet dropped.
+        pos (int): The position of the cursor in buf.
+        eof (bool): Whether the end of f was reached.
+        fast (bool): Whether to try decoding values up to the end of their
+            line with orjson.
+    """
+
+    def __init__(self, f, size):
+        """Initialize a new Reader.
+
+        Args:
+            f (file): The text file to read.
+            size (int): The number of characters to read at a time.
+        """
+        self.f = f
+        self.size = size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.fast = orjson is not None
+
+    def fill(self):
+        """Read the next chunk of f into buf, dropping consumed characters.
+
+        Returns False at the end of f.
+        """
+        if self.eof:
+            return False
+        chunk = self.f.read(self.size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or '' at the end."""
+        while True:
+            match = NONSPACE.search(self.buf, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return self.buf[self.pos]
+            self.pos = len(self.buf)
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        """Skip whitespace and consume one of chars.
+
+        Raises:
+            ValueError: If the next character is not one of chars.
+        """
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError("Expecting one of {!r} at {!r}".format(
+                chars, self.buf[self.pos:self.pos + 20]))
+        self.pos += 1
+
+    def value(self):
+        """Decode and consume the next JSON value.
+
+        If the value is alone on the rest of its line, up to a trailing
+        comma, it is decoded with orjson when available.
+
+        Raises:
+            ValueError: If the next characters are not a JSON value.
+        """
+        self.peek()
+        if self.fast:
+            end = self.buf.find("\n", self.pos)
+            if end != -1:
+                line = self.buf[self.pos:end].rstrip()
+                if line.endswith(","):
+                    line = line[:-1]
+                try:
+                    obj = orjson.loads(line)
+                    self.pos += len(line)
+                    return obj
+                except ValueError:
+                    self.fast = False
+        return self.decode()
+
+    def decode(self):
+        """Decode and consume the next JSON value with the json module.
+
+        Raises:
+            ValueError: If the next characters are not a JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.buf, self.pos)
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except ValueError:
+                if self.eof:
+                    raise
+            self.fill()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""Defines the ObjectCache class."""
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+
+class ObjectCache:
+    """Represent a thread-safe LRU cache whose entries expire.
+
+    Keys are (<class name>, <id>) pairs, or (<class name>, None) for a
+    listing of the whole class, so that the entries of a class can be
+    invalidated together.
+
+    Attributes:
+        size (int): The maximum number of entries; 0 disables the cache.
+        ttl (float): The number of seconds an entry is kept.
+        hits (int): The number of get() calls answered by the cache.
+        misses (int): The number of get() calls that were not.
+    """
+
+    def __init__(self, size, ttl):
+        """Initialize a new ObjectCache.
+
+        Args:
+            size (int): The maximum number of entries.
+            ttl (float): The number of seconds an entry is kept.
+        """
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries, expired or not."""
+        return len(self.__entries)
+
+    def get(self, key):
+        """Return the value of key, or None if missing or expired."""
+        if not self.size:
+            return None
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= monotonic():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        """Set the value of key, evicting the least recently used entry."""
+        if not self.size:
+            return
+        with self.__lock:
+            self.__entries[key] = (monotonic() + self.ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, name, id=None):
+        """Drop the listing of class name and, if given, the entry of id."""
+        with self.__lock:
+            self.__entries.pop((name, None), None)
+            if id is not None:
+                self.__entries.pop((name, id), None)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+"""Defines the RecordIndex class."""
+import json
+import mmap
+import os
+import re
+from models.engine.json_stream import loads
+
+
+class RecordIndex:
+    """Represent an on-disk index of the records of a JSON snapshot.
+
+    The index file starts with a line holding the (inode, size, mtime) of
+    the snapshot it was built for and a line holding the number of records
+    of each class. Each following line is "<key> <offset> <length>", giving
+    the byte range of the JSON text of a record in the snapshot, sorted by
+    key. Keys may hold spaces, since lines are split from the right; their
+    backslashes and newlines are escaped as in Python strings. Both files
+    are memory-mapped, so a lookup bisects the index and decodes a single
+    record without reading the rest of either file.
+
+    Attributes:
+        path (str): The name of the index file.
+        data_path (str): The name of the snapshot file.
+        counts (dict): The number of records of each class.
+    """
+
+    header = "HBNB-INDEX"
+
+    def __init__(self, path, data_path):
+        """Open the index of a snapshot.
+
+        Args:
+            path (str): The name of the index file.
+            data_path (str): The name of the snapshot file.
+
+        Raises:
+            ValueError: If the index is missing or was not built for the
+                current snapshot.
+        """
+        self.path = path
+        self.data_path = data_path
+        try:
+            with open(path, "rb") as f:
+                self.__index = mmap.mmap(f.fileno(), 0,
+                                         access=mmap.ACCESS_READ)
+            with open(data_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                self.__data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            raise ValueError("No index for {}".format(data_path))
+        first = self.__index.find(b"\n")
+        second = self.__index.find(b"\n", first + 1)
+        stamp = "{} {} {} {}".format(self.header, st.st_ino, st.st_size,
+                                     st.st_mtime_ns).encode()
+        if first == -1 or second == -1 or self.__index[:first] != stamp:
+            self.close()
+            raise ValueError("Stale index for {}".format(data_path))
+        self.counts = json.loads(self.__index[first + 1:second])
+        self.__base = second + 1
+
+    @classmethod
+    def write(cls, path, data_path, entries):
+        """Atomically write the index of a snapshot.
+
+        Args:
+            path (str): The name of the index file.
+            data_path (str): The name of the snapshot file.
+            entries (list): (key, offset, length) tuples of its records.
+        """
+        st = os.stat(data_path)
+        counts = {}
+        for key, offset, length in entries:
+            name = key.partition(".")[0]
+            counts[name] = counts.get(name, 0) + 1
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("{} {} {} {}\n".format(cls.header, st.st_ino, st.st_size,
+                                           st.st_mtime_ns))
+            f.write(json.dumps(counts) + "\n")
+            f.writelines("{} {} {}\n".format(*e) for e in sorted(
+                (cls.__escape(key), offset, length)
+                for key, offset, length in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @staticmethod
+    def __escape(key):
+        """Return key with its backslashes and newlines escaped."""
+        return key.replace("\\", "\\\\").replace("\n", "\\n")
+
+    @staticmethod
+    def __unescape(key):
+        """Return the key escaped by __escape()."""
+        return re.sub(r"\\(.)", lambda m: "\n" if m.group(1) == "n"
+                      else m.group(1), key)
+
+    def close(self):
+        """Unmap the index and snapshot files."""
+        self.__index.close()
+        self.__data.close()
+
+    def __line(self, pos):
+        """Return the (start, end) of the index line holding byte pos."""
+        start = self.__index.rfind(b"\n", self.__base - 1, pos) + 1
+        return start, self.__index.find(b"\n", start)
+
+    def __bisect(self, key):
+        """Return the start of the first index line not sorted before key."""
+        key = self.__escape(key).encode()
+        lo, hi = self.__base, len(self.__index)
+        while lo < hi:
+            start, end = self.__line((lo + hi) // 2)
+            if self.__index[start:end].rsplit(b" ", 2)[0] < key:
+                lo = end + 1
+            else:
+                hi = start
+        return lo
+
+    def __contains__(self, key):
+        """Return whether key has a record in the snapshot."""
+        return self.find(key) is not None
+
+    def find(self, key):
+        """Return the (offset, length) of the record of key, or None."""
+        start = self.__bisect(key)
+        end = self.__index.find(b"\n", start)
+        if end == -1:
+            return None
+        k, offset, length = self.__index[start:end].rsplit(b" ", 2)
+        if self.__unescape(k.decode()) != key:
+            return None
+        return int(offset), int(length)
+
+    def __scan(self, name):
+        """Yield the (key, offset, length) of the records of class name."""
+        prefix = self.__escape(name + ".")
+        pos = self.__bisect(name + ".")
+        while True:
+            end = self.__index.find(b"\n", pos)
+            if end == -1:
+                return
+            key, offset, length = self.__index[pos:end].rsplit(b" ", 2)
+            key = key.decode()
+            if not key.startswith(prefix):
+                return
+            yield self.__unescape(key), int(offset), int(length)
+            pos = end + 1
+
+    def keys(self, name):
+        """Yield the keys of the records of class name in index order."""
+        for key, offset, length in self.__scan(name):
+            yield key
+
+    def items(self, name):
+        """Yield the (key, JSON text) of the records of class name."""
+        for key, offset, length in self.__scan(name):
+            yield key, self.__data[offset:offset + length].decode()
+
+    def text(self, key):
+        """Return the JSON text of the record of key, or None."""
+        found = self.find(key)
+        if found is None:
+            return None
+        offset, length = found
+        return self.__data[offset:offset + length].decode()
+
+    def read(self, key):
+        """Return the decoded record of key, or None."""
+        text = self.text(key)
+        return None if text is None else loads(text)
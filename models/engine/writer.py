@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""Defines the Writer class."""
+import atexit
+import threading
+
+
+class Writer:
+    """Represent a background thread running coalesced saves.
+
+    request() only counts a save and wakes the thread, which then runs
+    one save for every request made since its last save started, so
+    back-to-back requests are written to disk once.
+
+    Attributes:
+        save (callable): The function writing the storage to disk.
+    """
+
+    def __init__(self, save):
+        """Initialize a new Writer and start its thread.
+
+        Args:
+            save (callable): The function writing the storage to disk.
+        """
+        self.save = save
+        self.__cond = threading.Condition()
+        self.__requested = 0
+        self.__written = 0
+        self.__error = None
+        thread = threading.Thread(target=self.__run, name="Writer",
+                                  daemon=True)
+        thread.start()
+        atexit.register(self.flush)
+
+    def request(self):
+        """Request a save without waiting for it."""
+        with self.__cond:
+            self.__requested += 1
+            self.__cond.notify_all()
+
+    def flush(self):
+        """Block until every save requested so far is written.
+
+        Raises:
+            Exception: The error of a failed save since the last flush.
+        """
+        with self.__cond:
+            target = self.__requested
+            while self.__written < target:
+                self.__cond.wait()
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def __run(self):
+        """Run a save whenever saves were requested since the last one."""
+        while True:
+            with self.__cond:
+                while self.__written == self.__requested:
+                    self.__cond.wait()
+                target = self.__requested
+            error = None
+            try:
+                self.save()
+            except Exception as e:
+                error = e
+            with self.__cond:
+                self.__written = target
+                if error is not None:
+                    self.__error = error
+                self.__cond.notify_all()
@@ -65,22 +65,19 @@ class Place(BaseModel, Base):
         @property
         def reviews(self):
             """Get a list of all linked Reviews."""
-            review_list = []
-            for review in list(models.storage.all(Review).values()):
-                if review.place_id == self.id:
-                    review_list.append(review)
-            return review_list
+            return models.storage.lookup(Review, "place_id", self.id)
 
         @property
         def amenities(self):
             """Get/set linked Amenities."""
             amenity_list = []
-            for amenity in list(models.storage.all(Amenity).values()):
-                if amenity.id in self.amenity_ids:
+            for amenity_id in dict.fromkeys(self.amenity_ids):
+                amenity = models.storage.get(Amenity, amenity_id)
+                if amenity is not None:
                     amenity_list.append(amenity)
             return amenity_list
 
         @amenities.setter
         def amenities(self, value):
             if type(value) == Amenity:
-                self.amenity_ids.append(value.id)
+                self.amenity_ids = self.amenity_ids + [value.id]
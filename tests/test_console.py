@@ -215,6 +215,125 @@ class TestHBNBCommand(unittest.TestCase):
             self.HBNB.onecmd("all State")
             self.assertEqual("[]\n", f.getvalue())
 
+    @unittest.skipIf(type(models.storage) == DBStorage, "Testing DBStorage")
+    def test_all_query(self):
+        """Test all command input with filters, ordering and paging."""
+        ids = []
+        for name in ("Ohio", "Iowa", "Utah"):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd('create State name="{}"'.format(name))
+                ids.append(f.getvalue().strip())
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd('all State name="Iowa"')
+            self.assertIn(ids[1], f.getvalue())
+            self.assertNotIn(ids[0], f.getvalue())
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd("all State order_by=name limit=1 offset=1")
+            self.assertIn(ids[0], f.getvalue())
+            self.assertNotIn(ids[1], f.getvalue())
+            self.assertNotIn(ids[2], f.getvalue())
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd('all State foo name="Iowa" =x')
+            self.assertIn(ids[1], f.getvalue())
+            self.assertNotIn(ids[0], f.getvalue())
+
+    def test_all_query_errors(self):
+        """Test all command errors on bad filters, ordering and paging."""
+        for key in ("limit", "offset"):
+            for value in ("x", "-1"):
+                with patch("sys.stdout", new=StringIO()) as f:
+                    self.HBNB.onecmd("all State {}={}".format(key, value))
+                    self.assertEqual("** invalid {} **\n".format(key),
+                                     f.getvalue())
+        for args in ("order_by=bogus", "order_by=name,bogus", "bogus=1"):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd("all State " + args)
+                self.assertEqual("** attribute doesn't exist **\n",
+                                 f.getvalue())
+
+    def test_transaction_errors(self):
+        """Test begin, commit and rollback command errors."""
+        for command in ("commit", "rollback"):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd(command)
+                self.assertEqual("** no transaction **\n", f.getvalue())
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd("begin")
+            self.HBNB.onecmd("begin")
+            self.HBNB.onecmd("commit")
+            self.assertEqual("** transaction already begun **\n",
+                             f.getvalue())
+
+    @unittest.skipIf(type(models.storage) == DBStorage, "Testing DBStorage")
+    def test_batch(self):
+        """Test that a batch is saved once, whatever commands it holds."""
+        commands = ("create State\ncreate State\nbegin\ncreate State\n"
+                    "commit\nrollback\ncreate State\n")
+        with patch("sys.stdin", new=StringIO(commands)), \
+                patch("sys.stdout", new=StringIO()) as f, \
+                patch.object(FileStorage, "_FileStorage__save") as save:
+            HBNBCommand().batch()
+        save.assert_called_once_with()
+        self.assertIn("** transaction already begun **", f.getvalue())
+        self.assertEqual(f.getvalue().count("** no transaction **"), 2)
+
+    @unittest.skipIf(type(models.storage) == DBStorage, "Testing DBStorage")
+    def test_begin_commit(self):
+        """Test that commands between begin and commit are saved once."""
+        with patch("sys.stdout", new=StringIO()):
+            self.HBNB.onecmd("begin")
+            self.HBNB.onecmd('create State name="Iowa"')
+            self.HBNB.onecmd('create State name="Utah"')
+            self.assertFalse(os.path.exists("file.json"))
+            self.HBNB.onecmd("commit")
+        self.assertTrue(os.path.exists("file.json"))
+
+    def test_import_export_errors(self):
+        """Test import and export command errors."""
+        for command in ("import", "export"):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd(command)
+                self.assertEqual("** class name missing **\n", f.getvalue())
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd(command + " asdfsdfsd x.jsonl")
+                self.assertEqual("** class doesn't exist **\n",
+                                 f.getvalue())
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd(command + " State")
+                self.assertEqual("** file name missing **\n", f.getvalue())
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd("import State nonexistent.jsonl")
+            self.assertEqual("** can't read file **\n", f.getvalue())
+        try:
+            count = models.storage.count("State")
+            with open("test_states.jsonl", "w") as f:
+                f.write('{"name": "Iowa"}\n{"name": "Utah"}\n[1, 2]\n')
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd("import State test_states.jsonl")
+                self.assertEqual("** invalid record **\n", f.getvalue())
+            self.assertEqual(models.storage.count("State"), count)
+        finally:
+            os.remove("test_states.jsonl")
+
+    @unittest.skipIf(type(models.storage) == DBStorage, "Testing DBStorage")
+    def test_import_export(self):
+        """Test that export and import round-trip objects."""
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.HBNB.onecmd('create State name="Iowa"')
+            st = f.getvalue().strip()
+        try:
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd("export State test_states.jsonl")
+                self.assertRegex(f.getvalue(), r"^1 objects in .*/sec\)\n$")
+            models.storage.delete(models.storage.get("State", st))
+            self.assertIsNone(models.storage.get("State", st))
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.HBNB.onecmd("import State test_states.jsonl")
+                self.assertRegex(f.getvalue(), r"^1 objects in ")
+            self.assertEqual(models.storage.get("State", st).name, "Iowa")
+        finally:
+            os.remove("test_states.jsonl")
+
     @unittest.skipIf(type(models.storage) == DBStorage, "Testing DBStorage")
     def test_update(self):
         """Test update command input."""
@@ -109,6 +109,16 @@ class TestBaseModel(unittest.TestCase):
         with open("file.json", "r") as f:
             self.assertIn("BaseModel.{}".format(self.base.id), f.read())
 
+    def test_dirty(self):
+        """Test that attribute assignment marks the instance dirty."""
+        bm = BaseModel()
+        self.assertTrue(bm._dirty)
+        bm.__dict__["_dirty"] = False
+        bm.name = "Holberton"
+        self.assertTrue(bm._dirty)
+        self.assertNotIn("_dirty", bm.to_dict())
+        self.assertNotIn("_dirty", bm.__str__())
+
     def test_to_dict(self):
         """Test to_dict method."""
         base_dict = self.base.to_dict()
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+"""Defines unnittests for models/engine/codecs.py."""
+import os
+import io
+import pep8
+import pickle
+import unittest
+from datetime import datetime
+from models.base_model import BaseModel
+from models.engine import codecs
+from models.engine.codecs import BinaryCodec
+from models.engine.codecs import JSONCodec
+from models.engine.codecs import Unpickler
+from models.engine.codecs import codec_for
+from models.engine.codecs import codec_named
+from models.engine.codecs import convert
+from models.state import State
+
+
+class TestCodecs(unittest.TestCase):
+    """Unittests for testing the snapshot formats."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build test records of two shapes."""
+        st = State(name="California")
+        st.created_at = datetime(2019, 3, 1, 12, 0, 0)
+        bm = BaseModel(my_number=89, floats=[1.5, None])
+        cls.records = [("State." + st.id, st.to_dict()),
+                       ("BaseModel." + bm.id, bm.to_dict())]
+
+    def tearDown(self):
+        """Delete any converted snapshots."""
+        for path in ("test_codecs.json", "test_codecs.bin"):
+            try:
+                os.remove(path)
+            except IOError:
+                pass
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/codecs.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(codecs.__doc__)
+        self.assertIsNotNone(codec_for.__doc__)
+        self.assertIsNotNone(codec_named.__doc__)
+        self.assertIsNotNone(convert.__doc__)
+        self.assertIsNotNone(Unpickler.find_class.__doc__)
+        for codec in (JSONCodec, BinaryCodec):
+            self.assertIsNotNone(codec.__doc__)
+            self.assertIsNotNone(codec.open.__doc__)
+            self.assertIsNotNone(codec.encode.__doc__)
+            self.assertIsNotNone(codec.dump.__doc__)
+            self.assertIsNotNone(codec.load.__doc__)
+
+    def round_trip(self, codec):
+        """Return the records after dumping and loading them with codec."""
+        f = io.StringIO() if isinstance(codec, JSONCodec) else io.BytesIO()
+        codec.dump(f, ((k, codec.encode(d)) for k, d in self.records))
+        f.seek(0)
+        return list(codec.load(f))
+
+    def test_json(self):
+        """Test the JSON format."""
+        self.assertEqual(self.round_trip(JSONCodec()), self.records)
+
+    def test_binary(self):
+        """Test the binary format."""
+        self.assertEqual(sorted(self.round_trip(BinaryCodec())),
+                         sorted(self.records))
+
+    def test_binary_layout(self):
+        """Test that binary rows have integer timestamps."""
+        name, fields, values = BinaryCodec().encode(self.records[0][1])
+        self.assertEqual(name, "State")
+        self.assertNotIn("__class__", fields)
+        stamp = values[fields.index("created_at")]
+        self.assertEqual(type(stamp), int)
+
+    def test_binary_invalid(self):
+        """Test loading files that are not binary snapshots."""
+        with self.assertRaises(ValueError):
+            list(BinaryCodec().load(io.BytesIO(b"{}")))
+        f = io.BytesIO(BinaryCodec.magic + pickle.dumps(datetime.now()))
+        with self.assertRaises(ValueError):
+            list(BinaryCodec().load(f))
+
+    def test_codec_for(self):
+        """Test codec_for function."""
+        self.assertIsInstance(codec_for("file.json"), JSONCodec)
+        self.assertIsInstance(codec_for("file.bin"), BinaryCodec)
+        with self.assertRaises(ValueError):
+            codec_for("file.txt")
+
+    def test_codec_named(self):
+        """Test codec_named function."""
+        self.assertIsInstance(codec_named("json"), JSONCodec)
+        self.assertIsInstance(codec_named("binary"), BinaryCodec)
+        with self.assertRaisesRegex(ValueError, "binary, json"):
+            codec_named("yaml")
+
+    def test_convert(self):
+        """Test converting between formats."""
+        codec = JSONCodec()
+        with codec.open("test_codecs.json", "w") as f:
+            codec.dump(f, ((k, codec.encode(d)) for k, d in self.records))
+        convert("test_codecs.json", "test_codecs.bin")
+        os.remove("test_codecs.json")
+        convert("test_codecs.bin", "test_codecs.json")
+        with codec.open("test_codecs.json", "r") as f:
+            self.assertEqual(sorted(codec.load(f)), sorted(self.records))
+
+
+if __name__ == "__main__":
+    unittest.main()
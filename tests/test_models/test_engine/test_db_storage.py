@@ -14,6 +14,8 @@ from models.place import Place
 from models.review import Review
 from models.engine.db_storage import DBStorage
 from models.engine.file_storage import FileStorage
+from models.engine.object_cache import ObjectCache
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 from sqlalchemy.engine.base import Engine
@@ -83,6 +85,18 @@ class TestDBStorage(unittest.TestCase):
         self.assertIsNotNone(DBStorage.__doc__)
         self.assertIsNotNone(DBStorage.__init__.__doc__)
         self.assertIsNotNone(DBStorage.all.__doc__)
+        self.assertIsNotNone(DBStorage.count.__doc__)
+        self.assertIsNotNone(DBStorage.get.__doc__)
+        self.assertIsNotNone(DBStorage.query.__doc__)
+        self.assertIsNotNone(DBStorage.project.__doc__)
+        self.assertIsNotNone(DBStorage.iterate.__doc__)
+        self.assertIsNotNone(DBStorage.bulk_new.__doc__)
+        self.assertIsNotNone(DBStorage.begin.__doc__)
+        self.assertIsNotNone(DBStorage.commit.__doc__)
+        self.assertIsNotNone(DBStorage.rollback.__doc__)
+        self.assertIsNotNone(DBStorage.cache_info.__doc__)
+        self.assertIsNotNone(DBStorage.version.__doc__)
+        self.assertIsNotNone(DBStorage.stamp.__doc__)
         self.assertIsNotNone(DBStorage.new.__doc__)
         self.assertIsNotNone(DBStorage.save.__doc__)
         self.assertIsNotNone(DBStorage.delete.__doc__)
@@ -99,6 +113,18 @@ class TestDBStorage(unittest.TestCase):
         """Check for methods."""
         self.assertTrue(hasattr(DBStorage, "__init__"))
         self.assertTrue(hasattr(DBStorage, "all"))
+        self.assertTrue(hasattr(DBStorage, "count"))
+        self.assertTrue(hasattr(DBStorage, "get"))
+        self.assertTrue(hasattr(DBStorage, "query"))
+        self.assertTrue(hasattr(DBStorage, "project"))
+        self.assertTrue(hasattr(DBStorage, "iterate"))
+        self.assertTrue(hasattr(DBStorage, "bulk_new"))
+        self.assertTrue(hasattr(DBStorage, "begin"))
+        self.assertTrue(hasattr(DBStorage, "commit"))
+        self.assertTrue(hasattr(DBStorage, "rollback"))
+        self.assertTrue(hasattr(DBStorage, "cache_info"))
+        self.assertTrue(hasattr(DBStorage, "version"))
+        self.assertTrue(hasattr(DBStorage, "stamp"))
         self.assertTrue(hasattr(DBStorage, "new"))
         self.assertTrue(hasattr(DBStorage, "save"))
         self.assertTrue(hasattr(DBStorage, "delete"))
@@ -118,6 +144,239 @@ class TestDBStorage(unittest.TestCase):
         self.assertEqual(type(obj), dict)
         self.assertEqual(len(obj), 6)
 
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_all_concurrent(self):
+        """Test all method with classes queried concurrently."""
+        self.storage._DBStorage__parallel = True
+        try:
+            obj = self.storage.all()
+        finally:
+            self.storage._DBStorage__parallel = False
+        self.assertEqual(len(obj), 6)
+        self.assertIs(obj["State." + self.state.id], self.state)
+        self.assertIs(obj["Review." + self.review.id], self.review)
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_all_load(self):
+        """Test that all method loads the relationships it is given."""
+        engine = self.storage._DBStorage__engine
+        queries = []
+
+        def count(*args):
+            queries.append(args)
+
+        self.storage._DBStorage__session.expire_all()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            obj = self.storage.all(Place, load=("user", "amenities",
+                                                "reviews.user"))
+            place = obj["Place." + self.place.id]
+            self.assertEqual(place.user.id, self.user.id)
+            self.assertEqual(place.amenities, [])
+            self.assertEqual(place.reviews[0].user.id, self.user.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        self.assertEqual(len(queries), 3)
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_query(self):
+        """Test query method ordering, filtering and paging."""
+        session = self.storage._DBStorage__session
+        sts = [State(name=name) for name in
+               ("Colorado", "Alabama", "Delaware", "Alabama")]
+        session.add_all(sts)
+        session.commit()
+        try:
+            objs = self.storage.query(State, {"name": "Alabama"})
+            self.assertEqual(objs, sorted(sts[1::2], key=lambda o: o.id))
+            objs = self.storage.query("State", order_by=("name",))
+            self.assertEqual(objs, sorted(self.storage.all(State).values(),
+                                          key=lambda o: (o.name, o.id)))
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      offset=1)
+            self.assertEqual(page, objs[1:3])
+            last = page[-1]
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      after=(last.name, last.id))
+            self.assertEqual(page, objs[3:5])
+            first = page[0]
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      before=(first.name, first.id))
+            self.assertEqual(page, objs[1:3])
+        finally:
+            for st in sts:
+                session.delete(st)
+            session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_project(self):
+        """Test that project selects the fields of the queried objects."""
+        session = self.storage._DBStorage__session
+        sts = [State(name=name) for name in ("Colorado", "Alabama")]
+        session.add_all(sts)
+        session.commit()
+        try:
+            rows = self.storage.project(State, ("id", "name"),
+                                        order_by=("name",), limit=2)
+            objs = self.storage.query(State, order_by=("name",), limit=2)
+            self.assertEqual(rows, [{"id": o.id, "name": o.name}
+                                    for o in objs])
+            rows = self.storage.project("State", ("name",),
+                                        {"id": sts[0].id})
+            self.assertEqual(rows, [{"name": "Colorado"}])
+            with self.assertRaises(KeyError):
+                self.storage.project(State, ("cities",))
+        finally:
+            for st in sts:
+                session.delete(st)
+            session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_iterate(self):
+        """Test that iterate method queries objects batch by batch."""
+        session = self.storage._DBStorage__session
+        sts = [State(name=name) for name in
+               ("Colorado", "Alabama", "Delaware", "Alabama")]
+        session.add_all(sts)
+        session.commit()
+        try:
+            objs = self.storage.iterate(State, order_by=("name",), batch=2)
+            self.assertNotIsInstance(objs, list)
+            self.assertEqual(list(objs), self.storage.query(
+                State, order_by=("name",)))
+        finally:
+            for st in sts:
+                session.delete(st)
+            session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_bulk_new(self):
+        """Test that bulk_new inserts objects in batches, parents first."""
+        session = self.storage._DBStorage__session
+        sts = [State(name="Bulk {}".format(i)) for i in range(3)]
+        cts = [City(name="Bulk", state_id=st.id) for st in sts]
+        objs = [cts[0], sts[0], cts[1], sts[1], sts[2], cts[2]]
+        self.assertEqual(self.storage.bulk_new(iter(objs), batch=2), 6)
+        try:
+            for st in sts:
+                self.assertEqual(self.storage.get(State, st.id).name,
+                                 st.name)
+            self.assertEqual(len(self.storage.query(City,
+                                                    {"name": "Bulk"})), 3)
+        finally:
+            for ct in self.storage.query(City, {"name": "Bulk"}):
+                session.delete(ct)
+            for st in sts:
+                session.delete(self.storage.get(State, st.id))
+            session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_bulk_new_integrity(self):
+        """Test that bulk_new rolls back batches breaking constraints."""
+        session = self.storage._DBStorage__session
+        st = State(name="Bulk")
+        self.assertEqual(self.storage.bulk_new([st]), 1)
+        try:
+            with self.assertRaises(ValueError):
+                self.storage.bulk_new([State(id=st.id, name="Bulk")])
+            with self.assertRaises(ValueError):
+                self.storage.bulk_new([City(name="Bulk")])
+            self.assertEqual(len(self.storage.query(State,
+                                                    {"name": "Bulk"})), 1)
+            self.assertEqual(self.storage.query(City, {"name": "Bulk"}), [])
+        finally:
+            session.delete(self.storage.get(State, st.id))
+            session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_begin_rollback(self):
+        """Test that saves between begin and rollback are not committed."""
+        st = State(name="Deferred")
+        self.storage.begin()
+        try:
+            self.storage.new(st)
+            self.storage.save()
+            self.assertIs(self.storage.get(State, st.id), st)
+            self.storage.rollback()
+        finally:
+            self.storage._DBStorage__deferred = False
+        self.assertIsNone(self.storage.get(State, st.id))
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_begin_commit(self):
+        """Test that commit commits the saves since begin."""
+        st = State(name="Deferred")
+        self.storage.begin()
+        self.storage.new(st)
+        self.storage.save()
+        self.storage.commit()
+        session = self.storage._DBStorage__session
+        self.assertFalse(session.in_transaction())
+        session.delete(st)
+        session.commit()
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_cache(self):
+        """Test that get and all read through the cache across sessions."""
+        session = self.storage._DBStorage__session
+        cache = DBStorage._DBStorage__cache
+        DBStorage._DBStorage__cache = ObjectCache(10, 60)
+        Session = sessionmaker(bind=self.storage._DBStorage__engine,
+                               expire_on_commit=False)
+        try:
+            for i in range(2):
+                self.storage._DBStorage__session = Session()
+                st = self.storage.get(State, self.state.id)
+                self.assertIsNot(st, self.state)
+                self.assertEqual(st.name, "California")
+                self.assertEqual(self.storage.all(State),
+                                 {"State." + st.id: st})
+                self.storage.close()
+            info = self.storage.cache_info()
+            self.assertEqual((info["hits"], info["misses"]), (2, 2))
+            self.storage._DBStorage__session = Session()
+            st = self.storage.get(State, self.state.id)
+            st.name = "Nevada"
+            self.storage.save()
+            self.storage.close()
+            self.storage._DBStorage__session = Session()
+            self.assertEqual(self.storage.get(State, st.id).name, "Nevada")
+            self.storage.get(State, st.id).name = "California"
+            self.storage.save()
+            self.storage.close()
+        finally:
+            self.storage._DBStorage__session = session
+            DBStorage._DBStorage__cache = cache
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_version(self):
+        """Test that saves change the version."""
+        version = self.storage.version()
+        self.assertEqual(self.storage.version(), version)
+        self.state.name = "California"
+        self.storage.save()
+        self.assertNotEqual(self.storage.version(), version)
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_stamp(self):
+        """Test that stamp counts a class and finds its latest update."""
+        for cls in (State, "City"):
+            objs = self.storage.all(cls).values()
+            self.assertEqual(self.storage.stamp(cls),
+                             (len(objs), max(o.updated_at for o in objs)))
+
     @unittest.skipIf(type(models.storage) == FileStorage,
                      "Testing FileStorage")
     def test_all_cls(self):
@@ -127,6 +386,22 @@ class TestDBStorage(unittest.TestCase):
         self.assertEqual(len(obj), 1)
         self.assertEqual(self.state, list(obj.values())[0])
 
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_count(self):
+        """Test count method."""
+        self.assertEqual(self.storage.count(), 6)
+        self.assertEqual(self.storage.count(State), 1)
+        self.assertEqual(self.storage.count("City"), 1)
+
+    @unittest.skipIf(type(models.storage) == FileStorage,
+                     "Testing FileStorage")
+    def test_get(self):
+        """Test get method."""
+        self.assertIs(self.storage.get(State, self.state.id), self.state)
+        self.assertIs(self.storage.get("City", self.city.id), self.city)
+        self.assertIsNone(self.storage.get(State, "1234"))
+
     @unittest.skipIf(type(models.storage) == FileStorage,
                      "Testing FileStorage")
     def test_new(self):
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/file_lock.py."""
+import fcntl
+import os
+import pep8
+import unittest
+from models.engine.file_lock import FileLock
+
+
+class TestFileLock(unittest.TestCase):
+    """Unittests for testing the FileLock class."""
+
+    def setUp(self):
+        """Open a FileLock on a fresh lock file."""
+        self.lock = FileLock("test.lock")
+
+    def tearDown(self):
+        """Close and delete the lock file."""
+        self.lock.close()
+        os.remove("test.lock")
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/file_lock.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(FileLock.__doc__)
+        self.assertIsNotNone(FileLock.__init__.__doc__)
+        self.assertIsNotNone(FileLock.shared.__doc__)
+        self.assertIsNotNone(FileLock.exclusive.__doc__)
+        self.assertIsNotNone(FileLock.version.__doc__)
+        self.assertIsNotNone(FileLock.bump.__doc__)
+
+    def test_version(self):
+        """Test that bump increments the version seen by other opens."""
+        self.assertEqual(self.lock.version(), 0)
+        with self.lock.exclusive():
+            self.assertEqual(self.lock.bump(), 1)
+            self.assertEqual(self.lock.bump(), 2)
+        other = FileLock("test.lock")
+        self.assertEqual(other.version(), 2)
+        other.close()
+
+    def test_exclusive(self):
+        """Test that an exclusive lock excludes other lock holders."""
+        fd = os.open("test.lock", os.O_RDWR)
+        try:
+            with self.lock.exclusive():
+                with self.assertRaises(BlockingIOError):
+                    fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            with self.lock.shared():
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
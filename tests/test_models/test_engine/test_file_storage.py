@@ -2,9 +2,11 @@
 """Defines unnittests for models/engine/file_storage.py."""
 import os
 import json
+import multiprocessing
 import pep8
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 from models.base_model import BaseModel
 from models.user import User
 from models.state import State
@@ -12,6 +14,7 @@ from models.city import City
 from models.amenity import Amenity
 from models.place import Place
 from models.review import Review
+from models.engine.codecs import codecs
 from models.engine.file_storage import FileStorage
 
 
@@ -88,9 +91,22 @@ class TestFileStorage(unittest.TestCase):
         """Check for docstrings."""
         self.assertIsNotNone(FileStorage.__doc__)
         self.assertIsNotNone(FileStorage.all.__doc__)
+        self.assertIsNotNone(FileStorage.count.__doc__)
+        self.assertIsNotNone(FileStorage.get.__doc__)
+        self.assertIsNotNone(FileStorage.lookup.__doc__)
+        self.assertIsNotNone(FileStorage.query.__doc__)
+        self.assertIsNotNone(FileStorage.project.__doc__)
+        self.assertIsNotNone(FileStorage.iterate.__doc__)
+        self.assertIsNotNone(FileStorage.bulk_new.__doc__)
+        self.assertIsNotNone(FileStorage.begin.__doc__)
+        self.assertIsNotNone(FileStorage.commit.__doc__)
+        self.assertIsNotNone(FileStorage.rollback.__doc__)
+        self.assertIsNotNone(FileStorage.version.__doc__)
+        self.assertIsNotNone(FileStorage.stamp.__doc__)
         self.assertIsNotNone(FileStorage.new.__doc__)
         self.assertIsNotNone(FileStorage.reload.__doc__)
         self.assertIsNotNone(FileStorage.delete.__doc__)
+        self.assertIsNotNone(FileStorage.flush.__doc__)
 
     def test_attributes(self):
         """Check for attributes."""
@@ -100,9 +116,22 @@ class TestFileStorage(unittest.TestCase):
     def test_methods(self):
         """Check for methods."""
         self.assertTrue(hasattr(FileStorage, "all"))
+        self.assertTrue(hasattr(FileStorage, "count"))
+        self.assertTrue(hasattr(FileStorage, "get"))
+        self.assertTrue(hasattr(FileStorage, "lookup"))
+        self.assertTrue(hasattr(FileStorage, "query"))
+        self.assertTrue(hasattr(FileStorage, "project"))
+        self.assertTrue(hasattr(FileStorage, "iterate"))
+        self.assertTrue(hasattr(FileStorage, "bulk_new"))
+        self.assertTrue(hasattr(FileStorage, "begin"))
+        self.assertTrue(hasattr(FileStorage, "commit"))
+        self.assertTrue(hasattr(FileStorage, "rollback"))
+        self.assertTrue(hasattr(FileStorage, "version"))
+        self.assertTrue(hasattr(FileStorage, "stamp"))
         self.assertTrue(hasattr(FileStorage, "new"))
         self.assertTrue(hasattr(FileStorage, "reload"))
         self.assertTrue(hasattr(FileStorage, "delete"))
+        self.assertTrue(hasattr(FileStorage, "flush"))
 
     def test_init(self):
         """Test initialization."""
@@ -122,6 +151,136 @@ class TestFileStorage(unittest.TestCase):
         self.assertEqual(len(obj), 1)
         self.assertEqual(self.base, list(obj.values())[0])
 
+    def test_all_cls_str(self):
+        """Test all method with a class name."""
+        obj = self.storage.all("State")
+        self.assertEqual(len(obj), 1)
+        self.assertEqual(self.state, list(obj.values())[0])
+
+    def test_all_load(self):
+        """Test all method with relationships to load."""
+        obj = self.storage.all(Place, load=("user", "reviews.user"))
+        self.assertEqual(obj, self.storage.all(Place))
+
+    def test_all_cls_index(self):
+        """Test all method with cls after new and delete."""
+        st = State()
+        self.storage.new(st)
+        self.assertIn("State." + st.id, self.storage.all(State))
+        self.storage.delete(st)
+        self.assertNotIn("State." + st.id, self.storage.all(State))
+        self.assertEqual(len(self.storage.all(State)), 1)
+
+    def test_count(self):
+        """Test count method."""
+        self.assertEqual(self.storage.count(),
+                         len(FileStorage._FileStorage__objects))
+        self.assertEqual(self.storage.count(Amenity), 1)
+        self.assertEqual(self.storage.count("Review"), 1)
+        self.assertEqual(self.storage.count("Galaxy"), 0)
+
+    def test_get(self):
+        """Test get method."""
+        self.assertIs(self.storage.get(User, self.user.id), self.user)
+        self.assertIs(self.storage.get("Place", self.place.id), self.place)
+        self.assertIsNone(self.storage.get(User, self.place.id))
+        self.assertIsNone(self.storage.get(User, "1234"))
+
+    def test_lookup(self):
+        """Test lookup method with an indexed attribute."""
+        st = State()
+        ct = City(state_id=st.id)
+        self.storage.new(ct)
+        self.assertEqual(self.storage.lookup(City, "state_id", st.id), [ct])
+        ct.state_id = self.state.id
+        self.storage.new(ct)
+        self.assertEqual(self.storage.lookup(City, "state_id", st.id), [])
+        self.assertIn(ct, self.storage.lookup("City", "state_id",
+                                              self.state.id))
+        self.storage.delete(ct)
+        self.assertNotIn(ct, self.storage.lookup("City", "state_id",
+                                                 self.state.id))
+
+    def test_lookup_unindexed(self):
+        """Test lookup method with an unindexed attribute."""
+        am = Amenity(name="Sauna")
+        self.storage.new(am)
+        self.assertEqual(self.storage.lookup(Amenity, "name", "Sauna"), [am])
+        self.storage.delete(am)
+        self.assertEqual(self.storage.lookup(Amenity, "name", "Sauna"), [])
+
+    def test_query(self):
+        """Test query method ordering, filtering and paging."""
+        sts = [State(name=name) for name in ("b", "a", "c", "a")]
+        for st in sts:
+            self.storage.new(st)
+        try:
+            objs = self.storage.query(State, {"name": "a"})
+            self.assertEqual(objs, sorted(sts[1::2], key=lambda o: o.id))
+            objs = self.storage.query("State", order_by=("name",))
+            self.assertEqual(objs[0], self.state)
+            self.assertEqual([o.name for o in objs[1:]],
+                             ["a", "a", "b", "c"])
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      offset=1)
+            self.assertEqual(page, objs[1:3])
+            last = page[-1]
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      after=(last.name, last.id))
+            self.assertEqual(page, objs[3:5])
+            first = page[0]
+            page = self.storage.query(State, order_by=("name",), limit=2,
+                                      before=(first.name, first.id))
+            self.assertEqual(page, objs[1:3])
+        finally:
+            for st in sts:
+                self.storage.delete(st)
+
+    def test_project(self):
+        """Test that project returns the fields of the queried objects."""
+        sts = [State(name=name) for name in ("b", "a", "c")]
+        for st in sts:
+            self.storage.new(st)
+        try:
+            rows = self.storage.project(State, ("id", "name"),
+                                        order_by=("name",), limit=3)
+            objs = self.storage.query(State, order_by=("name",), limit=3)
+            self.assertEqual(rows, [{"id": o.id, "name": o.name}
+                                    for o in objs])
+            rows = self.storage.project("State", ("name", "missing"),
+                                        {"id": sts[0].id})
+            self.assertEqual(rows, [{"name": "b", "missing": None}])
+        finally:
+            for st in sts:
+                self.storage.delete(st)
+
+    def test_iterate(self):
+        """Test iterate method."""
+        sts = [State(name=name) for name in ("b", "a", "c")]
+        for st in sts:
+            self.storage.new(st)
+        try:
+            objs = self.storage.iterate(State, order_by=("name",), batch=2)
+            self.assertNotIsInstance(objs, list)
+            self.assertEqual(list(objs), self.storage.query(
+                State, order_by=("name",)))
+        finally:
+            for st in sts:
+                self.storage.delete(st)
+
+    def test_query_indexed(self):
+        """Test query method with a filter on an indexed attribute."""
+        ct = City(state_id=self.state.id, name="b")
+        self.storage.new(ct)
+        try:
+            objs = self.storage.query(City, {"state_id": self.state.id,
+                                             "name": "b"})
+            self.assertEqual(objs, [ct])
+            objs = self.storage.query(City, {"state_id": "1234"})
+            self.assertEqual(objs, [])
+        finally:
+            self.storage.delete(ct)
+
     def test_new(self):
         """Test new method."""
         bm = BaseModel()
@@ -130,6 +289,108 @@ class TestFileStorage(unittest.TestCase):
         self.assertIn("BaseModel." + bm.id, store.keys())
         self.assertIn(self.base, store.values())
 
+    def test_bulk_new(self):
+        """Test that bulk_new adds objects and saves them once."""
+        sts = [State(name=str(i)) for i in range(3)]
+        with patch.object(FileStorage, "save") as save:
+            self.assertEqual(self.storage.bulk_new(iter(sts)), 3)
+            save.assert_called_once_with()
+        try:
+            for st in sts:
+                self.assertIs(self.storage.get(State, st.id), st)
+        finally:
+            for st in sts:
+                self.storage.delete(st)
+
+    def test_bulk_new_error(self):
+        """Test that bulk_new undoes the objects of a failed call."""
+        st = State(name="Bulk")
+        other = State(id=self.state.id, name="Other")
+
+        def objs():
+            yield st
+            yield other
+            raise ValueError("bad record")
+
+        with self.assertRaises(ValueError):
+            self.storage.bulk_new(objs())
+        self.assertIsNone(self.storage.get(State, st.id))
+        self.assertIs(self.storage.get(State, self.state.id), self.state)
+        self.assertNotIn("State." + st.id,
+                         FileStorage._FileStorage__changed)
+        self.storage.save()
+        with open("file.json", "r", encoding="utf-8") as f:
+            self.assertNotIn(st.id, f.read())
+
+    def test_begin_commit(self):
+        """Test that saves between begin and commit are written once."""
+        self.storage.begin()
+        try:
+            with patch.object(FileStorage, "_FileStorage__save") as save:
+                st = State(name="Deferred")
+                st.save()
+                self.storage.save()
+                save.assert_not_called()
+                self.storage.commit()
+                save.assert_called_once_with()
+        finally:
+            FileStorage._FileStorage__deferred = False
+            self.storage.delete(st)
+
+    def test_begin_rollback(self):
+        """Test that rollback discards the changes since the last save."""
+        objects = FileStorage._FileStorage__objects
+        touched = set(FileStorage._FileStorage__touched)
+        self.storage.save()
+        self.storage.begin()
+        try:
+            st = State(name="Deferred")
+            st.save()
+            self.storage.delete(self.user)
+            self.storage.rollback()
+            self.assertFalse(FileStorage._FileStorage__deferred)
+            self.assertIsNone(self.storage.get(State, st.id))
+            self.assertEqual(self.storage.get(User, self.user.id).id,
+                             self.user.id)
+        finally:
+            objects["User." + self.user.id] = self.user
+            objects.pop("State." + st.id, None)
+            FileStorage._FileStorage__objects = objects
+            FileStorage._FileStorage__touched.update(touched)
+            FileStorage._FileStorage__deferred = False
+
+    def test_version(self):
+        """Test that saves and deletions change the version."""
+        version = self.storage.version()
+        self.assertEqual(self.storage.version(), version)
+        st = State(name="Versioned")
+        self.storage.new(st)
+        self.storage.save()
+        self.assertNotEqual(self.storage.version(), version)
+        version = self.storage.version()
+        self.storage.delete(st)
+        self.assertNotEqual(self.storage.version(), version)
+        version = self.storage.version()
+        self.storage.delete(st)
+        self.assertEqual(self.storage.version(), version)
+
+    def test_stamp(self):
+        """Test that stamp changes with the objects of a class."""
+        self.storage.save()
+        stamp = self.storage.stamp(State)
+        self.assertEqual(stamp, (self.storage.count(State),
+                                 max((o.updated_at for o in
+                                      self.storage.all(State).values()),
+                                     default=None)))
+        self.assertEqual(self.storage.stamp("State"), stamp)
+        st = State(name="Stamped")
+        self.storage.new(st)
+        self.storage.save()
+        self.assertEqual(self.storage.stamp(State),
+                         (stamp[0] + 1, st.updated_at))
+        self.storage.delete(st)
+        self.assertEqual(self.storage.stamp(State)[0], stamp[0])
+
     def test_save(self):
         """Test save method."""
         self.storage.save()
@@ -143,6 +404,37 @@ class TestFileStorage(unittest.TestCase):
             self.assertIn("Amenity." + self.amenity.id, save_text)
             self.assertIn("Review." + self.review.id, save_text)
 
+    def test_save_dirty(self):
+        """Test that save serializes dirty objects again."""
+        self.storage.save()
+        self.assertFalse(self.user._dirty)
+        self.user.first_name = "Betty"
+        self.assertTrue(self.user._dirty)
+        self.storage.save()
+        self.assertFalse(self.user._dirty)
+        with open("file.json", "r", encoding="utf-8") as f:
+            self.assertIn("Betty", f.read())
+        self.user.__dict__["last_name"] = "Holberton"
+        self.user._dirty = True
+        self.storage.save()
+        with open("file.json", "r", encoding="utf-8") as f:
+            self.assertIn("Holberton", f.read())
+
+    def test_save_shards_dirty(self):
+        """Test that sharded saves write classes of dirty objects."""
+        FileStorage._FileStorage__sharded = True
+        try:
+            self.storage.save()
+            self.user.first_name = "Betty"
+            self.storage.save()
+            with open("file.User.json", "r", encoding="utf-8") as f:
+                self.assertIn("Betty", f.read())
+        finally:
+            FileStorage._FileStorage__sharded = False
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                os.remove("file.{}.json".format(name))
+
     def test_reload(self):
         """Test reload method."""
         bm = BaseModel()
@@ -153,6 +445,362 @@ class TestFileStorage(unittest.TestCase):
         store = FileStorage._FileStorage__objects
         self.assertIn("BaseModel." + bm.id, store)
 
+    def test_reload_unchanged(self):
+        """Test reload method skips an unchanged file."""
+        self.storage.save()
+        bm = BaseModel()
+        key = "{}.{}".format(type(bm).__name__, bm.id)
+        FileStorage._FileStorage__objects[key] = bm
+        self.storage.close()
+        self.assertIs(self.storage.all()[key], bm)
+        self.assertIs(self.storage.get(User, self.user.id), self.user)
+        self.storage.delete(bm)
+
+    def test_reload_changed(self):
+        """Test reload method only re-instantiates changed records."""
+        bm = BaseModel()
+        self.storage.new(bm)
+        self.storage.save()
+        key = "{}.{}".format(type(bm).__name__, bm.id)
+        with open("file.json", "r", encoding="utf-8") as f:
+            odict = json.load(f)
+        odict[key]["updated_at"] = datetime.utcnow().isoformat()
+        odict[key]["name"] = "changed"
+        with open("file.json", "w", encoding="utf-8") as f:
+            json.dump(odict, f)
+        self.storage.reload()
+        self.assertIsNot(self.storage.all()[key], bm)
+        self.assertEqual(self.storage.all()[key].name, "changed")
+        self.assertIs(self.storage.get(User, self.user.id), self.user)
+        self.storage.delete(self.storage.all()[key])
+
+    def test_save_journal(self):
+        """Test save and reload methods with a journal."""
+        objects = FileStorage._FileStorage__objects
+        bm = BaseModel()
+        FileStorage._FileStorage__journaled = True
+        try:
+            self.storage.save()
+            self.storage.new(bm)
+            self.storage.delete(self.amenity)
+            self.storage.save()
+            with open("file.json.log", "r", encoding="utf-8") as f:
+                log = f.read()
+            self.assertIn("BaseModel." + bm.id, log)
+            self.assertIn("Amenity." + self.amenity.id, log)
+            self.assertNotIn("User." + self.user.id, log)
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            self.assertIn("BaseModel." + bm.id, self.storage.all())
+            self.assertIn("User." + self.user.id, self.storage.all())
+            self.assertNotIn("Amenity." + self.amenity.id,
+                             self.storage.all())
+        finally:
+            FileStorage._FileStorage__journaled = False
+            FileStorage._FileStorage__objects = objects
+            self.storage.delete(bm)
+            self.storage.new(self.amenity)
+            os.remove("file.json.log")
+
+    def test_save_journal_compact(self):
+        """Test that a full journal is compacted into file.json."""
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journaled = True
+        FileStorage._FileStorage__compact_after = 1
+        try:
+            bm = BaseModel()
+            self.storage.new(bm)
+            self.storage.save()
+            self.assertFalse(os.path.exists("file.json.log"))
+            with open("file.json", "r", encoding="utf-8") as f:
+                self.assertIn("BaseModel." + bm.id, f.read())
+        finally:
+            FileStorage._FileStorage__journaled = False
+            FileStorage._FileStorage__compact_after = 1000
+            FileStorage._FileStorage__objects = objects
+
+    def test_reload_lazy(self):
+        """Test that lazily reloaded records are instantiated on demand."""
+        saved = City(state_id=self.state.id)
+        self.storage.new(saved)
+        self.storage.save()
+        objects = FileStorage._FileStorage__objects
+        ct = City(state_id=self.state.id)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__lazy = True
+        try:
+            self.storage.reload()
+            self.assertEqual(self.storage.count(), len(objects))
+            self.assertEqual(self.storage.count(User), 1)
+            loaded = FileStorage._FileStorage__objects
+            self.assertEqual(len(loaded), 0)
+            user = self.storage.get(User, self.user.id)
+            self.assertEqual(user.id, self.user.id)
+            self.assertEqual(list(loaded), ["User." + self.user.id])
+            self.storage.new(ct)
+            cities = self.storage.lookup(City, "state_id", self.state.id)
+            self.assertEqual(len(cities), 2)
+            self.assertEqual(len(loaded), 3)
+            self.storage.save()
+            with open("file.json", "r", encoding="utf-8") as f:
+                text = f.read()
+                self.assertIn("Review." + self.review.id, text)
+                self.assertIn("City." + ct.id, text)
+            self.assertEqual(len(self.storage.all(Review)), 1)
+            self.assertEqual(len(self.storage.all()), len(objects) + 1)
+        finally:
+            FileStorage._FileStorage__lazy = False
+            FileStorage._FileStorage__objects = objects
+            self.storage.delete(saved)
+
+    def test_save_binary(self):
+        """Test save and reload methods with the binary format."""
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__codec = codecs["binary"]
+        FileStorage._FileStorage__file_path = "file.bin"
+        try:
+            self.storage.save()
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            self.assertEqual(sorted(self.storage.all()), sorted(objects))
+            state = self.storage.get(State, self.state.id)
+            self.assertEqual(state.created_at, self.state.created_at)
+        finally:
+            FileStorage._FileStorage__codec = codecs["json"]
+            FileStorage._FileStorage__file_path = "file.json"
+            FileStorage._FileStorage__objects = objects
+            os.remove("file.bin")
+
+    def test_reload_index(self):
+        """Test that indexed snapshots are decoded on demand."""
+        saved = City(state_id=self.state.id)
+        self.storage.new(saved)
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__mapped = True
+        try:
+            self.storage.save()
+            self.assertTrue(os.path.isfile("file.json.idx"))
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            loaded = FileStorage._FileStorage__objects
+            self.assertEqual(len(loaded), 0)
+            self.assertEqual(self.storage.count(), len(objects))
+            self.assertEqual(self.storage.count(City), 2)
+            user = self.storage.get(User, self.user.id)
+            self.assertEqual(user.created_at, self.user.created_at)
+            self.assertIsNone(self.storage.get(User, "nope"))
+            self.assertEqual(list(loaded), ["User." + self.user.id])
+            cities = self.storage.lookup(City, "state_id", self.state.id)
+            self.assertEqual([c.id for c in cities], [saved.id])
+            self.storage.delete(cities[0])
+            self.assertEqual(self.storage.count(City), 1)
+            self.storage.save()
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            self.assertIsNone(self.storage.get(City, saved.id))
+            self.assertEqual(len(self.storage.all()), len(objects) - 1)
+        finally:
+            FileStorage._FileStorage__mapped = False
+            FileStorage._FileStorage__store.close()
+            FileStorage._FileStorage__store = None
+            FileStorage._FileStorage__shadowed = {}
+            FileStorage._FileStorage__objects = objects
+            self.storage.delete(saved)
+            os.remove("file.json.idx")
+
+    def test_save_shards(self):
+        """Test that sharded saves only rewrite the classes that changed."""
+        objects = FileStorage._FileStorage__objects
+        st = State(name="Oregon")
+        FileStorage._FileStorage__sharded = True
+        try:
+            self.storage.save()
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                self.assertTrue(os.path.isfile("file.{}.json".format(name)))
+            mtime = os.stat("file.User.json").st_mtime_ns
+            self.storage.new(st)
+            self.storage.save()
+            self.assertEqual(os.stat("file.User.json").st_mtime_ns, mtime)
+            with open("file.State.json", "r", encoding="utf-8") as f:
+                self.assertIn("State." + st.id, f.read())
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            self.assertEqual(sorted(self.storage.all()), sorted(objects))
+            FileStorage._FileStorage__objects = {}
+            FileStorage._FileStorage__lazy = True
+            self.storage.reload()
+            self.assertEqual(len(FileStorage._FileStorage__objects), 0)
+            self.assertEqual(len(self.storage.all(State)), 2)
+            self.assertEqual(len(FileStorage._FileStorage__objects), 2)
+            self.assertEqual(len(FileStorage._FileStorage__unloaded), 6)
+            self.assertEqual(self.storage.count(), len(objects))
+        finally:
+            FileStorage._FileStorage__sharded = False
+            FileStorage._FileStorage__lazy = False
+            FileStorage._FileStorage__unloaded.clear()
+            FileStorage._FileStorage__objects = objects
+            self.storage.delete(st)
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                os.remove("file.{}.json".format(name))
+
+    def test_save_shards_touched(self):
+        """Test that classes touched while shards are written are saved."""
+        st = State(name="Nevada")
+        am = Amenity(name="Wifi")
+        dump = FileStorage._FileStorage__dump
+
+        def dump_and_delete(storage, path, items):
+            self.storage.delete(am)
+            return dump(storage, path, items)
+
+        FileStorage._FileStorage__sharded = True
+        try:
+            self.storage.new(st)
+            self.storage.new(am)
+            self.storage.save()
+            self.storage.new(st)
+            with patch.object(FileStorage, "_FileStorage__dump",
+                              dump_and_delete):
+                self.storage.save()
+            self.storage.save()
+            with open("file.Amenity.json", "r", encoding="utf-8") as f:
+                self.assertNotIn("Amenity." + am.id, f.read())
+        finally:
+            FileStorage._FileStorage__sharded = False
+            self.storage.delete(st)
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                os.remove("file.{}.json".format(name))
+
+    def test_save_async(self):
+        """Test that async saves are written by flush()."""
+        st = State(name="Idaho")
+        FileStorage._FileStorage__async = True
+        try:
+            self.storage.new(st)
+            for _ in range(10):
+                self.storage.save()
+            self.storage.flush()
+            with open("file.json", "r", encoding="utf-8") as f:
+                self.assertIn("State." + st.id, f.read())
+        finally:
+            FileStorage._FileStorage__async = False
+            self.storage.delete(st)
+
+    def test_save_shared(self):
+        """Test that shared saves merge the saves of other processes."""
+        mine = State(name="Utah")
+        theirs = State(name="Texas")
+
+        def save_theirs():
+            self.storage.new(theirs)
+            self.storage.save()
+
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__shared = True
+        try:
+            self.storage.save()
+            process = multiprocessing.get_context("fork").Process(
+                target=save_theirs)
+            process.start()
+            process.join()
+            self.assertIsNone(self.storage.get(State, theirs.id))
+            self.storage.new(mine)
+            self.storage.save()
+            self.assertIsNotNone(self.storage.get(State, theirs.id))
+            FileStorage._FileStorage__objects = {}
+            self.storage.reload()
+            self.assertIsNotNone(self.storage.get(State, mine.id))
+            self.assertIsNotNone(self.storage.get(State, theirs.id))
+        finally:
+            FileStorage._FileStorage__shared = False
+            FileStorage._FileStorage__objects = objects
+            self.storage.delete(mine)
+            self.storage.delete(theirs)
+            FileStorage._FileStorage__file_lock.close()
+            FileStorage._FileStorage__file_lock = None
+            os.remove("file.json.lock")
+
+    def test_save_shared_shards_delete(self):
+        """Test that deletions of other processes are kept across shards."""
+        st = State(name="Maine")
+
+        def delete_theirs():
+            self.storage.delete(self.storage.get(State, st.id))
+            self.storage.save()
+
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__shared = True
+        FileStorage._FileStorage__sharded = True
+        try:
+            self.storage.new(st)
+            self.storage.save()
+            process = multiprocessing.get_context("fork").Process(
+                target=delete_theirs)
+            process.start()
+            process.join()
+            self.storage.reload()
+            self.assertIsNone(self.storage.get(State, st.id))
+            self.storage.new(State(name="Vermont"))
+            self.storage.save()
+            with open("file.State.json", "r", encoding="utf-8") as f:
+                self.assertNotIn("State." + st.id, f.read())
+        finally:
+            FileStorage._FileStorage__shared = False
+            FileStorage._FileStorage__sharded = False
+            FileStorage._FileStorage__objects = objects
+            for obj in self.storage.all(State).values():
+                if obj.name == "Vermont":
+                    self.storage.delete(obj)
+            self.storage.delete(st)
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                os.remove("file.{}.json".format(name))
+            FileStorage._FileStorage__file_lock.close()
+            FileStorage._FileStorage__file_lock = None
+            os.remove("file.json.lock")
+
+    def test_save_shared_shards_lazy(self):
+        """Test that concurrent lazy sharded saves keep every object."""
+        def save_theirs():
+            for i in range(10):
+                self.storage.reload()
+                self.storage.new(State(name="Lazy"))
+                self.storage.save()
+
+        objects = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__shared = True
+        FileStorage._FileStorage__sharded = True
+        FileStorage._FileStorage__lazy = True
+        try:
+            self.storage.save()
+            context = multiprocessing.get_context("fork")
+            processes = [context.Process(target=save_theirs)
+                         for i in range(4)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            with open("file.State.json", "r", encoding="utf-8") as f:
+                records = json.load(f).values()
+            self.assertEqual(len([d for d in records
+                                  if d.get("name") == "Lazy"]), 40)
+        finally:
+            FileStorage._FileStorage__shared = False
+            FileStorage._FileStorage__sharded = False
+            FileStorage._FileStorage__lazy = False
+            FileStorage._FileStorage__objects = objects
+            FileStorage._FileStorage__unloaded = set()
+            for name in ("BaseModel", "User", "State", "Place", "City",
+                         "Amenity", "Review"):
+                os.remove("file.{}.json".format(name))
+            FileStorage._FileStorage__file_lock.close()
+            FileStorage._FileStorage__file_lock = None
+            os.remove("file.json.lock")
+
     def test_reload_no_file(self):
         """Test reload method with no existing file.json."""
         try:
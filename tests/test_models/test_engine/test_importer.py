@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Defines unnittests for models/engine/importer.py."""
+import os
+import pep8
+import unittest
+from models.engine import importer
+from models.place import Place
+from models.state import State
+
+
+class TestImporter(unittest.TestCase):
+    """Unittests for testing the importer module."""
+
+    def tearDown(self):
+        """Delete the test files."""
+        for path in ("test_import.jsonl", "test_import.csv"):
+            try:
+                os.remove(path)
+            except IOError:
+                pass
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/importer.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(importer.__doc__)
+        self.assertIsNotNone(importer.records.__doc__)
+        self.assertIsNotNone(importer.objects.__doc__)
+        self.assertIsNotNone(importer.main.__doc__)
+
+    def test_records_jsonl(self):
+        """Test reading a JSON Lines file written by to_dict()."""
+        st = State(name="California")
+        with open("test_import.jsonl", "w") as f:
+            f.write('{}\n\n{{"name": "Nevada"}}\n'.format(
+                st.to_dict()).replace("'", '"'))
+        objs = list(importer.objects(State, "test_import.jsonl"))
+        self.assertEqual(len(objs), 2)
+        self.assertEqual(objs[0].id, st.id)
+        self.assertEqual(objs[0].created_at, st.created_at)
+        self.assertEqual(objs[1].name, "Nevada")
+
+    def test_records_csv(self):
+        """Test reading a CSV file with typed columns."""
+        with open("test_import.csv", "w") as f:
+            f.write("name,number_rooms,latitude,description\n")
+            f.write("Loft,3,37.5,\n")
+        records = list(importer.records(Place, "test_import.csv"))
+        self.assertEqual(records, [{"name": "Loft", "number_rooms": 3,
+                                    "latitude": 37.5}])
+
+    def test_records_not_object(self):
+        """Test that JSON Lines records other than objects are refused."""
+        with open("test_import.jsonl", "w") as f:
+            f.write('{"name": "Nevada"}\n[1, 2]\n')
+        records = importer.records(State, "test_import.jsonl")
+        self.assertEqual(next(records), {"name": "Nevada"})
+        with self.assertRaises(ValueError):
+            next(records)
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""Defines unnittests for models/engine/journal.py."""
+import os
+import pep8
+import unittest
+from models.engine.journal import Journal
+
+
+class TestJournal(unittest.TestCase):
+    """Unittests for testing the Journal class."""
+
+    def setUp(self):
+        """Create a Journal on a fresh log file."""
+        self.journal = Journal("test_journal.log")
+        self.journal.truncate()
+
+    def tearDown(self):
+        """Delete the log file."""
+        try:
+            os.remove("test_journal.log")
+        except IOError:
+            pass
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/journal.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(Journal.__doc__)
+        self.assertIsNotNone(Journal.__init__.__doc__)
+        self.assertIsNotNone(Journal.append.__doc__)
+        self.assertIsNotNone(Journal.replay.__doc__)
+        self.assertIsNotNone(Journal.truncate.__doc__)
+
+    def test_append_replay(self):
+        """Test that replay returns appended records in order."""
+        self.journal.append([("State.1", '{"name": "California"}')])
+        self.journal.append([("State.2", '{"name": "Nevada"}'),
+                             ("State.1", None)])
+        self.assertEqual(len(self.journal), 3)
+        records = list(Journal("test_journal.log").replay())
+        self.assertEqual(records, [("State.1", {"name": "California"}),
+                                   ("State.2", {"name": "Nevada"}),
+                                   ("State.1", None)])
+
+    def test_append_empty(self):
+        """Test that appending no changes leaves no log file."""
+        self.journal.append([])
+        self.assertFalse(os.path.exists("test_journal.log"))
+
+    def test_replay_offset(self):
+        """Test that replaying from an offset yields only later records."""
+        self.journal.append([("State.1", '{"name": "California"}')])
+        other = Journal("test_journal.log")
+        self.assertEqual(len(list(other.replay())), 1)
+        offset = other.offset
+        self.assertEqual(offset, self.journal.offset)
+        self.journal.append([("State.2", None)])
+        self.assertEqual(list(other.replay(offset)), [("State.2", None)])
+        self.assertEqual(len(other), 2)
+        self.assertEqual(other.offset, os.path.getsize("test_journal.log"))
+
+    def test_replay_torn(self):
+        """Test that a partially written last record is dropped."""
+        self.journal.append([("State.1", '{"name": "California"}')])
+        with open("test_journal.log", "a", encoding="utf-8") as f:
+            f.write('{"key": "State.2", "obj": {"na')
+        self.assertEqual(len(list(self.journal.replay())), 1)
+        self.journal.append([("State.3", None)])
+        records = list(self.journal.replay())
+        self.assertEqual(records, [("State.1", {"name": "California"}),
+                                   ("State.3", None)])
+
+    def test_replay_no_file(self):
+        """Test replay without a log file."""
+        self.assertEqual(list(self.journal.replay()), [])
+        self.assertEqual(len(self.journal), 0)
+
+    def test_truncate(self):
+        """Test truncate method."""
+        self.journal.append([("State.1", None)])
+        self.journal.truncate()
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(list(self.journal.replay()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
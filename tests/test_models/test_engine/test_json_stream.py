@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""Defines unnittests for models/engine/json_stream.py."""
+import io
+import json
+import pep8
+import unittest
+from unittest.mock import patch
+from models.engine import json_stream
+from models.engine.json_stream import Reader
+from models.engine.json_stream import iter_items
+from models.engine.json_stream import loads
+
+
+class TestJsonStream(unittest.TestCase):
+    """Unittests for testing the streaming JSON reader."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build test documents in the layouts FileStorage may read."""
+        cls.odict = {"State.{}".format(i): {"id": str(i), "n": i * 1.5,
+                                            "name": "a,\n" * (i % 3),
+                                            "ids": [i, {"x": None}]}
+                     for i in range(20)}
+        cls.layouts = [
+            json.dumps(cls.odict),
+            json.dumps(cls.odict, indent=2),
+            "{\n" + ",\n".join("{}: {}".format(json.dumps(k), json.dumps(v))
+                               for k, v in cls.odict.items()) + "\n}"
+        ]
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/json_stream.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(json_stream.__doc__)
+        self.assertIsNotNone(loads.__doc__)
+        self.assertIsNotNone(iter_items.__doc__)
+        self.assertIsNotNone(Reader.__doc__)
+        self.assertIsNotNone(Reader.fill.__doc__)
+        self.assertIsNotNone(Reader.peek.__doc__)
+        self.assertIsNotNone(Reader.expect.__doc__)
+        self.assertIsNotNone(Reader.value.__doc__)
+        self.assertIsNotNone(Reader.decode.__doc__)
+
+    def test_loads(self):
+        """Test loads function."""
+        self.assertEqual(loads('{"a": [1, null]}'), {"a": [1, None]})
+        self.assertEqual(loads(b'{"a": 1}\n'), {"a": 1})
+        with self.assertRaises(ValueError):
+            loads('{"a": ')
+
+    def test_iter_items(self):
+        """Test iter_items with every layout and chunk size."""
+        for text in self.layouts:
+            for size in (1, 7, 64, 1 << 20):
+                items = iter_items(io.StringIO(text), size)
+                self.assertEqual(list(items), list(self.odict.items()))
+
+    def test_iter_items_json(self):
+        """Test iter_items without orjson."""
+        with patch.object(json_stream, "orjson", None):
+            for text in self.layouts:
+                for size in (1, 64):
+                    items = iter_items(io.StringIO(text), size)
+                    self.assertEqual(dict(items), self.odict)
+
+    def test_iter_items_lazy(self):
+        """Test that iter_items yields before reading the whole file."""
+        f = io.StringIO(self.layouts[2])
+        key, value = next(iter_items(f, 64))
+        self.assertEqual(value, self.odict[key])
+        self.assertLess(f.tell(), len(self.layouts[2]))
+
+    def test_iter_items_numbers(self):
+        """Test values split across chunks."""
+        items = iter_items(io.StringIO('{"a": 12345, "b": 6789}'), 3)
+        self.assertEqual(dict(items), {"a": 12345, "b": 6789})
+
+    def test_iter_items_empty(self):
+        """Test iter_items with an empty object."""
+        self.assertEqual(list(iter_items(io.StringIO(" { } "))), [])
+
+    def test_iter_items_invalid(self):
+        """Test iter_items with invalid documents."""
+        for text in ("", "[]", '{"a": 1', '{"a" 1}', '{1: 2}', '{"a": 1,}'):
+            with self.assertRaises(ValueError):
+                list(iter_items(io.StringIO(text), 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
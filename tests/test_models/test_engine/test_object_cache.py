@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Defines unnittests for models/engine/object_cache.py."""
+import pep8
+import unittest
+from unittest.mock import patch
+from models.engine.object_cache import ObjectCache
+
+
+class TestObjectCache(unittest.TestCase):
+    """Unittests for testing the ObjectCache class."""
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/object_cache.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(ObjectCache.__doc__)
+        self.assertIsNotNone(ObjectCache.__init__.__doc__)
+        self.assertIsNotNone(ObjectCache.get.__doc__)
+        self.assertIsNotNone(ObjectCache.put.__doc__)
+        self.assertIsNotNone(ObjectCache.invalidate.__doc__)
+        self.assertIsNotNone(ObjectCache.clear.__doc__)
+
+    def test_get_put(self):
+        """Test that get counts hits and misses."""
+        cache = ObjectCache(2, 60)
+        self.assertIsNone(cache.get(("State", "1")))
+        cache.put(("State", "1"), {"name": "Iowa"})
+        self.assertEqual(cache.get(("State", "1")), {"name": "Iowa"})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_lru(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ObjectCache(2, 60)
+        cache.put(("State", "1"), 1)
+        cache.put(("State", "2"), 2)
+        cache.get(("State", "1"))
+        cache.put(("State", "3"), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(("State", "2")))
+        self.assertEqual(cache.get(("State", "1")), 1)
+
+    def test_ttl(self):
+        """Test that entries expire after ttl seconds."""
+        cache = ObjectCache(2, 60)
+        with patch("models.engine.object_cache.monotonic",
+                   return_value=100):
+            cache.put(("State", "1"), 1)
+        with patch("models.engine.object_cache.monotonic",
+                   return_value=159):
+            self.assertEqual(cache.get(("State", "1")), 1)
+        with patch("models.engine.object_cache.monotonic",
+                   return_value=160):
+            self.assertIsNone(cache.get(("State", "1")))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        """Test that invalidate drops the listing and the given id."""
+        cache = ObjectCache(4, 60)
+        cache.put(("State", None), [1, 2])
+        cache.put(("State", "1"), 1)
+        cache.put(("State", "2"), 2)
+        cache.invalidate("State", "1")
+        self.assertIsNone(cache.get(("State", None)))
+        self.assertIsNone(cache.get(("State", "1")))
+        self.assertEqual(cache.get(("State", "2")), 2)
+
+    def test_disabled(self):
+        """Test that a cache of size 0 keeps nothing."""
+        cache = ObjectCache(0, 60)
+        cache.put(("State", "1"), 1)
+        self.assertIsNone(cache.get(("State", "1")))
+        self.assertEqual((len(cache), cache.misses), (0, 0))
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/record_index.py.
+
+Unittest classes:
+    TestRecordIndex
+"""
+import json
+import os
+import pep8
+import unittest
+from models.engine import record_index
+from models.engine.codecs import JSONCodec
+from models.engine.record_index import RecordIndex
+
+
+class TestRecordIndex(unittest.TestCase):
+    """Unittests for testing the RecordIndex class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """RecordIndex testing setup.
+
+        Writes a JSON snapshot of unsorted records and its index.
+        """
+        cls.records = {}
+        for i in range(50):
+            for name in ("State", "City", "Amenity"):
+                key = "{}.{}".format(name, (i * 7919) % 101)
+                cls.records[key] = {"__class__": name, "name": "é" * i}
+        codec = JSONCodec()
+        with codec.open("test.json", "w") as f:
+            entries = codec.dump(f, ((k, codec.encode(d))
+                                     for k, d in cls.records.items()))
+        RecordIndex.write("test.json.idx", "test.json", entries)
+        cls.index = RecordIndex("test.json.idx", "test.json")
+
+    @classmethod
+    def tearDownClass(cls):
+        """RecordIndex testing teardown.
+
+        Removes the snapshot and its index.
+        """
+        cls.index.close()
+        os.remove("test.json")
+        os.remove("test.json.idx")
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/record_index.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(record_index.__doc__)
+        self.assertIsNotNone(RecordIndex.__doc__)
+        for func in (RecordIndex.write, RecordIndex.find, RecordIndex.keys,
+                     RecordIndex.items, RecordIndex.read):
+            self.assertIsNotNone(func.__doc__)
+
+    def test_read(self):
+        """Test that every record is read back from its byte range."""
+        for key, d in self.records.items():
+            self.assertEqual(self.index.read(key), d)
+        with open("test.json", "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), self.records)
+
+    def test_missing(self):
+        """Test lookups of keys without records."""
+        for key in ("", "A", "City.", "City.1000", "State", "Zebra.1"):
+            self.assertIsNone(self.index.find(key))
+            self.assertIsNone(self.index.read(key))
+            self.assertNotIn(key, self.index)
+
+    def test_keys(self):
+        """Test that the keys of a class are listed in order."""
+        for name in ("State", "City", "Amenity"):
+            keys = sorted(k for k in self.records if k.startswith(name + "."))
+            self.assertEqual(list(self.index.keys(name)), keys)
+            self.assertEqual(self.index.counts[name], len(keys))
+        self.assertEqual(list(self.index.keys("User")), [])
+
+    def test_escaped_keys(self):
+        """Test keys holding spaces, newlines and backslashes."""
+        records = {key: {"name": key} for key in (
+            "State.a b", "State.a", "State.a\nb", "State.a\\nb",
+            "State.a\\", "State.a\tb", "State.1 2 3")}
+        codec = JSONCodec()
+        try:
+            with codec.open("test_escaped.json", "w") as f:
+                entries = codec.dump(f, ((k, codec.encode(d))
+                                         for k, d in records.items()))
+            RecordIndex.write("test_escaped.json.idx", "test_escaped.json",
+                              entries)
+            index = RecordIndex("test_escaped.json.idx", "test_escaped.json")
+            try:
+                for key, d in records.items():
+                    self.assertEqual(index.read(key), d)
+                self.assertIsNone(index.find("State.a b c"))
+                self.assertEqual(sorted(index.keys("State")),
+                                 sorted(records))
+                self.assertEqual(index.counts, {"State": len(records)})
+            finally:
+                index.close()
+        finally:
+            os.remove("test_escaped.json")
+            os.remove("test_escaped.json.idx")
+
+    def test_stale(self):
+        """Test that an index of another snapshot is refused."""
+        with open("test.json", "a", encoding="utf-8") as f:
+            f.write(" ")
+        try:
+            with self.assertRaises(ValueError):
+                RecordIndex("test.json.idx", "test.json")
+        finally:
+            with open("test.json", "rb+") as f:
+                f.truncate(os.path.getsize("test.json") - 1)
+        with self.assertRaises(ValueError):
+            RecordIndex("missing.idx", "test.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
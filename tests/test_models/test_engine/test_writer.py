@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/writer.py."""
+import pep8
+import threading
+import unittest
+from models.engine.writer import Writer
+
+
+class TestWriter(unittest.TestCase):
+    """Unittests for testing the Writer class."""
+
+    def setUp(self):
+        """Create a Writer whose saves wait on an event."""
+        self.saves = 0
+        self.go = threading.Event()
+        self.writer = Writer(self.save)
+
+    def save(self):
+        """Count a save once allowed to proceed."""
+        self.go.wait()
+        self.saves += 1
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["models/engine/writer.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(Writer.__doc__)
+        self.assertIsNotNone(Writer.__init__.__doc__)
+        self.assertIsNotNone(Writer.request.__doc__)
+        self.assertIsNotNone(Writer.flush.__doc__)
+
+    def test_flush_empty(self):
+        """Test that flush returns at once with no requests."""
+        self.writer.flush()
+        self.assertEqual(self.saves, 0)
+
+    def test_coalesce(self):
+        """Test that requests made during a save share the next save."""
+        for _ in range(10):
+            self.writer.request()
+        self.go.set()
+        self.writer.flush()
+        self.assertLessEqual(self.saves, 2)
+        self.assertGreaterEqual(self.saves, 1)
+
+    def test_error(self):
+        """Test that flush raises the error of a failed save."""
+        def fail():
+            raise OSError("disk full")
+        writer = Writer(fail)
+        writer.request()
+        with self.assertRaises(OSError):
+            writer.flush()
+        writer.flush()
+
+
+if __name__ == "__main__":
+    unittest.main()
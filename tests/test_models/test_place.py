@@ -146,6 +146,16 @@ class TestPlace(unittest.TestCase):
         self.assertTrue(list, type(amenities))
         self.assertIn(self.amenity, amenities)
 
+    @unittest.skipIf(type(models.storage) == DBStorage,
+                     "Testing DBStorage")
+    def test_amenities_dirty(self):
+        """Test that linking an amenity marks the place dirty."""
+        pl = Place()
+        pl.__dict__["_dirty"] = False
+        pl.amenities = self.amenity
+        self.assertTrue(pl._dirty)
+        self.assertEqual(pl.to_dict()["amenity_ids"], [self.amenity.id])
+
     def test_is_subclass(self):
         """Check that Place is a subclass of BaseModel."""
         self.assertTrue(issubclass(Place, BaseModel))
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+"""Defines unnittests for web_flask/api.py."""
+import pep8
+import unittest
+from models import storage
+from models.city import City
+from models.state import State
+from web_flask import api
+from web_flask.factory import create_app
+
+
+class TestAPI(unittest.TestCase):
+    """Unittests for testing the JSON API."""
+
+    @classmethod
+    def setUpClass(cls):
+        """API testing setup.
+
+        Creates a test client and a few states with cities.
+        """
+        cls.client = create_app(("api",)).test_client()
+        cls.states = [State(name="API {}".format(i)) for i in range(5)]
+        cls.cities = [City(name="API", state_id=st.id) for st in cls.states]
+        for obj in cls.states + cls.cities:
+            storage.new(obj)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """API testing teardown.
+
+        Deletes the test objects.
+        """
+        for obj in cls.cities + cls.states:
+            storage.delete(obj)
+        storage.save()
+
+    def pages(self, url):
+        """Return the data of the pages chained from url by their next."""
+        data = []
+        while url is not None:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data.extend(response.json["data"])
+            url = response.json["next"]
+        return data
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["web_flask/api.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(api.__doc__)
+        for func in (api.encode, api.respond, api.columns_of,
+                     api.parse_fields, api.parse_filters, api.objects,
+                     api.object_id, api.error):
+            self.assertIsNotNone(func.__doc__)
+
+    def test_next(self):
+        """Test that the next chain lists every object exactly once."""
+        ids = [o["id"] for o in self.pages("/api/v1/states?limit=2")]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids),
+                         {st.id for st in storage.all(State).values()})
+        self.assertEqual(ids, sorted(ids))
+
+    def test_next_fields(self):
+        """Test the next chain of projected objects."""
+        data = self.pages("/api/v1/states?limit=2&fields=id,name")
+        self.assertEqual(len(data), len(storage.all(State)))
+        self.assertEqual({o["id"] for o in data},
+                         {st.id for st in storage.all(State).values()})
+        for values in data:
+            self.assertEqual(set(values), {"id", "name"})
+        data = self.pages("/api/v1/states?limit=2&fields=name")
+        self.assertEqual(len(data), len(storage.all(State)))
+        for values in data:
+            self.assertEqual(set(values), {"name"})
+
+    def test_filter(self):
+        """Test that column arguments filter the objects."""
+        st = self.states[0]
+        data = self.pages("/api/v1/cities?limit=1&state_id=" + st.id)
+        self.assertEqual([o["id"] for o in data], [self.cities[0].id])
+
+    def test_object(self):
+        """Test getting one object, whole or projected."""
+        st = self.states[0]
+        response = self.client.get("/api/v1/states/" + st.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["name"], st.name)
+        self.assertEqual(response.json["__class__"], "State")
+        response = self.client.get("/api/v1/states/{}?fields=name".format(
+            st.id))
+        self.assertEqual(response.json, {"name": st.name})
+
+    def test_bad_request(self):
+        """Test that unknown fields and filters are answered with 400."""
+        for url in ("/api/v1/states?fields=nope", "/api/v1/states?fields=,",
+                    "/api/v1/states?nope=1",
+                    "/api/v1/places?number_rooms=x",
+                    "/api/v1/states/{}?fields=nope".format(
+                        self.states[0].id)):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 400, url)
+            self.assertEqual(response.json, {"error": "Bad Request"})
+
+    def test_not_found(self):
+        """Test that unknown collections and ids are answered with 404."""
+        for url in ("/api/v1/nope", "/api/v1/nope/1", "/api/v1/states/nope",
+                    "/api/v1/states/nope?fields=name"):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 404, url)
+            self.assertEqual(response.json, {"error": "Not Found"})
+
+
+if __name__ == "__main__":
+    unittest.main()
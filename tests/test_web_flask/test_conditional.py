@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""Defines unnittests for web_flask/conditional.py."""
+import pep8
+import unittest
+from flask import Flask
+from models import storage
+from models.state import State
+from web_flask import conditional
+from web_flask import page_cache
+from web_flask.factory import create_app
+
+
+class TestConditional(unittest.TestCase):
+    """Unittests for testing conditional responses."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Conditional testing setup.
+
+        Creates a state, so that the pages have a Last-Modified date.
+        """
+        cls.state = State(name="Conditional")
+        storage.new(cls.state)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Conditional testing teardown.
+
+        Deletes the test state.
+        """
+        storage.delete(cls.state)
+        storage.save()
+
+    def setUp(self):
+        """Create an app counting the renderings of its page."""
+        self.calls = 0
+        app = Flask(__name__)
+
+        @app.route("/page")
+        @conditional.conditional("State")
+        def page():
+            """Return a new page."""
+            self.calls += 1
+            return "page {}".format(self.calls)
+        self.client = app.test_client()
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["web_flask/conditional.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(conditional.__doc__)
+        self.assertIsNotNone(conditional.validators.__doc__)
+        self.assertIsNotNone(conditional.conditional.__doc__)
+
+    def test_validators(self):
+        """Test that pages carry their validators."""
+        response = self.client.get("/page")
+        self.assertEqual(response.status_code, 200)
+        etag, last_modified = conditional.validators(("State",))
+        self.assertEqual(response.get_etag(), (etag, False))
+        self.assertIsNotNone(response.last_modified)
+        self.assertTrue(response.cache_control.no_cache)
+
+    def test_if_none_match(self):
+        """Test that a matching If-None-Match is answered with 304."""
+        etag = self.client.get("/page").get_etag()[0]
+        response = self.client.get("/page",
+                                   headers={"If-None-Match": '"x"'})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            "/page", headers={"If-None-Match": '"{}"'.format(etag)})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.get_etag(), (etag, False))
+        self.assertEqual(self.calls, 2)
+        st = State(name="Conditional")
+        storage.new(st)
+        storage.save()
+        try:
+            response = self.client.get(
+                "/page", headers={"If-None-Match": '"{}"'.format(etag)})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.get_etag()[0], etag)
+        finally:
+            storage.delete(st)
+            storage.save()
+
+    def test_if_modified_since(self):
+        """Test that an unmodified If-Modified-Since is answered with 304."""
+        response = self.client.get("/page")
+        response = self.client.get("/page", headers={
+            "If-Modified-Since": response.headers["Last-Modified"]})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.calls, 1)
+
+    def test_app(self):
+        """Test a conditional request of a page of the combined app."""
+        page_cache.pages.clear()
+        client = create_app(("9-states",)).test_client()
+        response = client.get("/states")
+        self.assertIn(b"Conditional", response.data)
+        response = client.get("/states", headers={
+            "If-None-Match": response.headers["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""Defines unnittests for web_flask/100-hbnb.py."""
+import importlib
+import pep8
+import unittest
+from models import storage
+from models.city import City
+from models.engine.db_storage import DBStorage
+from models.place import Place
+from models.state import State
+from models.user import User
+from web_flask import page_cache
+from web_flask.factory import create_app
+
+hbnb = importlib.import_module("web_flask.100-hbnb")
+
+
+class TestHBnB(unittest.TestCase):
+    """Unittests for testing the paging of the /hbnb page."""
+
+    @classmethod
+    def setUpClass(cls):
+        """HBnB testing setup.
+
+        Creates a test client and three places.
+        """
+        cls.client = create_app(("100-hbnb",)).test_client()
+        cls.user = User(email="hbnb@hbnb.io", password="hbnb")
+        cls.state = State(name="HBnB")
+        cls.city = City(name="HBnB", state_id=cls.state.id)
+        cls.places = [Place(name="HBnB {}".format(i), city_id=cls.city.id,
+                            user_id=cls.user.id) for i in range(3)]
+        for obj in [cls.user, cls.state, cls.city] + cls.places:
+            storage.new(obj)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """HBnB testing teardown.
+
+        Deletes the test objects.
+        """
+        for obj in cls.places + [cls.city, cls.state, cls.user]:
+            storage.delete(obj)
+        storage.save()
+
+    def setUp(self):
+        """Empty the page cache."""
+        page_cache.pages.clear()
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["web_flask/100-hbnb.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(hbnb.__doc__)
+        self.assertIsNotNone(hbnb.encode_cursor.__doc__)
+        self.assertIsNotNone(hbnb.decode_cursor.__doc__)
+        self.assertIsNotNone(hbnb.hbnb.__doc__)
+
+    def test_pages(self):
+        """Test the Previous and Next links of a page of places."""
+        places = storage.query(Place, order_by=("name",))
+        cursor = hbnb.encode_cursor(places[0])
+        data = self.client.get("/hbnb?limit=1&after=" + cursor).data
+        self.assertIn(b"Previous", data)
+        self.assertEqual(b"Next" in data, len(places) > 2)
+        data = self.client.get("/hbnb?limit=1&before=" + cursor).data
+        self.assertNotIn(b"Previous", data)
+        self.assertNotIn(b"Next", data)
+
+    @unittest.skipIf(type(storage) == DBStorage, "Testing DBStorage")
+    def test_cursor_no_name(self):
+        """Test the cursor of a place without a name."""
+        place = Place(city_id=self.city.id, user_id=self.user.id)
+        storage.new(place)
+        storage.save()
+        try:
+            cursor = hbnb.encode_cursor(place)
+            response = self.client.get("/hbnb?limit=1&after=" + cursor)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b"Previous", response.data)
+        finally:
+            storage.delete(place)
+            storage.save()
+
+    def test_bad_cursor(self):
+        """Test that malformed cursors are answered with 400."""
+        response = self.client.get("/hbnb?after=nope")
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""Defines unnittests for web_flask/page_cache.py."""
+import pep8
+import unittest
+from unittest.mock import patch
+from flask import Flask
+from flask import Response
+from models import storage
+from models.state import State
+from web_flask import page_cache
+from web_flask.conditional import conditional
+
+
+class TestPageCache(unittest.TestCase):
+    """Unittests for testing the page cache."""
+
+    def setUp(self):
+        """Create an app counting the renderings of its pages."""
+        page_cache.pages.clear()
+        self.calls = 0
+        app = Flask(__name__)
+
+        @app.route("/page")
+        @conditional("State")
+        @page_cache.cached
+        def page():
+            """Return a new page."""
+            self.calls += 1
+            return "page {}".format(self.calls)
+
+        @app.route("/stream")
+        @page_cache.cached
+        def stream():
+            """Return a new page in chunks."""
+            self.calls += 1
+            return Response(iter(("page ", str(self.calls))))
+
+        @app.route("/missing")
+        @page_cache.cached
+        def missing():
+            """Return a new error page."""
+            self.calls += 1
+            return "missing", 404
+        self.client = app.test_client()
+
+    def test_pep8(self):
+        """Test pep8 styling."""
+        style = pep8.StyleGuide(quiet=True)
+        p = style.check_files(["web_flask/page_cache.py"])
+        self.assertEqual(p.total_errors, 0, "fix pep8")
+
+    def test_docstrings(self):
+        """Check for docstrings."""
+        self.assertIsNotNone(page_cache.__doc__)
+        self.assertIsNotNone(page_cache.keep.__doc__)
+        self.assertIsNotNone(page_cache.cached.__doc__)
+
+    def test_hit(self):
+        """Test that cached pages are served without rendering."""
+        self.assertEqual(self.client.get("/page").data, b"page 1")
+        self.assertEqual(self.client.get("/page").data, b"page 1")
+        self.assertEqual(self.client.get("/page?x=1").data, b"page 2")
+        self.assertEqual(self.calls, 2)
+
+    def test_stream(self):
+        """Test that streamed pages are cached once sent."""
+        self.assertEqual(self.client.get("/stream").data, b"page 1")
+        self.assertEqual(self.client.get("/stream").data, b"page 1")
+        self.assertEqual(self.calls, 1)
+
+    def test_error(self):
+        """Test that error pages are not cached."""
+        self.client.get("/missing")
+        self.assertEqual(self.client.get("/missing").status_code, 404)
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate(self):
+        """Test that saves invalidate cached pages."""
+        self.client.get("/page")
+        st = State(name="Cached")
+        storage.new(st)
+        storage.save()
+        try:
+            self.assertEqual(self.client.get("/page").data, b"page 2")
+        finally:
+            storage.delete(st)
+            storage.save()
+        self.assertEqual(self.client.get("/page").data, b"page 3")
+
+    def test_etag(self):
+        """Test that pages changed by other processes are rendered again."""
+        self.client.get("/page")
+        with patch.object(type(storage), "stamp", return_value=(1, None)):
+            response = self.client.get("/page")
+            self.assertEqual(response.data, b"page 2")
+            self.assertEqual(self.client.get("/page").data, b"page 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,21 +6,30 @@ Routes:
     /hbnb_filters: HBnB HTML filters page.
 """
 from models import storage
+from flask import Blueprint
 from flask import Flask
 from flask import render_template
+from web_flask.conditional import conditional
+from web_flask.page_cache import cached
 
-app = Flask(__name__)
+blueprint = Blueprint("hbnb_filters", __name__)
 
 
-@app.route("/hbnb_filters", strict_slashes=False)
+@blueprint.route("/hbnb_filters", strict_slashes=False)
+@conditional("State", "City", "Amenity")
+@cached
 def hbnb_filters():
     """Displays the main HBnB filters HTML page."""
-    states = storage.all("State")
-    amenities = storage.all("Amenity")
+    states = storage.query("State", order_by=("name",), load=("cities",))
+    amenities = storage.query("Amenity", order_by=("name",))
     return render_template("10-hbnb_filters.html",
                            states=states, amenities=amenities)
 
 
+app = Flask(__name__)
+app.register_blueprint(blueprint)
+
+
 @app.teardown_appcontext
 def teardown(exc):
     """Remove the current SQLAlchemy session."""
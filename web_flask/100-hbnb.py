@@ -4,22 +4,94 @@
 The application listens on 0.0.0.0, port 5000.
 Routes:
     /hbnb: HBnB home page.
+
+Places are listed by pages of ?limit= places (PAGE_SIZE by default, at most
+MAX_PAGE_SIZE), sorted by name and id. Pages are linked by keyset cursors,
+?after=<cursor> and ?before=<cursor>, so that each page is found through the
+index on the sort columns whatever its depth.
 """
+import base64
+import json
 from models import storage
+from flask import Blueprint
 from flask import Flask
-from flask import render_template
+from flask import abort
+from flask import request
+from flask import stream_template
+from flask import url_for
+from web_flask.conditional import conditional
+from web_flask.page_cache import cached
 
-app = Flask(__name__)
+blueprint = Blueprint("hbnb", __name__)
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(place):
+    """Return the URL-safe cursor of place in the (name, id) order."""
+    text = json.dumps([place.name, place.id])
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Return the (name, id) tuple of cursor, or abort with a 400 error.
 
+    The name is None for places without one, which are sorted first.
+    """
+    try:
+        name, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError):
+        abort(400)
+    if (name is not None and type(name) != str) or type(id) != str:
+        abort(400)
+    return (name, id)
 
-@app.route("/hbnb", strict_slashes=False)
+
+@blueprint.route("/hbnb", strict_slashes=False)
+@conditional("State", "City", "Amenity", "Place", "User",
+             "Review")
+@cached
 def hbnb():
-    """Displays the main HBnB filters HTML page."""
-    states = storage.all("State")
-    amenities = storage.all("Amenity")
-    places = storage.all("Place")
-    return render_template("100-hbnb.html",
-                           states=states, amenities=amenities, places=places)
+    """Displays the main HBnB filters HTML page.
+
+    The related objects shown for each state and place are loaded along
+    with them, so the page takes a few database queries per page of places
+    or batch of states, not per object. One more place than shown is
+    queried to know whether a next (or, going backwards, previous) page
+    exists. The page is streamed as states and amenities are iterated.
+    """
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    after = request.args.get("after")
+    before = request.args.get("before")
+    places = storage.query("Place", order_by=("name",), limit=limit + 1,
+                           after=decode_cursor(after) if after else None,
+                           before=decode_cursor(before) if before else None,
+                           load=("user", "amenities", "reviews.user"))
+    if before:
+        has_prev = len(places) > limit
+        has_next = bool(places)
+        places = places[-limit:]
+    else:
+        has_prev = bool(after)
+        has_next = len(places) > limit
+        places = places[:limit]
+    prev_url = next_url = None
+    if has_prev:
+        cursor = encode_cursor(places[0]) if places else after
+        prev_url = url_for(".hbnb", limit=limit, before=cursor)
+    if has_next:
+        next_url = url_for(".hbnb", limit=limit,
+                           after=encode_cursor(places[-1]))
+    states = storage.iterate("State", order_by=("name",), load=("cities",))
+    amenities = storage.iterate("Amenity", order_by=("name",))
+    return stream_template("100-hbnb.html",
+                           states=states, amenities=amenities, places=places,
+                           prev_url=prev_url, next_url=next_url)
+
+
+app = Flask(__name__)
+app.register_blueprint(blueprint)
 
 
 @app.teardown_appcontext
@@ -12,28 +12,24 @@ Routes:
         - Displays the value of <n> in the body.
     /number_odd_or_even/<n>: Displays an HTML page only if <n> is an integer.
         - States whether <n> is even or odd in the body.
+
+Every route but /hbnb is defined on blueprint; web_flask.factory.create_app()
+serves the HBnB page of 100-hbnb.py at /hbnb instead.
 """
+from flask import Blueprint
 from flask import Flask
 from flask import render_template
 
-app = Flask(__name__)
-app.jinja_env.trim_blocks = True
-app.jinja_env.lstrip_blocks = True
+blueprint = Blueprint("numbers", __name__)
 
 
-@app.route("/", strict_slashes=False)
+@blueprint.route("/", strict_slashes=False)
 def hello_hbnb():
     """Displays 'Hello HBNB!'"""
     return "Hello HBNB!"
 
 
-@app.route("/hbnb", strict_slashes=False)
-def hbnb():
-    """Displays 'HBNB'"""
-    return "HBNB"
-
-
-@app.route("/c/<text>", strict_slashes=False)
+@blueprint.route("/c/<text>", strict_slashes=False)
 def c(text):
     """Displays 'C' followed by the value of <text>
 
@@ -43,8 +39,8 @@ def c(text):
     return "C {}".format(text)
 
 
-@app.route("/python", strict_slashes=False)
-@app.route("/python/<text>", strict_slashes=False)
+@blueprint.route("/python", strict_slashes=False)
+@blueprint.route("/python/<text>", strict_slashes=False)
 def python(text="is cool"):
     """Displays 'Python' followed by the value of <text>
 
@@ -54,13 +50,13 @@ def python(text="is cool"):
     return "Python {}".format(text)
 
 
-@app.route("/number/<int:n>", strict_slashes=False)
+@blueprint.route("/number/<int:n>", strict_slashes=False)
 def number(n):
     """Displays 'n is a number' only if <n> is an integer."""
     return "{} is a number".format(n)
 
 
-@app.route("/number_template/<int:n>", strict_slashes=False)
+@blueprint.route("/number_template/<int:n>", strict_slashes=False)
 def number_template(n):
     """Displays an HTML page only if <n> is an integer.
 
@@ -69,7 +65,7 @@ def number_template(n):
     return render_template("5-number.html", n=n)
 
 
-@app.route("/number_odd_or_even/<int:n>", strict_slashes=False)
+@blueprint.route("/number_odd_or_even/<int:n>", strict_slashes=False)
 def number_odd_or_even(n):
     """Displays an HTML page only if <n> is an integer.
 
@@ -78,5 +74,17 @@ def number_odd_or_even(n):
     return render_template("6-number_odd_or_even.html", n=n)
 
 
+app = Flask(__name__)
+app.jinja_env.trim_blocks = True
+app.jinja_env.lstrip_blocks = True
+app.register_blueprint(blueprint)
+
+
+@app.route("/hbnb", strict_slashes=False)
+def hbnb():
+    """Displays 'HBNB'"""
+    return "HBNB"
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0")
@@ -6,22 +6,27 @@ Routes:
     /states_list: HTML page with a list of all State objects in DBStorage.
 """
 from models import storage
+from flask import Blueprint
 from flask import Flask
 from flask import render_template
 
-app = Flask(__name__)
+blueprint = Blueprint("states_list", __name__)
 
 
-@app.route("/states_list", strict_slashes=False)
+@blueprint.route("/states_list", strict_slashes=False)
 def states_list():
     """Displays an HTML page with a list of all State objects in DBStorage.
 
     States are sorted by name.
     """
-    states = storage.all("State")
+    states = storage.query("State", order_by=("name",))
     return render_template("7-states_list.html", states=states)
 
 
+app = Flask(__name__)
+app.register_blueprint(blueprint)
+
+
 @app.teardown_appcontext
 def teardown(exc):
     """Remove the current SQLAlchemy session."""
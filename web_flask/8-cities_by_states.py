@@ -6,20 +6,30 @@ Routes:
     /cities_by_states: HTML page with a list of all states and related cities.
 """
 from models import storage
+from flask import Blueprint
 from flask import Flask
-from flask import render_template
+from flask import stream_template
+from web_flask.conditional import conditional
+from web_flask.page_cache import cached
 
-app = Flask(__name__)
+blueprint = Blueprint("cities_by_states", __name__)
 
 
-@app.route("/cities_by_states", strict_slashes=False)
+@blueprint.route("/cities_by_states", strict_slashes=False)
+@conditional("State", "City")
+@cached
 def cities_by_states():
     """Displays an HTML page with a list of all states and related cities.
 
-    States/cities are sorted by name.
+    States/cities are sorted by name, and the page is streamed as states
+    are iterated from storage.
     """
-    states = storage.all("State")
-    return render_template("8-cities_by_states.html", states=states)
+    states = storage.iterate("State", order_by=("name",), load=("cities",))
+    return stream_template("8-cities_by_states.html", states=states)
+
+
+app = Flask(__name__)
+app.register_blueprint(blueprint)
 
 
 @app.teardown_appcontext
@@ -7,31 +7,43 @@ Routes:
     /states/<id>: HTML page displaying the given state with <id>.
 """
 from models import storage
+from flask import Blueprint
 from flask import Flask
 from flask import render_template
+from flask import stream_template
+from web_flask.conditional import conditional
+from web_flask.page_cache import cached
 
-app = Flask(__name__)
+blueprint = Blueprint("states", __name__)
 
 
-@app.route("/states", strict_slashes=False)
+@blueprint.route("/states", strict_slashes=False)
+@conditional("State")
+@cached
 def states():
     """Displays an HTML page with a list of all States.
 
-    States are sorted by name.
+    States are sorted by name, and the page is streamed as they are
+    iterated from storage.
     """
-    states = storage.all("State")
-    return render_template("9-states.html", state=states)
+    states = storage.iterate("State", order_by=("name",))
+    return stream_template("9-states.html", states=states)
 
 
-@app.route("/states/<id>", strict_slashes=False)
+@blueprint.route("/states/<id>", strict_slashes=False)
+@conditional("State", "City")
 def states_id(id):
     """Displays an HTML page with info about <id>, if it exists."""
-    for state in storage.all("State").values():
-        if state.id == id:
-            return render_template("9-states.html", state=state)
+    state = storage.get("State", id)
+    if state is not None:
+        return render_template("9-states.html", state=state)
     return render_template("9-states.html")
 
 
+app = Flask(__name__)
+app.register_blueprint(blueprint)
+
+
 @app.teardown_appcontext
 def teardown(exc):
     """Remove the current SQLAlchemy session."""
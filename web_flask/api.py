@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+"""Starts a Flask web application serving the HBnB objects as JSON.
+
+The application listens on 0.0.0.0, port 5000.
+Routes:
+    /api/v1/<collection>: The objects of a collection, by pages.
+    /api/v1/<collection>/<id>: The object of a collection with <id>.
+
+The collections are states, cities, places, amenities and reviews. Lists
+are sorted by id, ?limit= objects at a time (PAGE_SIZE by default, at most
+MAX_PAGE_SIZE), in a {"data": [...], "next": <url>} object whose next URL
+carries ?after=<id of the last object>, so each page is sought through the
+primary key. Other arguments naming a column filter the objects on it, as
+in /api/v1/cities?state_id=<id>.
+
+Objects are returned whole, as to_dict() gives them, unless ?fields= lists
+the columns to return, as in ?fields=id,name; those are then read with
+storage.project(), which only selects them from the database.
+Responses are encoded with orjson if it is installed.
+"""
+import json
+from datetime import datetime
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from flask import Blueprint
+from flask import Flask
+from flask import Response
+from flask import abort
+from flask import request
+from flask import url_for
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
+collections = {"states": State, "cities": City, "places": Place,
+               "amenities": Amenity, "reviews": Review}
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def default(value):
+    """Return the JSON value of value, which json cannot encode itself."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError("{} is not JSON serializable".format(type(value)))
+
+
+def encode(value):
+    """Return the compact UTF-8 JSON encoding of value."""
+    if orjson is not None:
+        return orjson.dumps(value, default=default)
+    return json.dumps(value, separators=(",", ":"),
+                      default=default).encode("utf-8")
+
+
+def respond(value, status=200):
+    """Return a JSON response of value."""
+    return Response(encode(value), status=status,
+                    content_type="application/json")
+
+
+def columns_of(collection):
+    """Return the class and columns of collection, or abort with 404."""
+    if collection not in collections:
+        abort(404)
+    cls = collections[collection]
+    return cls, cls.__table__.columns
+
+
+def parse_fields(columns):
+    """Return the tuple of ?fields=, or None; abort with 400 if unknown."""
+    fields = request.args.get("fields")
+    if fields is None:
+        return None
+    fields = tuple(f for f in fields.split(",") if f)
+    if not fields or any(f not in columns for f in fields):
+        abort(400)
+    return fields
+
+
+def parse_filters(columns):
+    """Return the column = value pairs of the filtering arguments."""
+    filters = {}
+    for key, value in request.args.items():
+        if key in ("fields", "limit", "after"):
+            continue
+        if key not in columns:
+            abort(400)
+        kind = columns[key].type.python_type
+        if kind in (int, float):
+            try:
+                value = kind(value)
+            except ValueError:
+                abort(400)
+        filters[key] = value
+    return filters
+
+
+@blueprint.route("/<collection>", strict_slashes=False)
+def objects(collection):
+    """Returns a page of the objects of collection.
+
+    One more object than returned is queried to know whether a next page
+    exists.
+    """
+    cls, columns = columns_of(collection)
+    fields = parse_fields(columns)
+    filters = parse_filters(columns)
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    after = request.args.get("after")
+    after = (after,) if after else None
+    if fields is None:
+        objs = storage.query(cls, filters, limit=limit + 1, after=after)
+        data = [obj.to_dict() for obj in objs[:limit]]
+        last = objs[limit - 1].id if len(objs) > limit else None
+    else:
+        queried = fields if "id" in fields else fields + ("id",)
+        data = storage.project(cls, queried, filters, limit=limit + 1,
+                               after=after)
+        last = data[limit - 1]["id"] if len(data) > limit else None
+        data = data[:limit]
+        if queried != fields:
+            for values in data:
+                del values["id"]
+    next_url = None
+    if last is not None:
+        args = request.args.to_dict()
+        args["after"] = last
+        next_url = url_for(".objects", collection=collection, **args)
+    return respond({"data": data, "next": next_url})
+
+
+@blueprint.route("/<collection>/<id>", strict_slashes=False)
+def object_id(collection, id):
+    """Returns the object of collection with <id>, if it exists."""
+    cls, columns = columns_of(collection)
+    fields = parse_fields(columns)
+    if fields is None:
+        obj = storage.get(cls, id)
+        if obj is None:
+            abort(404)
+        return respond(obj.to_dict())
+    data = storage.project(cls, fields, {"id": id}, limit=1)
+    if not data:
+        abort(404)
+    return respond(data[0])
+
+
+@blueprint.errorhandler(400)
+@blueprint.errorhandler(404)
+def error(exc):
+    """Returns the error of a request as JSON."""
+    return respond({"error": exc.name}, exc.code)
+
+
+app = Flask(__name__)
+app.register_blueprint(blueprint)
+
+
+@app.teardown_appcontext
+def teardown(exc):
+    """Remove the current SQLAlchemy session."""
+    storage.close()
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0")
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Defines conditional responses for the web_flask applications.
+
+A page is validated by the storage.stamp() of the classes it shows: the
+number of their objects and their latest updated_at. The ETag is a hash
+of the stamps and Last-Modified is the latest updated_at, so requests
+carrying a matching If-None-Match, or an If-Modified-Since not older than
+the latest update, are answered with 304 Not Modified before the view
+queries storage or renders anything. Pages are sent with
+'Cache-Control: no-cache' so that clients revalidate them every time.
+
+The ETag is kept in g.etag for the view, so that page_cache.py does not
+serve a page rendered before it changed.
+
+If-None-Match takes precedence over If-Modified-Since; on its own, the
+latter cannot tell that an object was deleted.
+"""
+import hashlib
+from functools import wraps
+from flask import Response
+from flask import g
+from flask import make_response
+from flask import request
+from models import storage
+from werkzeug.http import is_resource_modified
+
+
+def validators(classes):
+    """Return the ETag and Last-Modified date of the objects of classes."""
+    stamps = [storage.stamp(cls) for cls in classes]
+    text = repr([(count, str(latest)) for count, latest in stamps])
+    etag = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    dates = [latest for count, latest in stamps if latest is not None]
+    return (etag, max(dates) if dates else None)
+
+
+def conditional(*classes):
+    """Return a decorator answering conditional requests of a view.
+
+    Args:
+        *classes (str): The names of the classes the view shows.
+    """
+    def decorator(view):
+        """Return view, answering unchanged pages with 304."""
+        @wraps(view)
+        def conditional_view(*args, **kwargs):
+            """Return 304 if the page is unchanged, or render it."""
+            etag, last_modified = validators(classes)
+            g.etag = etag
+            if is_resource_modified(request.environ, etag=etag,
+                                    last_modified=last_modified):
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            else:
+                response = Response(status=304)
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.no_cache = True
+            return response
+        return conditional_view
+    return decorator
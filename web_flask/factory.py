@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""Defines the factory of the combined HBnB web application.
+
+Each web_flask/N-*.py module defines its routes on a blueprint, and also
+registers it in a Flask app of its own to be run alone. create_app()
+registers the blueprints of several modules in a single application, so
+that one process imports models, loads storage and fills the page cache
+once for every route.
+
+To serve it under a multi-worker WSGI server:
+
+    $ gunicorn --workers 4 --preload 'web_flask.factory:create_app()'
+
+Storage is loaded before the workers fork; FileStorage and DBStorage
+reset the locks, writer threads and pooled connections each worker
+inherits.
+"""
+from importlib import import_module
+from flask import Flask
+from models import storage
+
+blueprints = ("6-number_odd_or_even", "7-states_list", "8-cities_by_states",
+              "9-states", "10-hbnb_filters", "100-hbnb", "api")
+
+
+def teardown(exc):
+    """Remove the current SQLAlchemy session."""
+    storage.close()
+
+
+def create_app(names=blueprints):
+    """Return a Flask application serving the routes of names.
+
+    Args:
+        names (tuple): The names of the web_flask modules whose
+            blueprints are registered, in order.
+    """
+    app = Flask(__name__)
+    app.jinja_env.trim_blocks = True
+    app.jinja_env.lstrip_blocks = True
+    for name in names:
+        app.register_blueprint(import_module("web_flask." + name).blueprint)
+    app.teardown_appcontext(teardown)
+    return app
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Defines a cache of rendered pages for the web_flask applications.
+
+Pages are cached by path and query string in an LRU cache of
+'HBNB_PAGE_CACHE_SIZE' pages (128 by default) kept for at most
+'HBNB_PAGE_CACHE_TTL' seconds (60 by default). Each page is tagged with
+storage.version() when it started rendering and is only served while the
+version is unchanged, so saves and deletions in this process invalidate it
+at once. Under conditional(), each page is also tagged with the ETag of the
+request, g.etag, and only served while it is unchanged, so that changes
+made by other processes, which only the ETag sees, are not served from a
+stale page; other pages see them once they expire. Pages larger than
+'HBNB_PAGE_CACHE_MAX_BYTES' (1 MiB by default) are not kept.
+"""
+from functools import wraps
+from os import getenv
+from flask import Response
+from flask import g
+from flask import make_response
+from flask import request
+from models import storage
+from models.engine.object_cache import ObjectCache
+
+pages = ObjectCache(int(getenv("HBNB_PAGE_CACHE_SIZE", "128")),
+                    float(getenv("HBNB_PAGE_CACHE_TTL", "60")))
+max_bytes = int(getenv("HBNB_PAGE_CACHE_MAX_BYTES", str(2 ** 20)))
+
+
+def keep(key, validator, content_type, chunks):
+    """Yield the chunks of a page being sent, then cache the page."""
+    body = []
+    size = 0
+    for chunk in chunks:
+        if body is not None:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            body.append(data)
+            size += len(data)
+            if size > max_bytes:
+                body = None
+        yield chunk
+    if body is not None:
+        pages.put(key, (validator, content_type, b"".join(body)))
+
+
+def cached(view):
+    """Return view, answering from the page cache when possible.
+
+    Hits are answered without querying storage or rendering templates.
+    Misses are sent as the view returns them, streamed or not, and their
+    successful responses cached.
+    """
+    @wraps(view)
+    def cached_view(*args, **kwargs):
+        """Return the cached page of the request, or render it."""
+        key = (request.path, request.query_string)
+        validator = (storage.version(), g.get("etag"))
+        entry = pages.get(key)
+        if entry is not None and entry[0] == validator:
+            return Response(entry[2], content_type=entry[1])
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200:
+            return response
+        if response.is_streamed:
+            response.response = keep(key, validator, response.content_type,
+                                     response.response)
+        else:
+            data = response.get_data()
+            if len(data) <= max_bytes:
+                pages.put(key, (validator, response.content_type, data))
+        return response
+    return cached_view
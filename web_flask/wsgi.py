@@ -0,0 +1,14 @@
+#!/usr/bin/python3
+"""Starts the combined HBnB web application.
+
+The application listens on 0.0.0.0, port 5000, and serves the routes of
+the modules of web_flask.factory.blueprints. WSGI servers can load it as
+web_flask.wsgi:app.
+"""
+from web_flask.factory import create_app
+
+app = create_app()
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0")